@@ -0,0 +1,75 @@
+# File: backend/benchmarks/bench_category_tier.py
+#
+# Offline evaluation of the fast category tier against labels already stored by MNLI.
+# Trains on one part of the articles, then for each threshold reports how many held-out
+# articles would skip MNLI and how often the tier agrees with the stored categories.
+#
+#   python benchmarks/bench_category_tier.py                  # articles from MONGO_URI
+#   python benchmarks/bench_category_tier.py --jsonl dump.jsonl  # {"title","summary","categories"} per line
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+sys.path.append(backend_dir)
+
+from services.category_tier import CentroidClassifier
+
+THRESHOLDS = [0.5, 0.6, 0.7, 0.8, 0.85, 0.9, 0.95]
+
+
+def load_articles(args):
+    if args.jsonl:
+        with open(args.jsonl, encoding="utf-8") as f:
+            docs = [json.loads(line) for line in f if line.strip()]
+    else:
+        from services.rss_fetcher import get_collection
+        docs = list(get_collection()
+                    .find({"categories.0": {"$exists": True}}, {"title": 1, "summary": 1, "categories": 1})
+                    .limit(args.limit))
+    texts = [f"{doc.get('title', '')}. {doc.get('summary', '')}" for doc in docs]
+    return texts, [doc.get("categories", []) for doc in docs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Coverage/agreement sweep for the fast category tier.")
+    parser.add_argument("--jsonl", help="read articles from a JSON-lines dump instead of MongoDB")
+    parser.add_argument("--limit", type=int, default=50000)
+    parser.add_argument("--test-fraction", type=float, default=0.2)
+    args = parser.parse_args()
+
+    from services.rss_fetcher import TARGET_CATEGORIES
+
+    texts, labels = load_articles(args)
+    order = list(range(len(texts)))
+    random.Random(0).shuffle(order)
+    cut = int(len(order) * (1 - args.test_fraction))
+    train, test = order[:cut], order[cut:]
+    if not test:
+        sys.exit("Not enough labelled articles to evaluate.")
+
+    tier = CentroidClassifier.train(TARGET_CATEGORIES, [texts[i] for i in train], [labels[i] for i in train])
+    test_texts = [texts[i] for i in test]
+
+    start = time.perf_counter()
+    predictions = tier.predict(test_texts, threshold=0.0)
+    elapsed = time.perf_counter() - start
+    print(f"trained on {len(train)}, evaluated on {len(test)}; "
+          f"tier throughput {len(test) / elapsed:,.0f} articles/sec")
+    print(f"{'threshold':>9} {'skip MNLI':>10} {'agreement':>10}")
+    for threshold in THRESHOLDS:
+        confident = [(label, labels[test[i]]) for i, (label, confidence) in enumerate(predictions)
+                     if confidence >= threshold]
+        agreed = sum(1 for label, expected in confident if label in expected)
+        coverage = 100.0 * len(confident) / len(test)
+        agreement = 100.0 * agreed / len(confident) if confident else 0.0
+        print(f"{threshold:>9.2f} {coverage:>9.1f}% {agreement:>9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# File: backend/benchmarks/bench_classify_batch.py
+#
+# Checks that batched zero-shot classification (classify_articles) gives the same scores and
+# categories as the per-article pipeline path (classify_article), then compares throughput.
+#
+#   python benchmarks/bench_classify_batch.py --model typeform/distilbert-base-uncased-mnli --articles 32
+
+import os
+import sys
+import time
+import argparse
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+sys.path.append(backend_dir)
+
+from benchmarks.bench_summarize_batch import synthetic_articles
+
+# Scores are compared after softmax; batching only changes padding, so differences are float noise.
+TOLERANCE = 1e-3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Equivalence check and CPU benchmark for batched classification.")
+    parser.add_argument("--model", default=None, help="NLI checkpoint name or local path (sets CLASSIFIER_MODEL)")
+    parser.add_argument("--articles", type=int, default=32)
+    parser.add_argument("--batch-size", type=int, default=None, help="pairs per forward pass (CLASSIFY_BATCH_SIZE)")
+    args = parser.parse_args()
+
+    if args.model:
+        os.environ["CLASSIFIER_MODEL"] = args.model
+    if args.batch_size:
+        os.environ["CLASSIFY_BATCH_SIZE"] = str(args.batch_size)
+    from services.rss_fetcher import classify_article, classify_articles, categories_from_scores
+
+    texts = [f"Headline {i}. {text}" for i, text in enumerate(synthetic_articles(args.articles, seed=7))]
+    classify_articles(texts[:1])  # warm-up / model load
+
+    start = time.perf_counter()
+    single = [classify_article(text) for text in texts]
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = classify_articles(texts)
+    batched_time = time.perf_counter() - start
+
+    worst = 0.0
+    label_mismatches = 0
+    for expected, actual in zip(single, batched):
+        assert set(expected) == set(actual), "label sets differ"
+        worst = max(worst, max(abs(expected[label] - actual[label]) for label in expected))
+        if sorted(categories_from_scores(expected)) != sorted(categories_from_scores(actual)):
+            label_mismatches += 1
+
+    print(f"max |score difference|   {worst:.2e} (tolerance {TOLERANCE:.0e})")
+    print(f"category mismatches      {label_mismatches}/{len(texts)}")
+    print(f"per-article pipeline     {single_time:7.2f}s  {len(texts) / single_time:7.2f} articles/sec")
+    print(f"classify_articles        {batched_time:7.2f}s  {len(texts) / batched_time:7.2f} articles/sec")
+    print(f"speedup                  {single_time / batched_time:.1f}x")
+    if worst > TOLERANCE or label_mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# File: backend/benchmarks/bench_feed_download.py
+#
+# Compares the old one-feed-at-a-time download loop with the concurrent download stage,
+# against a local HTTP server serving canned XML with simulated per-feed latency.
+#
+#   python benchmarks/bench_feed_download.py --feeds 70 --delay 0.2 --slow 2
+
+import os
+import sys
+import time
+import argparse
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+sys.path.append(backend_dir)
+
+from benchmarks.local_feed_server import FeedServer, sample_feed
+from services.feed_downloader import download_feed, download_feeds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sequential vs concurrent feed download.")
+    parser.add_argument("--feeds", type=int, default=70, help="number of canned feeds to serve")
+    parser.add_argument("--delay", type=float, default=0.2, help="latency added to every feed (seconds)")
+    parser.add_argument("--slow", type=int, default=2, help="number of feeds that hang past the timeout")
+    parser.add_argument("--timeout", type=float, default=3.0, help="per-feed timeout (seconds)")
+    parser.add_argument("--max-connections", type=int, default=16)
+    parser.add_argument("--per-host", type=int, default=4)
+    args = parser.parse_args()
+
+    routes = {f"/feed-{n}.xml": sample_feed(f"Feed {n}") for n in range(args.feeds)}
+    delays = {path: args.delay for path in routes}
+    for n in range(min(args.slow, args.feeds)):
+        delays[f"/feed-{n}.xml"] = args.timeout + 2
+
+    with FeedServer(routes, delays) as server:
+        feeds = {f"Feed {n}": server.url(f"/feed-{n}.xml") for n in range(args.feeds)}
+
+        start = time.perf_counter()
+        sequential = [download_feed(source, url, timeout=args.timeout) for source, url in feeds.items()]
+        sequential_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        first_ready = None
+        concurrent = []
+        for download in download_feeds(feeds, max_connections=args.max_connections,
+                                       per_host=args.per_host, timeout=args.timeout):
+            if first_ready is None:
+                first_ready = time.perf_counter() - start
+            concurrent.append(download)
+        concurrent_time = time.perf_counter() - start
+
+    print(f"sequential: {sequential_time:.2f}s, {sum(d.ok for d in sequential)}/{len(feeds)} ok")
+    print(f"concurrent: {concurrent_time:.2f}s, {sum(d.ok for d in concurrent)}/{len(feeds)} ok, "
+          f"first feed ready after {first_ready:.2f}s")
+    print(f"speedup: {sequential_time / concurrent_time:.1f}x")
+    print("per-feed download time (slowest first):")
+    for download in sorted(concurrent, key=lambda d: d.elapsed, reverse=True)[:10]:
+        print(f"  {download.source:<10} {download.elapsed:6.2f}s  {download.error or download.status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+# File: backend/benchmarks/bench_html_extract.py
+#
+# Per-entry HTML work before and after the single-pass extractor (services/html_extract.py),
+# plus a parity check: the image chosen for every entry must be exactly the one the old
+# BeautifulSoup strategy order picked. Exits non-zero on any mismatch.
+#
+#   python benchmarks/bench_html_extract.py                       # built-in corpus
+#   python benchmarks/bench_html_extract.py --record entries.jsonl  # save entries from RSS_FEEDS
+#   python benchmarks/bench_html_extract.py --corpus entries.jsonl
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+
+import feedparser
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+sys.path.append(backend_dir)
+
+from benchmarks.local_feed_server import sample_feed
+from services.html_extract import EntryHtml
+from services.rss_fetcher import extract_image_url, sanitize_url
+
+# Markup the old parser handled in ways that are easy to get wrong.
+EDGE_CASES = [
+    {"summary": '<p>No image here &amp; an entity.</p>'},
+    {"summary": '<img alt="no src"><img src="http://example.com/second.jpg">'},
+    {"summary": '<IMG SRC="http://example.com/upper.jpg">'},
+    {"summary": '<img src="http://example.com/a.jpg" src="http://example.com/b.jpg">'},
+    {"summary": '<img src>'},
+    {"summary": '<img src="/relative.jpg"><p>relative src is rejected by sanitize_url</p>'},
+    {"summary": '<img src="http://example.com/a.jpg?x=1&amp;y=2"/>'},
+    {"summary": '<!-- <img src="http://example.com/commented.jpg"> --><img src="http://example.com/real.jpg">'},
+    {"summary": '<script>var s = "<img src=http://example.com/script.jpg>";</script>text'},
+    {"summary": '<p>Broken <b>markup <img src="http://example.com/broken.jpg"'},
+    {"summary": 'a < b and c > d, no tags'},
+    {"summary": '<noscript><img src="http://example.com/noscript.jpg"></noscript>'},
+    {"content": [{"value": '<img src="data:image/gif;base64,R0lGOD">'}],
+     "summary": '<img src="http://example.com/summary.jpg">'},
+    {"content": [{"value": '<div><img src="https://example.com/content.jpg"></div>'}],
+     "summary": '<img src="http://example.com/summary.jpg">'},
+    {"content": ["<img src='http://example.com/plain-list.jpg'>"], "summary": ""},
+    {"media_thumbnail": [{"url": "http://example.com/thumb.jpg"}],
+     "summary": '<img src="http://example.com/summary.jpg">'},
+]
+
+
+# -------------------- THE OLD PATH -------------------- #
+def legacy_html_image(entry):
+    """Strategies 4 and 5 as they were: one BeautifulSoup tree per field."""
+    from bs4 import BeautifulSoup
+
+    for field in (entry.get("content:encoded") or entry.get("content"), entry.get("summary")):
+        if not field:
+            continue
+        if isinstance(field, list):
+            if all(isinstance(item, dict) for item in field):
+                field = " ".join(item.get("value", "") for item in field)
+            else:
+                field = " ".join(str(item) for item in field)
+        try:
+            img_tag = BeautifulSoup(field, "html.parser").find("img")
+            if img_tag and img_tag.get("src"):
+                sanitized = sanitize_url(img_tag.get("src"))
+                if sanitized:
+                    return sanitized
+        except Exception:
+            pass
+    return None
+
+
+def legacy_image(entry):
+    """The full old strategy order: media_content, media_thumbnail, image, content, summary."""
+    for key in ("media_content", "media_thumbnail"):
+        value = entry.get(key)
+        if value and isinstance(value, list) and value[0].get("url"):
+            sanitized = sanitize_url(value[0]["url"])
+            if sanitized:
+                return sanitized
+    image_field = entry.get("image")
+    url = image_field.get("url") if isinstance(image_field, dict) else image_field if isinstance(image_field, str) else None
+    sanitized = sanitize_url(url) if url else None
+    if sanitized:
+        return sanitized
+    return legacy_html_image(entry)
+
+
+def legacy_entry(entry):
+    """Old per-entry HTML work: image trees, keywords over the raw summary, regex cleaning."""
+    image = legacy_image(entry)
+    summary = entry.get("summary", "")
+    words = re.findall(r"\b[a-zA-Z]{4,}\b", summary.lower())
+    text = re.sub(r"<[^>]*>", "", summary)
+    return image, words, text
+
+
+def single_pass_entry(entry):
+    parsed_html = EntryHtml(entry)
+    image = extract_image_url(entry, parsed_html)
+    words = [word for word in parsed_html.summary.tokens if len(word) >= 4]
+    return image, words, parsed_html.summary.text
+
+
+# -------------------- CORPUS -------------------- #
+def builtin_corpus(copies=50):
+    parsed = feedparser.parse(sample_feed("Bench Feed", entries=40))
+    entries = [dict(entry) for entry in parsed.entries] + EDGE_CASES
+    return entries * copies
+
+
+def load_corpus(path):
+    with open(path, encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def record_corpus(path):
+    """Download RSS_FEEDS once and save every entry (as plain JSON) for later runs."""
+    from services.feed_downloader import download_feeds
+    from services.rss_fetcher import RSS_FEEDS
+
+    count = 0
+    with open(path, "w", encoding="utf-8") as handle:
+        for download in download_feeds(RSS_FEEDS):
+            if not download.ok:
+                continue
+            for entry in feedparser.parse(download.body).entries:
+                handle.write(json.dumps(entry, default=str) + "\n")
+                count += 1
+    print(f"💾 Saved {count} entries to {path}")
+
+
+def timed(func, entries, repeat):
+    best = float("inf")
+    results = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [func(entry) for entry in entries]
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark single-pass HTML extraction against the bs4 path.")
+    parser.add_argument("--corpus", default=None, help="JSONL of saved feed entries (default: built-in corpus)")
+    parser.add_argument("--record", default=None, help="download RSS_FEEDS and save their entries to this JSONL")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.record:
+        record_corpus(args.record)
+        return
+
+    entries = load_corpus(args.corpus) if args.corpus else builtin_corpus()
+    old_seconds, old_results = timed(legacy_entry, entries, args.repeat)
+    new_seconds, new_results = timed(single_pass_entry, entries, args.repeat)
+
+    mismatches = [(entry, old[0], new[0]) for entry, old, new in zip(entries, old_results, new_results) if old[0] != new[0]]
+    print(f"{len(entries)} entries")
+    print(f"bs4 + regex : {old_seconds:.3f}s ({1e6 * old_seconds / len(entries):.1f} µs/entry)")
+    print(f"single pass : {new_seconds:.3f}s ({1e6 * new_seconds / len(entries):.1f} µs/entry)")
+    print(f"speedup     : {old_seconds / new_seconds:.1f}x" if new_seconds else "speedup     : n/a")
+    print(f"image parity: {len(entries) - len(mismatches)}/{len(entries)}")
+    for entry, old, new in mismatches[:10]:
+        print(f"  ❌ old={old!r} new={new!r} summary={str(entry.get('summary', ''))[:80]!r}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
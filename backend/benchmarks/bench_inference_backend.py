@@ -0,0 +1,188 @@
+# File: backend/benchmarks/bench_inference_backend.py
+#
+# Compares the inference backends (services/inference_backend.py) against fp32 torch:
+# quality (ROUGE-L of each backend's summaries against the torch summaries, agreement of
+# the assigned categories) and cost (model load time, summarize/classify latency, peak
+# RSS). Each backend runs in a fresh process so memory figures do not mix. Exits 1 when a
+# backend falls below --min-rouge or --min-agreement.
+#
+# Runs offline against local checkpoints (HF_HUB_OFFLINE=1 with the models already on disk):
+#
+#   python benchmarks/bench_inference_backend.py --summarizer-model ./models/distilbart-cnn-12-6 \
+#       --classifier-model ./models/distilbart-mnli-12-1 --backends torch,int8,onnx
+
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import tempfile
+import subprocess
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+sys.path.append(backend_dir)
+
+from benchmarks.bench_summarize_batch import synthetic_articles
+
+
+# -------------------- QUALITY -------------------- #
+def _lcs_length(a, b):
+    """Length of the longest common subsequence of two token lists (O(len(a) * len(b)))."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = [0] * (len(b) + 1)
+    for token in a:
+        current = [0]
+        for j, other in enumerate(b):
+            current.append(previous[j] + 1 if token == other else max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+
+def rouge_l(candidate, reference):
+    """ROUGE-L F1 between two texts, on lowercased whitespace tokens."""
+    candidate, reference = candidate.lower().split(), reference.lower().split()
+    if not candidate or not reference:
+        return 1.0 if candidate == reference else 0.0
+    lcs = _lcs_length(candidate, reference)
+    if lcs == 0:
+        return 0.0
+    precision, recall = lcs / len(candidate), lcs / len(reference)
+    return 2 * precision * recall / (precision + recall)
+
+
+def load_texts(args):
+    if args.jsonl:
+        texts = []
+        with open(args.jsonl, encoding="utf-8") as handle:
+            for line in handle:
+                record = json.loads(line)
+                text = record.get("content") or record.get("text") or record.get("summary")
+                if text:
+                    texts.append(text)
+        return texts[:args.articles]
+    return [f"Headline {i}. {text}" for i, text in enumerate(synthetic_articles(args.articles, seed=11))]
+
+
+# -------------------- ONE BACKEND (child process) -------------------- #
+def run_one(backend, args):
+    from services import model_registry
+    from services.summarization.summarizer import summarize_batch
+    from services.rss_fetcher import classify_articles, categories_from_scores
+
+    texts = load_texts(args)
+
+    start = time.perf_counter()
+    model_registry.preload("summarizer", "classifier")
+    load_seconds = time.perf_counter() - start
+
+    # Warm-up on texts outside the measured set (first-call allocations, ONNX session setup).
+    warm_up = synthetic_articles(2, seed=99)
+    summarize_batch(warm_up)
+    classify_articles(warm_up)
+
+    start = time.perf_counter()
+    summaries = summarize_batch(texts, batch_size=args.batch_size)
+    summarize_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scores = classify_articles(texts)
+    classify_seconds = time.perf_counter() - start
+
+    print(json.dumps({
+        "backend": backend,
+        "articles": len(texts),
+        "load_seconds": round(load_seconds, 2),
+        "summarize_seconds": round(summarize_seconds, 3),
+        "classify_seconds": round(classify_seconds, 3),
+        # ru_maxrss is in KB on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "summaries": summaries,
+        "categories": [sorted(categories_from_scores(s)) for s in scores],
+        "top_labels": [max(s, key=s.get) if s else None for s in scores],
+    }))
+
+
+# -------------------- COMPARISON -------------------- #
+def compare(reference, result):
+    pairs = list(zip(result["summaries"], reference["summaries"]))
+    rouge = sum(rouge_l(c, r) for c, r in pairs) / len(pairs) if pairs else 1.0
+    n = len(reference["categories"]) or 1
+    category_agreement = sum(a == b for a, b in zip(result["categories"], reference["categories"])) / n
+    top_agreement = sum(a == b for a, b in zip(result["top_labels"], reference["top_labels"])) / n
+    return rouge, category_agreement, top_agreement
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quality and latency of quantized/ONNX inference vs fp32 torch.")
+    parser.add_argument("--summarizer-model", default=None, help="checkpoint name or local path (sets SUMMARIZER_MODEL)")
+    parser.add_argument("--classifier-model", default=None, help="NLI checkpoint name or local path (sets CLASSIFIER_MODEL)")
+    parser.add_argument("--backends", default="torch,int8,onnx", help="comma-separated; torch is always the reference")
+    parser.add_argument("--articles", type=int, default=32)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--jsonl", default=None, help="articles to use instead of synthetic text (content/text field)")
+    parser.add_argument("--min-rouge", type=float, default=0.8, help="lowest acceptable mean ROUGE-L vs torch")
+    parser.add_argument("--min-agreement", type=float, default=0.9, help="lowest acceptable category agreement vs torch")
+    parser.add_argument("--run", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run is not None:
+        run_one(args.run, args)
+        return
+
+    backends = ["torch"] + [b for b in (s.strip() for s in args.backends.split(",")) if b and b != "torch"]
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        for backend in backends:
+            env = dict(os.environ)
+            env.update({
+                "INFERENCE_BACKEND": backend,
+                "INFERENCE_WORKERS": "1",
+                "SUMMARY_BATCH_SIZE": str(args.batch_size),
+                # A fresh summary cache per run, so no summary is served from an earlier run.
+                "SUMMARY_CACHE_PATH": os.path.join(work_dir, f"summaries-{backend}.sqlite3"),
+            })
+            env.pop("SUMMARIZER_BACKEND", None)
+            env.pop("CLASSIFIER_BACKEND", None)
+            if args.summarizer_model:
+                env["SUMMARIZER_MODEL"] = args.summarizer_model
+            if args.classifier_model:
+                env["CLASSIFIER_MODEL"] = args.classifier_model
+            command = [sys.executable, os.path.abspath(__file__), "--run", backend,
+                       "--articles", str(args.articles), "--batch-size", str(args.batch_size)]
+            if args.jsonl:
+                command += ["--jsonl", args.jsonl]
+            output = subprocess.run(command, env=env, capture_output=True, text=True)
+            if output.returncode != 0:
+                print(f"❌ {backend} failed:\n{output.stderr[-2000:]}", file=sys.stderr)
+                continue
+            results[backend] = json.loads(output.stdout.strip().splitlines()[-1])
+
+    reference = results.get("torch")
+    if reference is None:
+        print("❌ The torch reference run failed; nothing to compare against", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"{'backend':<8} {'load s':>7} {'summ ms/art':>12} {'clf ms/art':>11} {'peak RSS MB':>12} "
+          f"{'ROUGE-L':>8} {'categories':>11} {'top-1':>6}")
+    failed = []
+    for backend, result in results.items():
+        rouge, category_agreement, top_agreement = compare(reference, result)
+        articles = result["articles"] or 1
+        print(f"{backend:<8} {result['load_seconds']:>7.2f} "
+              f"{result['summarize_seconds'] / articles * 1000:>12.1f} "
+              f"{result['classify_seconds'] / articles * 1000:>11.1f} {result['peak_rss_mb']:>12.1f} "
+              f"{rouge:>8.3f} {category_agreement:>11.1%} {top_agreement:>6.1%}")
+        if rouge < args.min_rouge or category_agreement < args.min_agreement:
+            failed.append(backend)
+    if failed:
+        print(f"❌ Below quality thresholds: {', '.join(failed)}", file=sys.stderr)
+        sys.exit(1)
+    if len(results) < len(backends):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
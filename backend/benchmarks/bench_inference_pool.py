@@ -0,0 +1,126 @@
+# File: backend/benchmarks/bench_inference_pool.py
+#
+# Scaling of the summarization process pool: articles/sec and memory as the worker count
+# grows. Every worker count runs in a fresh process (the pool must fork before any
+# inference has happened). Memory is reported as RSS summed over the parent and its
+# workers (counts shared weight pages once per process) and as PSS (shared pages split
+# between the processes that map them, i.e. what the box actually pays).
+#
+#   python benchmarks/bench_inference_pool.py --model sshleifer/distilbart-xsum-1-1 --workers 1,2,4,8
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+import multiprocessing
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+sys.path.append(backend_dir)
+
+
+def _smaps_rollup(pid, field):
+    """A field (in MB) from /proc/<pid>/smaps_rollup, or None where it is unavailable."""
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as handle:
+            for line in handle:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+def memory_mb(pids):
+    rss = [_smaps_rollup(pid, "Rss") for pid in pids]
+    pss = [_smaps_rollup(pid, "Pss") for pid in pids]
+    return (round(sum(rss), 1) if None not in rss else None,
+            round(sum(pss), 1) if None not in pss else None)
+
+
+def run_one(workers, articles, batch_size):
+    """Summarize `articles` synthetic texts with `workers` processes; print one JSON line."""
+    from benchmarks.bench_summarize_batch import synthetic_articles
+    from services import model_registry
+    from services.inference_pool import InferencePool
+    from services.summarization.summarizer import summarize_batch
+
+    texts = synthetic_articles(articles, seed=workers)
+    load_start = time.perf_counter()
+    if workers > 1:
+        pool = InferencePool(workers=workers, models=("summarizer",))
+        summarize = pool.summarize_batch
+    else:
+        model_registry.preload("summarizer")
+        pool, summarize = None, lambda batch: summarize_batch(batch, batch_size=batch_size)
+    load_seconds = time.perf_counter() - load_start
+
+    summarize(texts[:workers * 2])  # warm-up: every worker runs generate() once
+    start = time.perf_counter()
+    summaries = summarize(texts)
+    seconds = time.perf_counter() - start
+
+    pids = [os.getpid()] + [child.pid for child in multiprocessing.active_children()]
+    rss, pss = memory_mb(pids)
+    if pool is not None:
+        pool.close()
+    print(json.dumps({
+        "workers": workers,
+        "articles": len(summaries),
+        "seconds": round(seconds, 2),
+        "articles_per_second": round(len(summaries) / seconds, 2) if seconds else 0.0,
+        "load_seconds": round(load_seconds, 2),
+        "rss_mb": rss,
+        "pss_mb": pss,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the inference process pool.")
+    parser.add_argument("--model", default=None, help="checkpoint name or local path (sets SUMMARIZER_MODEL)")
+    parser.add_argument("--workers", default="1,2,4,8", help="comma-separated worker counts; 1 = in-process")
+    parser.add_argument("--articles", type=int, default=64)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--threads", type=int, default=0, help="torch threads per worker (sets TORCH_THREADS_PER_WORKER)")
+    parser.add_argument("--run", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run is not None:
+        run_one(args.run, args.articles, args.batch_size)
+        return
+
+    results = []
+    for workers in [int(n) for n in args.workers.split(",") if n.strip()]:
+        env = dict(os.environ)
+        if args.model:
+            env["SUMMARIZER_MODEL"] = args.model
+        env["TORCH_THREADS_PER_WORKER"] = str(args.threads)
+        env["SUMMARY_BATCH_SIZE"] = str(args.batch_size)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # A fresh summary cache per run, so no run is served from another's results.
+            env["SUMMARY_CACHE_PATH"] = os.path.join(cache_dir, "summaries.sqlite3")
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--run", str(workers),
+                 "--articles", str(args.articles), "--batch-size", str(args.batch_size)],
+                env=env, capture_output=True, text=True,
+            )
+        if output.returncode != 0:
+            print(f"❌ {workers} workers failed:\n{output.stderr[-2000:]}", file=sys.stderr)
+            continue
+        results.append(json.loads(output.stdout.strip().splitlines()[-1]))
+
+    if not results:
+        return
+    base = results[0]["articles_per_second"] or 1.0
+    print(f"{'workers':>7} {'articles/s':>11} {'speedup':>8} {'RSS MB':>9} {'PSS MB':>9} {'load s':>7}")
+    for r in results:
+        print(f"{r['workers']:>7} {r['articles_per_second']:>11.2f} {r['articles_per_second'] / base:>7.2f}x "
+              f"{r['rss_mb'] if r['rss_mb'] is not None else 'n/a':>9} "
+              f"{r['pss_mb'] if r['pss_mb'] is not None else 'n/a':>9} {r['load_seconds']:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
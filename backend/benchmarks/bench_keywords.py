@@ -0,0 +1,124 @@
+# File: backend/benchmarks/bench_keywords.py
+#
+# Keyword quality and throughput: the old Counter.most_common extractor against the
+# corpus TF-IDF engine (services/keywords.py), fed one feed-sized batch at a time.
+#
+# The synthetic corpus plants a few article-specific terms in filler made of function
+# words and common news vocabulary, so precision@k against the planted terms measures
+# quality. With --jsonl (exported {title, summary} articles) only the stopword rate and
+# keyword diversity are reported.
+#
+#   python benchmarks/bench_keywords.py --articles 100000
+#   python benchmarks/bench_keywords.py --jsonl articles.jsonl
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+from collections import Counter
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+sys.path.append(backend_dir)
+
+from services.html_extract import extract_html
+from services.keywords import KeywordEngine, STOPWORDS, KEYWORD_STOPWORDS
+
+COMMON_NEWS_WORDS = (
+    "government people company market police week report officials country state city police "
+    "million percent public local world group leader plans month support health business"
+).split()
+FUNCTION_WORDS = sorted(word for word in STOPWORDS if len(word) >= 4)
+SYLLABLES = "ba ko ri tu ne sa lo mi da ve zu qua tro pel gan dor fin wex".split()
+
+
+def old_extract_keywords(text, num_keywords=5):
+    """extract_keywords before the TF-IDF engine."""
+    words = re.findall(r"\b[a-zA-Z]{4,}\b", text.lower())
+    return [word for word, _ in Counter(words).most_common(num_keywords)]
+
+
+def synthetic_corpus(count, seed=0):
+    """(text, planted terms) pairs: 4 article-specific terms among ~80 words of filler."""
+    rng = random.Random(seed)
+    vocabulary = sorted({"".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(50000)})
+    corpus = []
+    for _ in range(count):
+        planted = rng.sample(vocabulary, 4)
+        words = [rng.choice(FUNCTION_WORDS) for _ in range(50)] + [rng.choice(COMMON_NEWS_WORDS) for _ in range(20)]
+        words += [term for term in planted for _ in range(rng.randint(1, 3))]
+        rng.shuffle(words)
+        corpus.append((" ".join(words), set(planted)))
+    return corpus
+
+
+def load_jsonl(path):
+    corpus = []
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                doc = json.loads(line)
+                corpus.append((f"{doc.get('title', '')}. {extract_html(doc.get('summary', '')).text}", None))
+    return corpus
+
+
+def quality(keyword_lists, corpus, k):
+    total = sum(len(keywords) for keywords in keyword_lists) or 1
+    stopword_rate = sum(word in KEYWORD_STOPWORDS for keywords in keyword_lists for word in keywords) / total
+    diversity = len({word for keywords in keyword_lists for word in keywords}) / total
+    planted = [terms for _, terms in corpus]
+    precision = None
+    if all(terms is not None for terms in planted):
+        hits = sum(len(set(keywords) & terms) for keywords, terms in zip(keyword_lists, planted))
+        precision = hits / (k * len(corpus))
+    return stopword_rate, diversity, precision
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark keyword extraction quality and throughput.")
+    parser.add_argument("--articles", type=int, default=100000)
+    parser.add_argument("--jsonl", default=None, help="exported articles ({title, summary} per line)")
+    parser.add_argument("--feed-size", type=int, default=20, help="articles per extract_batch call")
+    parser.add_argument("--keywords", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = load_jsonl(args.jsonl) if args.jsonl else synthetic_corpus(args.articles)
+    texts = [text for text, _ in corpus]
+    token_lists = [extract_html(text).tokens for text in texts]
+
+    start = time.perf_counter()
+    old_keywords = [old_extract_keywords(text, args.keywords) for text in texts]
+    old_seconds = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        engine = KeywordEngine(path=os.path.join(state_dir, "keyword_df.npz"))
+        start = time.perf_counter()
+        new_keywords = []
+        for offset in range(0, len(token_lists), args.feed_size):
+            new_keywords.extend(engine.extract_batch(token_lists[offset:offset + args.feed_size], args.keywords))
+        new_seconds = time.perf_counter() - start
+        save_start = time.perf_counter()
+        engine.save()
+        save_seconds = time.perf_counter() - save_start
+        size_kb = os.path.getsize(engine.path) / 1024
+        reload_start = time.perf_counter()
+        KeywordEngine.load(engine.path)
+        load_seconds = time.perf_counter() - reload_start
+
+    print(f"{len(corpus)} articles, {len(engine.terms)} terms in the vocabulary "
+          f"({size_kb:.0f} KB on disk, save {save_seconds:.2f}s, load {load_seconds:.2f}s)")
+    print(f"{'extractor':<10} {'articles/s':>11} {'stopwords':>10} {'diversity':>10} {'precision@k':>12}")
+    for name, keyword_lists, seconds in (("counter", old_keywords, old_seconds), ("tf-idf", new_keywords, new_seconds)):
+        stopword_rate, diversity, precision = quality(keyword_lists, corpus, args.keywords)
+        precision_text = f"{precision:.3f}" if precision is not None else "n/a"
+        print(f"{name:<10} {len(corpus) / seconds:>11.0f} {stopword_rate:>9.1%} {diversity:>10.3f} {precision_text:>12}")
+    # Early articles are scored against a small corpus; the late ones show steady state.
+    print("sample:", texts[-1][:80], "->", new_keywords[-1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+# File: backend/benchmarks/bench_near_duplicates.py
+#
+# Replays a corpus in publish order through the near-duplicate clustering used by the
+# fetcher's infer stage (services/near_duplicates.py) and reports:
+#   - inference saved: articles that reuse a representative's summary and categories
+#   - cluster quality against exact shingle Jaccard: precision (a duplicate really is that
+#     similar to its representative) and recall (articles with an exact match earlier in
+#     the window that were caught), plus pairwise precision/recall/F1 against story labels
+#     when the corpus has them
+#   - signature and index throughput
+#
+# The built-in corpus imitates wire copy: each story is republished by several outlets
+# with edited headlines, trimmed summaries and boilerplate, next to unrelated stories on
+# the same topics and follow-ups that share an earlier story's lead. A recorded corpus can
+# be replayed instead (JSON lines with title, summary, publishedAt and optionally story),
+# e.g. from mongoexport of the articles:
+#
+#   python benchmarks/bench_near_duplicates.py --stories 2000
+#   python benchmarks/bench_near_duplicates.py --jsonl articles.jsonl
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+from collections import Counter, defaultdict
+from datetime import timezone
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+sys.path.append(backend_dir)
+
+from dateutil import parser as date_parser
+
+from services.fingerprint import normalize_content, MIN_CONTENT_WORDS
+from services.near_duplicates import (StoryClusters, story_signature, story_lead, NEAR_DUP_THRESHOLD,
+                                      NEAR_DUP_WINDOW_SECONDS, SHINGLE_WORDS)
+
+TOPICS = {
+    "markets": "stocks shares investors index fell rose percent trading bank rates inflation bond yields dollar oil prices quarter earnings",
+    "politics": "president senate vote bill election campaign minister parliament coalition party leader policy court ruling officials government",
+    "tech": "company software chip launch users data privacy app platform startup artificial intelligence model cloud security update device",
+    "health": "patients hospital vaccine study doctors drug trial disease health officials cases treatment virus researchers care infection",
+    "sports": "team season match coach players league win final goal injury cup championship record game fans title transfer",
+}
+FILLER = "the a of to in and on for with at by from as said after over new".split()
+OUTLET_PREFIXES = ["", "", "", "UPDATE 1-", "EXCLUSIVE-", "Breaking: "]
+OUTLET_SUFFIXES = ["", "", " - Reuters", " | AP News", " (Update)"]
+BOILERPLATE = ["", "", "Click here to read the full story.", "Sign up for our newsletter.", "(Reporting by staff; Editing by desk)"]
+
+
+# -------------------- CORPUS -------------------- #
+def _sentence(rng, vocabulary):
+    words = [rng.choice(vocabulary) if rng.random() < 0.6 else rng.choice(FILLER) for _ in range(rng.randint(10, 18))]
+    return " ".join(words).capitalize() + "."
+
+
+def synthetic_corpus(stories, seed=0, days=3):
+    """Articles {title, summary, published, story} in publish order."""
+    rng = random.Random(seed)
+    articles = []
+    originals = []
+    for story in range(stories):
+        if originals and rng.random() < 0.15:
+            # A follow-up: a different story on the same event, sharing the headline's shape and
+            # the lead sentence with an earlier one. Must not reuse the earlier story's summary.
+            vocabulary, title, sentences, published = rng.choice(originals)
+            words = title.split()
+            for _ in range(3):
+                words[rng.randrange(len(words))] = rng.choice(vocabulary)
+            title = " ".join(words)
+            sentences = sentences[:1] + [_sentence(rng, vocabulary) for _ in range(rng.randint(2, 5))]
+            published += rng.uniform(3600, 12 * 3600)
+        else:
+            vocabulary = TOPICS[rng.choice(list(TOPICS))].split()
+            title = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(6, 10))).capitalize()
+            sentences = [_sentence(rng, vocabulary) for _ in range(rng.randint(3, 6))]
+            published = rng.uniform(0, days * 86400)
+            originals.append((vocabulary, title, sentences, published))
+        # Most stories run once; wire stories are picked up by several outlets within hours.
+        copies = 1 if rng.random() < 0.6 else rng.randint(2, 7)
+        for copy in range(copies):
+            kept = sentences[:rng.randint(2, len(sentences))] if copy else sentences
+            if copy and rng.random() < 0.3:
+                # Light copy-editing: swap a few words.
+                words = " ".join(kept).split()
+                for _ in range(rng.randint(1, 4)):
+                    words[rng.randrange(len(words))] = rng.choice(vocabulary)
+                kept = [" ".join(words)]
+            headline = title if not copy else rng.choice(OUTLET_PREFIXES) + title + rng.choice(OUTLET_SUFFIXES)
+            articles.append({
+                "title": headline,
+                "summary": " ".join(kept + [rng.choice(BOILERPLATE) if copy else ""]).strip(),
+                "published": published + (rng.uniform(0, 6 * 3600) if copy else 0.0),
+                "story": story,
+            })
+    articles.sort(key=lambda article: article["published"])
+    return articles
+
+
+def _timestamp(value):
+    if isinstance(value, dict):
+        value = value.get("$date")
+    if isinstance(value, (int, float)):
+        return float(value) / (1000 if value > 1e11 else 1)
+    if not value:
+        return None
+    parsed = date_parser.parse(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def load_jsonl(path):
+    articles = []
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            record = json.loads(line)
+            published = _timestamp(record.get("publishedAt") or record.get("published"))
+            if published is None:
+                continue
+            articles.append({
+                "title": record.get("title") or "",
+                "summary": record.get("summary") or record.get("description") or "",
+                "published": published,
+                "story": record.get("story"),
+            })
+    articles.sort(key=lambda article: article["published"])
+    return articles
+
+
+# -------------------- EXACT REFERENCE -------------------- #
+def _shingle_set(article):
+    tokens = normalize_content(article["title"], article["summary"]).split()
+    if len(tokens) < MIN_CONTENT_WORDS:
+        return None
+    size = min(SHINGLE_WORDS, len(tokens))
+    return frozenset(" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1))
+
+
+def _jaccard(a, b):
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+
+def exact_earlier_matches(articles, shingle_sets, threshold, window):
+    """For each article, whether an earlier article within the window has exact Jaccard >= threshold."""
+    postings = defaultdict(list)
+    matched = []
+    for i, (article, shingle_set) in enumerate(zip(articles, shingle_sets)):
+        found = False
+        if shingle_set is not None:
+            seen = set()
+            for shingle in shingle_set:
+                for j in postings[shingle]:
+                    if j in seen or articles[j]["published"] < article["published"] - window:
+                        continue
+                    seen.add(j)
+                    if _jaccard(shingle_set, shingle_sets[j]) >= threshold:
+                        found = True
+                        break
+                if found:
+                    break
+            for shingle in shingle_set:
+                postings[shingle].append(i)
+        matched.append(found)
+    return matched
+
+
+def pairwise_scores(predicted, labels):
+    """Pairwise precision/recall/F1 of predicted cluster ids against ground-truth labels."""
+    def pairs(groups):
+        members = defaultdict(list)
+        for i, group in enumerate(groups):
+            if group is not None:
+                members[group].append(i)
+        return {(a, b) for group in members.values() for n, a in enumerate(group) for b in group[n + 1:]}
+
+    predicted_pairs, true_pairs = pairs(predicted), pairs(labels)
+    hits = len(predicted_pairs & true_pairs)
+    precision = hits / len(predicted_pairs) if predicted_pairs else 1.0
+    recall = hits / len(true_pairs) if true_pairs else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return precision, recall, f1
+
+
+# -------------------- REPLAY -------------------- #
+def replay(articles, threshold, window):
+    clock = [0.0]
+    clusters = StoryClusters(threshold=threshold, window_seconds=window, clock=lambda: clock[0])
+
+    start = time.perf_counter()
+    signatures = [story_signature(article["title"], article["summary"]) for article in articles]
+    signature_seconds = time.perf_counter() - start
+
+    assigned, representatives = [], []
+    cluster_representative = {}
+    start = time.perf_counter()
+    for i, (article, signature) in enumerate(zip(articles, signatures)):
+        clock[0] = article["published"]
+        if signature is None:
+            assigned.append(None)
+            representatives.append(None)
+            continue
+        cluster, is_duplicate = clusters.assign(signature, lead=story_lead(article["title"], article["summary"]))
+        if not is_duplicate:
+            cluster_representative[cluster.cluster_id] = i
+        assigned.append(cluster.cluster_id)
+        representatives.append(cluster_representative[cluster.cluster_id] if is_duplicate else None)
+    assign_seconds = time.perf_counter() - start
+    return assigned, representatives, signature_seconds, assign_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a corpus through MinHash/LSH near-duplicate clustering.")
+    parser.add_argument("--stories", type=int, default=2000, help="stories in the built-in corpus")
+    parser.add_argument("--jsonl", default=None, help="recorded articles (title, summary, publishedAt[, story])")
+    parser.add_argument("--threshold", type=float, default=NEAR_DUP_THRESHOLD)
+    parser.add_argument("--window-hours", type=float, default=NEAR_DUP_WINDOW_SECONDS / 3600)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    articles = load_jsonl(args.jsonl) if args.jsonl else synthetic_corpus(args.stories, seed=args.seed)
+    window = args.window_hours * 3600
+    assigned, representatives, signature_seconds, assign_seconds = replay(articles, args.threshold, window)
+
+    shingle_sets = [_shingle_set(article) for article in articles]
+    duplicates = [i for i, rep in enumerate(representatives) if rep is not None]
+    true_duplicates = sum(1 for i in duplicates if _jaccard(shingle_sets[i], shingle_sets[representatives[i]]) >= args.threshold)
+    should_match = exact_earlier_matches(articles, shingle_sets, args.threshold, window)
+    caught = sum(1 for i, expected in enumerate(should_match) if expected and representatives[i] is not None)
+
+    n = len(articles)
+    print(f"articles                 {n}")
+    sizes = Counter(cluster_id for cluster_id in assigned if cluster_id is not None)
+    print(f"clusters                 {len(sizes)} ({sum(1 for size in sizes.values() if size > 1)} with duplicates, "
+          f"largest {max(sizes.values(), default=0)})")
+    print(f"near-duplicates          {len(duplicates)} ({len(duplicates) / n:.1%} of articles skip summarize + classify)")
+    print(f"precision vs exact J     {true_duplicates / len(duplicates) if duplicates else 1.0:.3f} "
+          f"(duplicates with exact Jaccard >= {args.threshold} to their representative)")
+    print(f"recall vs exact J        {caught / sum(should_match) if any(should_match) else 1.0:.3f} "
+          f"({caught}/{sum(should_match)} articles with an exact match earlier in the window)")
+    labels = [article["story"] for article in articles]
+    if any(label is not None for label in labels):
+        precision, recall, f1 = pairwise_scores(assigned, labels)
+        print(f"pairwise vs stories      precision {precision:.3f}  recall {recall:.3f}  F1 {f1:.3f}")
+    print(f"signatures               {n / signature_seconds if signature_seconds else 0:,.0f} articles/s")
+    print(f"index assign             {n / assign_seconds if assign_seconds else 0:,.0f} articles/s")
+
+
+if __name__ == "__main__":
+    main()
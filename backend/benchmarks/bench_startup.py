@@ -0,0 +1,75 @@
+# File: backend/benchmarks/bench_startup.py
+#
+# Measures import time and peak RSS of the Python services in a fresh interpreter,
+# for the working tree and optionally an older git revision:
+#
+#   python benchmarks/bench_startup.py --ref HEAD~1
+
+import os
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+repo_dir = os.path.dirname(backend_dir)
+
+MODULES = ["services.rss_fetcher", "services.summarization.summarizer"]
+
+CHILD = """
+import sys, time, json, resource, importlib
+sys.path.insert(0, {backend!r})
+start = time.perf_counter()
+importlib.import_module({module!r})
+elapsed = time.perf_counter() - start
+peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"seconds": elapsed, "peak_rss_mb": peak_kb / 1024}}))
+"""
+
+
+def measure(backend, module):
+    """Import `module` from `backend` in a clean interpreter; returns seconds and peak RSS."""
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD.format(backend=backend, module=module)],
+        cwd=backend, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "failed"}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def export_revision(ref, target):
+    """Write the backend/ tree of git revision `ref` into `target`; returns its backend dir."""
+    archive = subprocess.run(["git", "archive", ref, "backend"], cwd=repo_dir, capture_output=True, check=True)
+    subprocess.run(["tar", "-x", "-C", target], input=archive.stdout, check=True)
+    return os.path.join(target, "backend")
+
+
+def report(label, backend, repeat):
+    for module in MODULES:
+        runs = [measure(backend, module) for _ in range(repeat)]
+        ok = [run for run in runs if "error" not in run]
+        if not ok:
+            print(f"{label:<10} {module:<38} error: {runs[0]['error']}")
+            continue
+        seconds = min(run["seconds"] for run in ok)
+        peak = max(run["peak_rss_mb"] for run in ok)
+        print(f"{label:<10} {module:<38} import {seconds:7.2f}s   peak RSS {peak:8.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure service import time and peak RSS.")
+    parser.add_argument("--ref", help="also measure this git revision (e.g. HEAD~1) for a before/after comparison")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.ref:
+        with tempfile.TemporaryDirectory() as tmp:
+            report(args.ref, export_revision(args.ref, tmp), args.repeat)
+    report("working", backend_dir, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# File: backend/benchmarks/bench_summarize_batch.py
+#
+# Throughput of summarize_batch vs the original per-article path (the pre-batching
+# summarize_text run by a 2-thread pool, calling the model directly), on CPU. The summary
+# cache is disabled for both, so every text is really summarized.
+# Use a tiny checkpoint so it runs in seconds, e.g.:
+#
+#   python benchmarks/bench_summarize_batch.py --model sshleifer/distilbart-xsum-1-1 --articles 64
+
+import os
+import sys
+import time
+import random
+import argparse
+import concurrent.futures
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+sys.path.append(backend_dir)
+
+WORDS = (
+    "government market company technology season players research patients energy prices "
+    "election court announced report growth shares league study climate launch officials "
+    "investors police software network season championship vaccine hospital rates bank"
+).split()
+
+
+def synthetic_articles(count, seed=0):
+    """Texts spanning the short/medium/long length rules in prepare_summary_input."""
+    rng = random.Random(seed)
+    articles = []
+    for _ in range(count):
+        length = rng.choice([15, 30, 45, 80, 120, 200])
+        sentences = []
+        while sum(len(s.split()) for s in sentences) < length:
+            sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 14)))
+            sentences.append(sentence.capitalize() + ".")
+        articles.append(" ".join(sentences))
+    return articles
+
+
+def original_summarize_text(summarizer, text):
+    """The pre-batching summarize_text: per-article length rules and one pipeline call, no cache."""
+    from services.summarization.summarizer import clean_text, trim_to_sentence_boundary
+
+    input_length = len(text.split())
+    if input_length < 10:
+        return text
+    if input_length < 50:
+        min_length = 10
+        max_length = min(60, input_length)
+    else:
+        min_length = max(15, input_length // 6)
+        max_length = min(120, max(min_length + 20, input_length // 3))
+    if max_length >= input_length:
+        max_length = input_length - 1
+    if min_length >= max_length:
+        min_length = max_length - 5
+    if input_length > 120:
+        text = " ".join(text.split()[:120])
+
+    start_time = time.time()
+    summary = summarizer(text, max_length=max_length, min_length=min_length, do_sample=False)
+    if time.time() - start_time > 9:
+        return trim_to_sentence_boundary(text[:150])
+    return trim_to_sentence_boundary(clean_text(summary[0]["summary_text"]))
+
+
+def thread_pool_path(summarizer, texts):
+    """The pre-batching process_input strategy: 2 threads, one generate() per text."""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        return list(executor.map(lambda text: original_summarize_text(summarizer, text), texts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched summarization on CPU.")
+    parser.add_argument("--model", default=None, help="checkpoint name or local path (sets SUMMARIZER_MODEL)")
+    parser.add_argument("--articles", type=int, default=64)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.model:
+        os.environ["SUMMARIZER_MODEL"] = args.model
+    # Keep the summary cache off disk, so no run is served from an earlier one.
+    os.environ["SUMMARY_CACHE_PATH"] = ""
+    from services.summarization import summarizer
+    from services.summarization.summarizer import get_summarizer, summarize_batch
+    from services.summarization.summary_cache import SummaryCache
+
+    # No entries kept in memory either: summarize_batch never gets a cache hit.
+    summarizer.summary_cache = SummaryCache(path="", max_entries=0)
+    model = get_summarizer()
+    texts = synthetic_articles(args.articles)
+    warm_up = synthetic_articles(2, seed=99)
+    thread_pool_path(model, warm_up)
+    summarize_batch(warm_up, batch_size=2)
+
+    for label, run in (
+        ("per-article pool (2 workers)", lambda: thread_pool_path(model, texts)),
+        (f"summarize_batch (batch={args.batch_size})", lambda: summarize_batch(texts, batch_size=args.batch_size)),
+    ):
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        print(f"{label:<32} {best:7.2f}s  {len(texts) / best:7.2f} articles/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# File: backend/benchmarks/load_test_summarizer.py
+#
+# Drives services/summarization/summarizer.py over stdin/stdout pipes with many concurrent
+# callers, the way summarizer.js does, and reports throughput and latency.
+#
+#   python benchmarks/load_test_summarizer.py --model sshleifer/distilbart-xsum-1-1 \
+#       --callers 8 --requests 10 --articles 5 --protocol v2
+#
+# --protocol v1 sends legacy bare arrays with one request outstanding at a time
+# (the old FIFO behaviour); v2 pipelines every caller's requests with ids.
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import subprocess
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+sys.path.append(backend_dir)
+
+from benchmarks.bench_summarize_batch import synthetic_articles
+
+SUMMARIZER_SCRIPT = os.path.join(backend_dir, "services", "summarization", "summarizer.py")
+
+
+class SummarizerClient:
+    """Minimal Python twin of summarizer.js: writes request lines, matches replies by id."""
+
+    def __init__(self, env, protocol):
+        self.protocol = protocol
+        self.process = subprocess.Popen(
+            [sys.executable, SUMMARIZER_SCRIPT],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, bufsize=1, env=env,
+        )
+        self.write_lock = threading.Lock()
+        # v1 has no ids, so only one request may be outstanding at a time.
+        self.serial_lock = threading.Lock()
+        self.pending = {}
+        self.next_id = 0
+        self.reader = threading.Thread(target=self._read, daemon=True)
+        self.reader.start()
+
+    def _read(self):
+        for line in self.process.stdout:
+            message = json.loads(line)
+            key = None if isinstance(message, list) else message.get("id")
+            waiter = self.pending.pop(key, None)
+            if waiter:
+                waiter["response"] = message
+                waiter["event"].set()
+
+    def summarize(self, texts):
+        waiter = {"event": threading.Event(), "response": None}
+        if self.protocol == "v1":
+            with self.serial_lock:
+                self.pending[None] = waiter
+                self._write([{"content": text} for text in texts])
+                waiter["event"].wait()
+            return waiter["response"]
+
+        with self.write_lock:
+            self.next_id += 1
+            request_id = str(self.next_id)
+            self.pending[request_id] = waiter
+            self._write({
+                "v": 2, "id": request_id,
+                "articles": [{"id": i, "content": text} for i, text in enumerate(texts)],
+            })
+        waiter["event"].wait()
+        response = waiter["response"]
+        assert [item["id"] for item in response["summaries"]] == list(range(len(texts))), "out of order"
+        return [item["summary"] for item in response["summaries"]]
+
+    def _write(self, message):
+        self.process.stdin.write(json.dumps(message) + "\n")
+        self.process.stdin.flush()
+
+    def close(self):
+        self.process.stdin.close()
+        self.process.wait(timeout=30)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the summarizer line protocol over pipes.")
+    parser.add_argument("--model", default=None, help="checkpoint name or local path (sets SUMMARIZER_MODEL)")
+    parser.add_argument("--protocol", choices=["v1", "v2"], default="v2")
+    parser.add_argument("--callers", type=int, default=8, help="concurrent callers")
+    parser.add_argument("--requests", type=int, default=10, help="requests per caller")
+    parser.add_argument("--articles", type=int, default=5, help="articles per request")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if args.model:
+        env["SUMMARIZER_MODEL"] = args.model
+    # In-memory summary cache only: each run starts empty instead of replaying an earlier run's results.
+    env["SUMMARY_CACHE_PATH"] = ""
+    client = SummarizerClient(env, args.protocol)
+    client.summarize(synthetic_articles(1, seed=-1))  # wait for model load; text no caller sends
+
+    latencies = []
+    latency_lock = threading.Lock()
+
+    def caller(seed):
+        for n in range(args.requests):
+            texts = synthetic_articles(args.articles, seed=seed * 1000 + n)
+            start = time.perf_counter()
+            summaries = client.summarize(texts)
+            elapsed = time.perf_counter() - start
+            assert len(summaries) == len(texts)
+            with latency_lock:
+                latencies.append(elapsed)
+
+    threads = [threading.Thread(target=caller, args=(seed,)) for seed in range(args.callers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    client.close()
+
+    total_articles = args.callers * args.requests * args.articles
+    print(f"protocol {args.protocol}: {args.callers} callers x {args.requests} requests x {args.articles} articles")
+    print(f"  wall time      {wall:8.2f}s")
+    print(f"  throughput     {total_articles / wall:8.2f} articles/sec, {len(latencies) / wall:.2f} requests/sec")
+    print(f"  latency p50    {percentile(latencies, 50):8.2f}s")
+    print(f"  latency p95    {percentile(latencies, 95):8.2f}s")
+    print(f"  latency p99    {percentile(latencies, 99):8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
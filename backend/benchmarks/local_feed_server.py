@@ -0,0 +1,100 @@
+# File: backend/benchmarks/local_feed_server.py
+
+import threading
+import time
+import hashlib
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Minimal RSS document used when no recorded fixture is supplied.
+SAMPLE_RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>{title}</title>
+    <link>http://localhost/</link>
+    <description>Canned feed for local benchmarks</description>
+{items}
+  </channel>
+</rss>
+"""
+
+SAMPLE_ITEM = """    <item>
+      <title>{title} story {n}</title>
+      <link>http://localhost/{slug}/story-{n}</link>
+      <guid>http://localhost/{slug}/story-{n}</guid>
+      <pubDate>Mon, 06 Jan 2025 {hour:02d}:00:00 GMT</pubDate>
+      <description>&lt;p&gt;Story {n} from {title}. Markets moved sharply today as investors weighed new data on inflation, jobs and technology spending across the region.&lt;/p&gt;&lt;img src="http://localhost/img/{slug}-{n}.jpg"/&gt;</description>
+    </item>"""
+
+
+def sample_feed(title, entries=20):
+    """Build a small but realistic RSS 2.0 document as bytes."""
+    slug = title.lower().replace(" ", "-")
+    items = "\n".join(SAMPLE_ITEM.format(title=title, slug=slug, n=n, hour=n % 24) for n in range(entries))
+    return SAMPLE_RSS.format(title=title, items=items).encode("utf-8")
+
+
+class FeedServer:
+    """
+    Serves canned feed XML from memory on 127.0.0.1.
+    `routes` maps a path ("/verge.xml") to a body (bytes); `delays` optionally maps a path
+    to seconds to sleep before answering, to imitate slow or hanging hosts. Every body is
+    served with an ETag and a matching If-None-Match is answered with 304.
+    """
+
+    def __init__(self, routes, delays=None, port=0):
+        self.routes = dict(routes)
+        self.delays = dict(delays or {})
+        self.request_count = 0
+        self.not_modified_count = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.request_count += 1
+                delay = server.delays.get(self.path, 0)
+                if delay:
+                    time.sleep(delay)
+                body = server.routes.get(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                try:
+                    if self.headers.get("If-None-Match") == etag:
+                        server.not_modified_count += 1
+                        self.send_response(304)
+                        self.send_header("ETag", etag)
+                        self.end_headers()
+                        return
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up (e.g. feed timeout) before we answered.
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path):
+        return self.base_url + path
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,380 @@
+# File: backend/benchmarks/replay_ingest.py
+#
+# Replayable, offline benchmark of the whole ingest cycle (fetch_rss_articles): feed XML
+# is served from fixtures by a local HTTP server, articles go to mongomock (or a scratch
+# database on a local mongod) and the models are stubbed, or real (tiny) checkpoints.
+# Every run starts from empty state. Reports articles/sec, per-stage latency percentiles
+# (services/metrics.py), peak RSS and DB operation counts, and compares two runs.
+#
+#   python benchmarks/replay_ingest.py record --out fixtures/2025-01-06       # snapshot the live feeds
+#   python benchmarks/replay_ingest.py run --fixtures fixtures/2025-01-06 --repeat 3 --out base.json
+#   python benchmarks/replay_ingest.py run --out synthetic.json               # built-in synthetic feeds
+#   python benchmarks/replay_ingest.py compare base.json new.json
+#
+# With --models real, SUMMARIZER_MODEL / CLASSIFIER_MODEL choose the checkpoints, e.g.
+# sshleifer/distilbart-xsum-1-1 and typeform/distilbert-base-uncased-mnli.
+
+import os
+import re
+import sys
+import json
+import time
+import zlib
+import random
+import argparse
+import resource
+import tempfile
+import statistics
+import subprocess
+from collections import Counter
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+sys.path.append(backend_dir)
+
+# Paths that would otherwise point into backend/cache; the child gets a fresh state dir instead.
+STATE_ENV = (
+    "RSS_FEED_CACHE_PATH", "RSS_FEED_SCHEDULE_PATH", "RSS_FEED_STATE_PATH", "KEYWORD_DF_PATH",
+    "CATEGORY_TIER_PATH", "SUMMARY_CACHE_PATH", "RSS_PROFILE_PATH",
+)
+MANIFEST = "manifest.json"
+SYNTHETIC_EPOCH = datetime(2025, 1, 6, tzinfo=timezone.utc).timestamp()
+
+
+def _slug(source):
+    return re.sub(r"[^a-z0-9]+", "-", source.lower()).strip("-") or "feed"
+
+
+# -------------------- FIXTURES -------------------- #
+def record(out_dir, sources=None):
+    """Download the live feeds in RSS_FEEDS (or `sources` of them) into out_dir with a manifest."""
+    from services.rss_fetcher import RSS_FEEDS
+    from services.feed_downloader import download_feeds
+
+    feeds = {source: url for source, url in RSS_FEEDS.items() if not sources or source in sources}
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = {}
+    for download in download_feeds(feeds):
+        if not download.ok:
+            print(f"⚠️ {download.source}: not recorded ({download.error or download.status})", file=sys.stderr)
+            continue
+        filename = _slug(download.source) + ".xml"
+        with open(os.path.join(out_dir, filename), "wb") as handle:
+            handle.write(download.body)
+        manifest[download.source] = {
+            "file": filename,
+            "url": download.url,
+            "bytes": len(download.body),
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+        }
+    with open(os.path.join(out_dir, MANIFEST), "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=2, sort_keys=True)
+    print(f"📼 Recorded {len(manifest)}/{len(feeds)} feeds into {out_dir}", file=sys.stderr)
+
+
+def load_fixtures(fixtures_dir):
+    """{source: xml bytes} from a recorded fixtures directory."""
+    with open(os.path.join(fixtures_dir, MANIFEST), encoding="utf-8") as handle:
+        manifest = json.load(handle)
+    bodies = {}
+    for source, entry in sorted(manifest.items()):
+        with open(os.path.join(fixtures_dir, entry["file"]), "rb") as handle:
+            bodies[source] = handle.read()
+    return bodies
+
+
+def synthetic_fixtures(feeds=24, stories=300, seed=0):
+    """
+    {source: xml bytes}: the wire-style corpus of bench_near_duplicates (stories republished
+    by several outlets, follow-ups, boilerplate) spread over `feeds` RSS documents.
+    """
+    from benchmarks.bench_near_duplicates import synthetic_corpus
+
+    rng = random.Random(seed)
+    items = {f"Replay {n}": [] for n in range(feeds)}
+    sources = list(items)
+    for i, article in enumerate(synthetic_corpus(stories, seed=seed)):
+        source = rng.choice(sources)
+        published = datetime.fromtimestamp(SYNTHETIC_EPOCH + article["published"], timezone.utc)
+        link = f"http://replay.local/{_slug(source)}/{i}"
+        image = f'&lt;img src="http://replay.local/img/{i}.jpg"/&gt;' if rng.random() < 0.5 else ""
+        items[source].append((published, (
+            f"<item><title>{escape(article['title'])}</title><link>{link}</link><guid>{link}</guid>"
+            f"<pubDate>{format_datetime(published)}</pubDate>"
+            f"<description>&lt;p&gt;{escape(article['summary'])}&lt;/p&gt;{image}</description></item>"
+        )))
+    bodies = {}
+    for source, entries in items.items():
+        # Newest first, like a real feed.
+        entries.sort(key=lambda entry: entry[0], reverse=True)
+        body = "\n".join(item for _, item in entries)
+        bodies[source] = (f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+                          f"<title>{source}</title><link>http://replay.local/</link>{body}</channel></rss>").encode("utf-8")
+    return bodies
+
+
+# -------------------- DB OPERATION COUNTS -------------------- #
+class CountingCollection:
+    """Collection proxy that counts every method call by name (find, insert_many, ...)."""
+
+    def __init__(self, collection):
+        self._collection = collection
+        self.ops = Counter()
+
+    def __getattr__(self, name):
+        attribute = getattr(self._collection, name)
+        if not callable(attribute):
+            return attribute
+
+        def counted(*args, **kwargs):
+            self.ops[name] += 1
+            return attribute(*args, **kwargs)
+        return counted
+
+
+# -------------------- STUB MODELS -------------------- #
+def install_stub_models(fetcher, seconds_per_article=0.0):
+    """
+    Replace the models behind fetch_rss_articles with cheap deterministic stand-ins:
+    extractive summaries and hash-derived category scores. `seconds_per_article` adds a
+    fixed cost per item so inference-heavy changes still show up.
+    """
+    from services.summarization.summarizer import extractive_summary
+
+    def summarize(texts, **options):
+        if seconds_per_article:
+            time.sleep(seconds_per_article * len(texts))
+        return [extractive_summary(text) for text in texts]
+
+    def classify(texts):
+        if seconds_per_article:
+            time.sleep(seconds_per_article * len(texts))
+        results = []
+        for text in texts:
+            rng = random.Random(zlib.crc32(text.encode("utf-8")))
+            scores = {label: rng.random() * 0.6 for label in fetcher.TARGET_CATEGORIES}
+            scores[rng.choice(fetcher.TARGET_CATEGORIES)] = 0.9
+            results.append(dict(sorted(scores.items(), key=lambda item: item[1], reverse=True)))
+        return results
+
+    fetcher.summarize_batch = summarize
+    fetcher.classify_articles = classify
+
+
+# -------------------- ONE RUN (child process) -------------------- #
+def run_child(args):
+    """One cold ingest cycle; RSS_STATE_DIR / RSS_METRICS_PATH are set by the parent."""
+    from benchmarks.local_feed_server import FeedServer
+    from services import model_registry
+    import services.rss_fetcher as fetcher
+
+    bodies = load_fixtures(args.fixtures) if args.fixtures else synthetic_fixtures(args.feeds, args.stories, args.seed)
+
+    if args.mongo == "mongomock":
+        import mongomock
+        collection = CountingCollection(mongomock.MongoClient()["replay"]["NewsArticle"])
+        drop = None
+    else:
+        import pymongo
+        client = pymongo.MongoClient(args.mongo)
+        database = f"replay_{os.getpid()}"
+        collection = CountingCollection(client[database]["NewsArticle"])
+        drop = lambda: client.drop_database(database)
+    model_registry.register("collection", lambda: collection)
+    if args.models == "stub":
+        install_stub_models(fetcher, args.stub_ms / 1000)
+
+    routes = {f"/{_slug(source)}.xml": body for source, body in bodies.items()}
+    try:
+        with FeedServer(routes) as server:
+            fetcher.RSS_FEEDS = {source: server.url(f"/{_slug(source)}.xml") for source in bodies}
+            start = time.perf_counter()
+            articles = fetcher.fetch_rss_articles(limit=args.limit, force=True)
+            wall_seconds = time.perf_counter() - start
+    finally:
+        if drop is not None:
+            drop()
+
+    with open(os.environ["RSS_METRICS_PATH"], encoding="utf-8") as handle:
+        report = json.load(handle)
+    print(json.dumps({
+        "feeds": len(bodies),
+        "articles": len(articles),
+        "wall_seconds": round(wall_seconds, 4),
+        "articles_per_second": round(len(articles) / wall_seconds, 2) if wall_seconds else 0.0,
+        # ru_maxrss is in KB on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "stages": report["stages"],
+        "counters": report["counters"],
+        "db_ops": dict(collection.ops),
+    }))
+
+
+def _median_runs(runs):
+    """Median of every timing across repeats; counts come from the first run (they should not vary)."""
+    stages = {}
+    for stage in runs[0]["stages"]:
+        samples = [run["stages"][stage] for run in runs if stage in run["stages"]]
+        stages[stage] = {key: round(statistics.median(s[key] for s in samples), 6) for key in ("p50", "p95", "p99", "sum")}
+        stages[stage]["count"] = samples[0]["count"]
+    return {
+        "feeds": runs[0]["feeds"],
+        "articles": runs[0]["articles"],
+        "wall_seconds": round(statistics.median(run["wall_seconds"] for run in runs), 4),
+        "articles_per_second": round(statistics.median(run["articles_per_second"] for run in runs), 2),
+        "peak_rss_mb": round(statistics.median(run["peak_rss_mb"] for run in runs), 1),
+        "stages": stages,
+        "counters": runs[0]["counters"],
+        "db_ops": runs[0]["db_ops"],
+    }
+
+
+def run(args):
+    command = [sys.executable, os.path.abspath(__file__), "run", "--child",
+               "--limit", str(args.limit), "--models", args.models, "--stub-ms", str(args.stub_ms),
+               "--mongo", args.mongo, "--feeds", str(args.feeds), "--stories", str(args.stories),
+               "--seed", str(args.seed)]
+    if args.fixtures:
+        command += ["--fixtures", os.path.abspath(args.fixtures)]
+
+    runs = []
+    for repeat in range(args.repeat):
+        with tempfile.TemporaryDirectory() as state_dir:
+            env = {key: value for key, value in os.environ.items() if key not in STATE_ENV}
+            env.update({
+                "RSS_STATE_DIR": state_dir,
+                "RSS_METRICS_PATH": os.path.join(state_dir, "ingest_metrics.json"),
+                "RSS_PROFILE": "",
+                "INFERENCE_WORKERS": env.get("INFERENCE_WORKERS", "1"),
+            })
+            output = subprocess.run(command, env=env, capture_output=True, text=True)
+        if args.verbose or output.returncode != 0:
+            print(output.stderr, file=sys.stderr)
+        if output.returncode != 0:
+            print(f"❌ Replay run {repeat + 1} failed", file=sys.stderr)
+            sys.exit(1)
+        runs.append(json.loads(output.stdout.strip().splitlines()[-1]))
+        print(f"🔁 Run {repeat + 1}/{args.repeat}: {runs[-1]['articles']} articles, "
+              f"{runs[-1]['articles_per_second']:.1f} articles/s", file=sys.stderr)
+
+    result = _median_runs(runs)
+    result.update({
+        "label": args.label or (os.path.basename(args.out).rsplit(".", 1)[0] if args.out else "run"),
+        "fixtures": os.path.abspath(args.fixtures) if args.fixtures else f"synthetic:{args.feeds}x{args.stories}:{args.seed}",
+        "models": args.models if args.models == "real" else f"stub:{args.stub_ms}ms",
+        "mongo": "mongomock" if args.mongo == "mongomock" else "mongod",
+        "limit": args.limit,
+        "repeat": args.repeat,
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+    })
+    print_result(result)
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, "w", encoding="utf-8") as handle:
+            json.dump(result, handle, indent=2, sort_keys=True)
+        print(f"📊 Result written to {args.out}", file=sys.stderr)
+
+
+def print_result(result):
+    print(f"{result['label']}: {result['articles']} articles from {result['feeds']} feeds in "
+          f"{result['wall_seconds']:.2f}s ({result['articles_per_second']:.1f} articles/s), "
+          f"peak RSS {result['peak_rss_mb']:.0f} MB")
+    print(f"{'stage':<24} {'count':>6} {'p50 ms':>9} {'p95 ms':>9} {'total s':>8}")
+    for stage, s in sorted(result["stages"].items()):
+        print(f"{stage:<24} {s['count']:>6} {s['p50'] * 1000:>9.2f} {s['p95'] * 1000:>9.2f} {s['sum']:>8.3f}")
+    print("db ops: " + ", ".join(f"{name} {count}" for name, count in sorted(result["db_ops"].items())))
+
+
+# -------------------- COMPARISON -------------------- #
+def compare(base, new, tolerance, min_stage_ms):
+    """Rows of (metric, base, new, change, regressed) for two run results."""
+    rows = []
+
+    def row(metric, before, after, higher_is_worse, floor=0.0):
+        change = (after - before) / before if before else 0.0
+        worse = (after - before) if higher_is_worse else (before - after)
+        regressed = worse > floor and (before == 0 or worse / before > tolerance)
+        rows.append((metric, before, after, change, regressed))
+
+    row("articles/s", base["articles_per_second"], new["articles_per_second"], higher_is_worse=False)
+    row("wall s", base["wall_seconds"], new["wall_seconds"], higher_is_worse=True)
+    row("peak RSS MB", base["peak_rss_mb"], new["peak_rss_mb"], higher_is_worse=True)
+    for stage in sorted(set(base["stages"]) | set(new["stages"])):
+        before = base["stages"].get(stage, {}).get("p95", 0.0) * 1000
+        after = new["stages"].get(stage, {}).get("p95", 0.0) * 1000
+        row(f"{stage} p95 ms", before, after, higher_is_worse=True, floor=min_stage_ms)
+    # DB operations are deterministic for the same fixtures, so any increase counts.
+    for name in sorted(set(base["db_ops"]) | set(new["db_ops"])):
+        before, after = base["db_ops"].get(name, 0), new["db_ops"].get(name, 0)
+        rows.append((f"db {name}", before, after, (after - before) / before if before else 0.0, after > before))
+    return rows
+
+
+def compare_files(args):
+    with open(args.base, encoding="utf-8") as handle:
+        base = json.load(handle)
+    with open(args.new, encoding="utf-8") as handle:
+        new = json.load(handle)
+    if (base["fixtures"], base["models"], base["limit"]) != (new["fixtures"], new["models"], new["limit"]):
+        print(f"⚠️ Runs used different inputs ({base['fixtures']}, {base['models']}, limit {base['limit']} vs "
+              f"{new['fixtures']}, {new['models']}, limit {new['limit']}); the comparison may not be meaningful",
+              file=sys.stderr)
+    if base["articles"] != new["articles"]:
+        print(f"⚠️ Inserted {base['articles']} vs {new['articles']} articles: the runs did different work", file=sys.stderr)
+
+    rows = compare(base, new, args.tolerance, args.min_stage_ms)
+    print(f"{'metric':<28} {base.get('label', 'base'):>12} {new.get('label', 'new'):>12} {'change':>8}")
+    for metric, before, after, change, regressed in rows:
+        print(f"{metric:<28} {before:>12.2f} {after:>12.2f} {change:>+8.1%}{'  ❌ regression' if regressed else ''}")
+    regressions = [metric for metric, _, _, _, regressed in rows if regressed]
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}", file=sys.stderr)
+        sys.exit(1)
+    print(f"✅ No regressions beyond {args.tolerance:.0%}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record, replay and compare offline ingest benchmarks.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="snapshot the live feeds into a fixtures directory")
+    record_parser.add_argument("--out", required=True, help="fixtures directory to write")
+    record_parser.add_argument("--sources", default=None, help="comma-separated RSS_FEEDS names (default: all)")
+
+    run_parser = commands.add_parser("run", help="replay fixtures through fetch_rss_articles")
+    run_parser.add_argument("--fixtures", default=None, help="recorded fixtures directory (default: synthetic feeds)")
+    run_parser.add_argument("--feeds", type=int, default=24, help="synthetic feeds")
+    run_parser.add_argument("--stories", type=int, default=300, help="synthetic stories (spread over the feeds)")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--limit", type=int, default=50, help="entries per feed (fetch_rss_articles limit)")
+    run_parser.add_argument("--models", choices=("stub", "real"), default="stub")
+    run_parser.add_argument("--stub-ms", type=float, default=0.0, help="simulated model cost per article (stub models)")
+    run_parser.add_argument("--mongo", default="mongomock", help="'mongomock' or a local mongod URI (uses a scratch database)")
+    run_parser.add_argument("--repeat", type=int, default=3, help="cold runs; timings are medians")
+    run_parser.add_argument("--label", default=None)
+    run_parser.add_argument("--out", default=None, help="result JSON to write")
+    run_parser.add_argument("--verbose", action="store_true", help="show the fetcher's log")
+    run_parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+
+    compare_parser = commands.add_parser("compare", help="compare two run results and flag regressions")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--tolerance", type=float, default=0.10, help="relative change treated as a regression")
+    compare_parser.add_argument("--min-stage-ms", type=float, default=1.0, help="ignore stage p95 changes smaller than this")
+
+    args = parser.parse_args()
+    if args.command == "record":
+        record(args.out, set(s.strip() for s in args.sources.split(",")) if args.sources else None)
+    elif args.command == "run" and args.child:
+        run_child(args)
+    elif args.command == "run":
+        run(args)
+    else:
+        compare_files(args)
+
+
+if __name__ == "__main__":
+    main()
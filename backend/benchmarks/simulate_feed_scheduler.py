@@ -0,0 +1,148 @@
+# File: backend/benchmarks/simulate_feed_scheduler.py
+#
+# Replays a week of synthetic feeds against the adaptive scheduler (services/feed_scheduler.py)
+# on a simulated clock, next to the old fixed 30-minute cron that polled every feed.
+# Reports polls, wasted polls (nothing new), failed polls, entries missed because they
+# scrolled out of the feed window, and publish -> ingest latency. Each cron run starts a
+# few seconds after its tick, and each outcome is recorded after a simulated download +
+# parse delay, as in rss_fetcher.
+#
+#   python benchmarks/simulate_feed_scheduler.py --days 7
+
+import os
+import sys
+import random
+import argparse
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+sys.path.append(backend_dir)
+
+from services.feed_scheduler import FeedScheduler
+from services.metrics import percentile
+
+HOUR = 3600.0
+DAY = 24 * HOUR
+
+# name: (entries per hour, failure probability per poll)
+PROFILES = {
+    "breaking": (20.0, 0.0),
+    "wire": (6.0, 0.02),
+    "hourly": (1.0, 0.0),
+    "daily": (3.0 / 24, 0.0),
+    "magazine": (1.0 / (7 * 24), 0.0),
+    "flaky": (2.0, 0.3),
+    "dead": (0.0, 1.0),
+}
+FEED_WINDOW = 20  # entries a feed document lists
+
+
+class SyntheticFeed:
+    def __init__(self, name, per_hour, failure_rate, duration, rng):
+        self.name = name
+        self.url = f"http://sim/{name}.xml"
+        self.failure_rate = failure_rate
+        self.rng = rng
+        # Poisson publishing, starting a week before the simulation so feeds have history.
+        self.published = []
+        if per_hour > 0:
+            t = -7 * DAY
+            while t < duration:
+                t += rng.expovariate(per_hour / HOUR)
+                self.published.append(t)
+
+    def poll(self, now):
+        """Timestamps of the newest FEED_WINDOW entries, or None when the poll fails."""
+        if self.rng.random() < self.failure_rate:
+            return None
+        visible = [t for t in self.published if t <= now]
+        return visible[-FEED_WINDOW:]
+
+
+class Tally:
+    def __init__(self):
+        self.polls = self.wasted = self.failed = self.missed = 0
+        self.latencies = []
+        self.newest_seen = {}
+
+    def record(self, feed, now, timestamps):
+        """Tally one poll; returns how many of its entries are new."""
+        self.polls += 1
+        if timestamps is None:
+            self.failed += 1
+            return 0
+        newest = self.newest_seen.get(feed.url, -float("inf"))
+        new = [t for t in timestamps if t > newest and t >= 0]
+        if not new:
+            self.wasted += 1
+            return 0
+        # Entries published since the last poll that are no longer in the window were missed.
+        all_new = [t for t in feed.published if newest < t <= now and t >= 0]
+        self.missed += len(all_new) - len(new)
+        self.latencies.extend(now - t for t in new)
+        self.newest_seen[feed.url] = max(timestamps)
+        return len(new)
+
+    def row(self, name):
+        latencies = sorted(self.latencies)
+        return (f"{name:<10} {self.polls:>7} {self.wasted:>7} {self.failed:>7} {self.missed:>7} "
+                f"{percentile(latencies, 0.5) / 60:>9.1f} {percentile(latencies, 0.95) / 60:>9.1f}")
+
+
+def simulate(days, tick_minutes, seed, max_latency=20.0):
+    duration = days * DAY
+    rng = random.Random(seed)
+    feeds = [SyntheticFeed(name, per_hour, failure, duration, random.Random(rng.random()))
+             for name, (per_hour, failure) in PROFILES.items()]
+
+    fixed = Tally()
+    for tick in range(int(duration // (30 * 60))):
+        now = tick * 30 * 60.0
+        for feed in feeds:
+            fixed.record(feed, now, feed.poll(now))
+
+    clock = [0.0]
+    scheduler = FeedScheduler(path=None, clock=lambda: clock[0])
+    adaptive = Tally()
+    per_feed_polls = {feed.name: 0 for feed in feeds}
+    urls = {feed.name: feed.url for feed in feeds}
+    for tick in range(int(duration // (tick_minutes * 60))):
+        # Process start-up after the tick, then the scheduler picks this run's feeds.
+        started = tick * tick_minutes * 60.0 + rng.uniform(0, 5)
+        clock[0] = started
+        due = scheduler.due_feeds(urls)
+        for feed in feeds:
+            if feed.name not in due:
+                continue
+            per_feed_polls[feed.name] += 1
+            timestamps = feed.poll(started)
+            new_entries = adaptive.record(feed, started, timestamps)
+            # The outcome is recorded once the download and parse are done.
+            clock[0] = started + rng.uniform(1, max_latency)
+            if timestamps is None:
+                scheduler.record_failure(feed.url, "simulated failure")
+            else:
+                scheduler.record_success(feed.url, timestamps, new_entries)
+    return fixed, adaptive, per_feed_polls, scheduler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate adaptive feed polling against a fixed cron.")
+    parser.add_argument("--days", type=float, default=7)
+    parser.add_argument("--tick", type=float, default=5, help="cron tick of the adaptive run, minutes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=20, help="longest download + parse time, seconds")
+    args = parser.parse_args()
+
+    fixed, adaptive, per_feed_polls, scheduler = simulate(args.days, args.tick, args.seed, args.latency)
+    print(f"{'strategy':<10} {'polls':>7} {'wasted':>7} {'failed':>7} {'missed':>7} {'p50 min':>9} {'p95 min':>9}")
+    print(fixed.row("fixed 30m"))
+    print(adaptive.row("adaptive"))
+    print()
+    for name, polls in per_feed_polls.items():
+        state = scheduler.feeds[f"http://sim/{name}.xml"]
+        print(f"  {name:<9} {polls:>5} polls, interval {state['interval'] / 60:7.1f} min, circuit {state['circuit']}")
+
+
+if __name__ == "__main__":
+    main()
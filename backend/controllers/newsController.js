@@ -125,7 +125,15 @@ async function fetchNewsAPI() {
 }
 
 // Fetch RSS articles
+let rssFetchRunning = false;
+
 async function fetchNewsRSS() {
+  // The fetcher now runs every few minutes; never start a second one on top of a slow cycle.
+  if (rssFetchRunning) {
+    console.log("⏭️ RSS Fetcher still running, skipping this tick");
+    return;
+  }
+  rssFetchRunning = true;
   console.log("🔄 Running RSS Fetcher...");
 
   // Spawn a child process to run the Python script
@@ -136,8 +144,14 @@ async function fetchNewsRSS() {
     console.error(`❌ RSS Fetch Error:\n${data}`);
   });
 
+  pythonProcess.on("error", (error) => {
+    rssFetchRunning = false;
+    console.error(`❌ Could not start RSS Fetcher: ${error.message}`);
+  });
+
   // Log when the Python script exits
   pythonProcess.on("close", (code) => {
+    rssFetchRunning = false;
     if (code !== 0) {
       console.error(`❌ RSS Fetch process exited with code ${code}`);
       return;
@@ -148,7 +162,8 @@ async function fetchNewsRSS() {
 
 // ✅ Schedule the cron job to fetch NewsAPI articles every 30 minutes
 cron.schedule("*/30 * * * *", fetchNewsAPI);
-cron.schedule("*/30 * * * *", fetchNewsRSS);
+// RSS ticks every 5 minutes; the Python scheduler (services/feed_scheduler.py) decides which feeds are due
+cron.schedule("*/5 * * * *", fetchNewsRSS);
 
 /* -----------------------------------------------------------------------------
     2. getDbNews()
@@ -159,7 +174,7 @@ export async function getDbNews() {
   try {
     // Sort by publishedAt descending, limit 50
     const articles = await collection
-      .find({})
+      .find({}, { projection: { storySignature: 0 } })
       .sort({ publishedAt: -1 })
       .limit(50)
       .toArray();
@@ -177,7 +192,7 @@ export async function getDbNews() {
 export async function getRankedNews(req, res) {
   try {
     const rankedArticles = await collection
-      .find({ relevance: { $exists: true } })
+      .find({ relevance: { $exists: true } }, { projection: { storySignature: 0 } })
       .sort({ relevance: -1 })
       .limit(50)
       .toArray();
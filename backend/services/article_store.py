@@ -0,0 +1,196 @@
+# File: backend/services/article_store.py
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import pymongo
+from bson import ObjectId
+from pymongo.errors import BulkWriteError, OperationFailure
+
+# Upper bound on URLs remembered in-process between feeds (and between runs in a long-lived worker).
+SEEN_URL_CACHE_SIZE = int(os.getenv("RSS_SEEN_URL_CACHE_SIZE", "50000"))
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+class SeenUrls:
+    """Bounded, thread-safe LRU set of article URLs already known to be stored."""
+
+    def __init__(self, maxsize=SEEN_URL_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._urls = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, url):
+        with self._lock:
+            if url in self._urls:
+                self._urls.move_to_end(url)
+                return True
+            return False
+
+    def __len__(self):
+        return len(self._urls)
+
+    def add(self, url):
+        if not url:
+            return
+        with self._lock:
+            self._urls[url] = None
+            self._urls.move_to_end(url)
+            while len(self._urls) > self.maxsize:
+                self._urls.popitem(last=False)
+
+    def update(self, urls):
+        for url in urls:
+            self.add(url)
+
+
+class InFlightKeys:
+    """
+    URLs and fingerprints claimed by articles that passed dedup but are not stored yet.
+    Several feeds sit between dedup and the bulk insert at once; claiming their keys here
+    stops a second copy of a story (same URL, canonical URL or content hash) from going
+    through inference and storage while the first is still in flight.
+    """
+
+    def __init__(self):
+        self._keys = set()
+        self._lock = threading.Lock()
+
+    def claim(self, keys):
+        """Claim all of `keys` (empty ones ignored), or none if any is already claimed. Returns success."""
+        keys = [key for key in keys if key]
+        with self._lock:
+            if any(key in self._keys for key in keys):
+                return False
+            self._keys.update(keys)
+            return True
+
+    def release(self, keys):
+        with self._lock:
+            self._keys.difference_update(key for key in keys if key)
+
+
+def ensure_indexes(collection):
+    """
+    Create the unique index on `url` that bulk inserts rely on to reject duplicates.
+    Empty/missing URLs are left out of the index so link-less entries can still be stored.
+    """
+    try:
+        collection.create_index(
+            [("url", pymongo.ASCENDING)],
+            name="url_unique",
+            unique=True,
+            partialFilterExpression={"url": {"$gt": ""}},
+        )
+    except OperationFailure as e:
+        # Usually pre-existing duplicate URLs; dedup still works through the $in lookup.
+        print(f"⚠️ Could not create unique url index: {e}", file=sys.stderr)
+
+    # Fingerprint lookups (see known_fingerprints). Not unique: NewsAPI articles have neither field.
+    try:
+        collection.create_index([("canonicalUrl", pymongo.ASCENDING)], name="canonical_url", sparse=True)
+        collection.create_index([("contentHash", pymongo.ASCENDING)], name="content_hash", sparse=True)
+    except OperationFailure as e:
+        print(f"⚠️ Could not create fingerprint indexes: {e}", file=sys.stderr)
+
+    # Articles of one story across sources (see services/near_duplicates.py).
+    try:
+        collection.create_index([("clusterId", pymongo.ASCENDING)], name="cluster_id", sparse=True)
+    except OperationFailure as e:
+        print(f"⚠️ Could not create cluster index: {e}", file=sys.stderr)
+
+
+def existing_urls(collection, urls, seen=None):
+    """
+    Return the subset of `urls` that are already stored, using the in-process `seen` set
+    first and a single `$in` query for the rest (instead of one find_one per URL).
+    """
+    urls = {url for url in urls if url}
+    if not urls:
+        return set()
+
+    found = {url for url in urls if seen is not None and url in seen}
+    remaining = list(urls - found)
+    if remaining:
+        cursor = collection.find({"url": {"$in": remaining}}, {"url": 1, "_id": 0})
+        found.update(doc["url"] for doc in cursor)
+    if seen is not None:
+        seen.update(found)
+    return found
+
+
+def known_fingerprints(collection, canonical_urls, content_hashes, seen=None):
+    """
+    Return (canonical URLs, content hashes) from the given candidates that already belong
+    to a stored article, resolved with a single query. `seen` is an optional SeenUrls-style
+    cache holding both kinds of key.
+    """
+    canonical_urls = {key for key in canonical_urls if key}
+    content_hashes = {key for key in content_hashes if key}
+    if seen is not None:
+        found_urls = {key for key in canonical_urls if key in seen}
+        found_hashes = {key for key in content_hashes if key in seen}
+    else:
+        found_urls, found_hashes = set(), set()
+
+    query = []
+    if canonical_urls - found_urls:
+        query.append({"canonicalUrl": {"$in": list(canonical_urls - found_urls)}})
+    if content_hashes - found_hashes:
+        query.append({"contentHash": {"$in": list(content_hashes - found_hashes)}})
+    if query:
+        cursor = collection.find({"$or": query}, {"canonicalUrl": 1, "contentHash": 1, "_id": 0})
+        for doc in cursor:
+            if doc.get("canonicalUrl") in canonical_urls:
+                found_urls.add(doc["canonicalUrl"])
+            if doc.get("contentHash") in content_hashes:
+                found_hashes.add(doc["contentHash"])
+
+    if seen is not None:
+        seen.update(found_urls)
+        seen.update(found_hashes)
+    return found_urls, found_hashes
+
+
+def recent_story_representatives(collection, since):
+    """
+    Stored near-duplicate cluster representatives (docs with a storySignature, see
+    services/near_duplicates.py) inserted since `since` (a UTC datetime), oldest first.
+    """
+    cursor = collection.find(
+        {"_id": {"$gte": ObjectId.from_datetime(since)}, "storySignature": {"$ne": None}},
+        {"clusterId": 1, "storySignature": 1, "title": 1, "summary": 1, "categories": 1},
+    )
+    return list(cursor.sort("_id", pymongo.ASCENDING))
+
+
+def insert_articles(collection, docs, seen=None):
+    """
+    Insert `docs` with one unordered insert_many. Documents rejected by the unique url
+    index (e.g. inserted concurrently by the NewsAPI job) are dropped silently; any other
+    write error is reported. Returns the documents that were actually inserted, with
+    their `_id` set.
+    """
+    if not docs:
+        return []
+
+    failed = set()
+    duplicates = set()
+    try:
+        collection.insert_many(docs, ordered=False)
+    except BulkWriteError as e:
+        for error in e.details.get("writeErrors", []):
+            failed.add(error["index"])
+            if error.get("code") == DUPLICATE_KEY_ERROR:
+                duplicates.add(error["index"])
+            else:
+                print(f"❌ Insert failed for {docs[error['index']].get('url')}: {error.get('errmsg')}", file=sys.stderr)
+
+    inserted = [doc for i, doc in enumerate(docs) if i not in failed]
+    if seen is not None:
+        # Only URLs now in the collection; a doc that failed for another reason may be retried.
+        seen.update(doc.get("url") for i, doc in enumerate(docs) if i not in failed or i in duplicates)
+    return inserted
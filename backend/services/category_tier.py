@@ -0,0 +1,276 @@
+# File: backend/services/category_tier.py
+
+import os
+import re
+import sys
+import zlib
+import random
+
+import numpy as np
+
+# -------------------- QUICK FIX: TELL PYTHON WHERE TO FIND 'services' -------------------- #
+script_dir = os.path.dirname(os.path.abspath(__file__))        # e.g. /.../backend/services
+backend_dir = os.path.dirname(script_dir)                      # e.g. /.../backend
+if backend_dir not in sys.path:
+    sys.path.append(backend_dir)
+
+from services.state_store import state_path, atomic_write
+from services.keywords import STOPWORDS
+
+# -------------------- CONFIGURATION -------------------- #
+CATEGORY_TIER_PATH = os.getenv("CATEGORY_TIER_PATH", state_path("category_tier.npz"))
+# Minimum softmax confidence for the fast tier to decide on its own; lower scores escalate to MNLI.
+CATEGORY_TIER_THRESHOLD = float(os.getenv("CATEGORY_TIER_THRESHOLD", "0.85"))
+# Fraction of confident articles that are still sent to MNLI to measure agreement.
+CATEGORY_TIER_AUDIT_RATE = float(os.getenv("CATEGORY_TIER_AUDIT_RATE", "0.05"))
+
+HASH_DIM = 2 ** 16
+# Cosine similarities are close together; this sharpens them into a usable softmax.
+TEMPERATURE = 0.05
+# Categories with fewer training articles than this keep their seed centroid.
+MIN_TRAINING_DOCS = 5
+
+# Seed vocabulary per category, used before (or instead of) training for sparse categories.
+SEED_TERMS = {
+    "Technology": "technology software app apps apple google microsoft ai artificial intelligence chip startup internet device smartphone cyber data cloud",
+    "Entertainment": "film movie music album actor actress celebrity tv television show series streaming netflix hollywood festival star",
+    "Politics": "election president government senate congress parliament minister vote policy campaign democrat republican party law court",
+    "Business": "company companies ceo deal merger acquisition revenue profit earnings retail industry corporate market startup layoffs",
+    "Health": "health medical doctors hospital disease patients vaccine covid cancer drug treatment study mental nhs virus",
+    "Sports": "game match team season league coach player players win football soccer basketball nba nfl cricket tennis cup",
+    "Gaming": "game games gaming xbox playstation nintendo console gamers steam esports ps5 switch developer trailer",
+    "Science": "science scientists research study space nasa planet climate species physics researchers discovery universe fossil",
+    "Finance": "stocks shares investors market markets bank banks inflation interest rates fed bond bonds currency economy dollar",
+    "General": "news people world city local report police family week today year life",
+}
+
+TOKEN_RE = re.compile(r"[a-z][a-z0-9]{2,}")
+
+
+# -------------------- VECTORIZATION -------------------- #
+def tokenize(text):
+    return [token for token in TOKEN_RE.findall((text or "").lower()) if token not in STOPWORDS]
+
+
+def _hash_tokens(tokens):
+    """Hashed term counts for one document: (bucket indices, counts)."""
+    if not tokens:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    buckets = np.fromiter((zlib.crc32(token.encode("utf-8")) % HASH_DIM for token in tokens),
+                          dtype=np.int64, count=len(tokens))
+    indices, counts = np.unique(buckets, return_counts=True)
+    return indices, counts.astype(np.float32)
+
+
+def _tfidf_rows(texts, idf):
+    """Sparse L2-normalized TF-IDF rows as a flat (doc_ids, indices, weights) triple."""
+    doc_ids, all_indices, all_weights = [], [], []
+    for doc_id, text in enumerate(texts):
+        indices, counts = _hash_tokens(tokenize(text))
+        if not len(indices):
+            continue
+        weights = (1.0 + np.log(counts)) * idf[indices]
+        norm = np.linalg.norm(weights)
+        if norm == 0:
+            continue
+        doc_ids.append(np.full(len(indices), doc_id, dtype=np.int64))
+        all_indices.append(indices)
+        all_weights.append(weights / norm)
+    if not doc_ids:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    return np.concatenate(doc_ids), np.concatenate(all_indices), np.concatenate(all_weights)
+
+
+def _normalize_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+# -------------------- CLASSIFIER -------------------- #
+class CentroidClassifier:
+    """
+    Fast first-tier category classifier: cosine similarity between hashed TF-IDF article
+    vectors and one centroid per category, computed for a whole batch with NumPy.
+    """
+
+    def __init__(self, labels, centroids, idf, trained_docs=0):
+        self.labels = list(labels)
+        self.centroids = centroids.astype(np.float32)
+        self.idf = idf.astype(np.float32)
+        self.trained_docs = trained_docs
+
+    @classmethod
+    def from_seeds(cls, labels):
+        idf = np.ones(HASH_DIM, dtype=np.float32)
+        centroids = np.zeros((len(labels), HASH_DIM), dtype=np.float32)
+        for row, label in enumerate(labels):
+            indices, counts = _hash_tokens(tokenize(SEED_TERMS.get(label, label)))
+            centroids[row, indices] = counts
+        return cls(labels, _normalize_rows(centroids), idf)
+
+    @classmethod
+    def train(cls, labels, texts, label_lists):
+        """Build IDF and per-category centroids from already-categorized articles."""
+        doc_freq = np.zeros(HASH_DIM, dtype=np.float32)
+        for text in texts:
+            indices, _ = _hash_tokens(tokenize(text))
+            doc_freq[indices] += 1
+        idf = np.log((1.0 + len(texts)) / (1.0 + doc_freq)) + 1.0
+
+        doc_ids, indices, weights = _tfidf_rows(texts, idf)
+        label_index = {label: row for row, label in enumerate(labels)}
+        centroids = np.zeros((len(labels), HASH_DIM), dtype=np.float32)
+        support = np.zeros(len(labels), dtype=np.int64)
+        doc_labels = [[label_index[label] for label in doc if label in label_index] for doc in label_lists]
+        for doc_id, rows in enumerate(doc_labels):
+            for row in rows:
+                support[row] += 1
+
+        # Sum each document's vector into the centroid of every category it carries.
+        for row in range(len(labels)):
+            members = np.array([doc_id for doc_id, rows in enumerate(doc_labels) if row in rows], dtype=np.int64)
+            if len(members) < MIN_TRAINING_DOCS:
+                continue
+            mask = np.isin(doc_ids, members)
+            np.add.at(centroids[row], indices[mask], weights[mask])
+
+        seeds = cls.from_seeds(labels).centroids
+        for row in range(len(labels)):
+            if support[row] < MIN_TRAINING_DOCS:
+                centroids[row] = seeds[row]
+        return cls(labels, _normalize_rows(centroids), idf, trained_docs=len(texts))
+
+    def scores(self, texts):
+        """Softmax category probabilities, shape (len(texts), len(labels))."""
+        doc_ids, indices, weights = _tfidf_rows(texts, self.idf)
+        sims = np.zeros((len(texts), len(self.labels)), dtype=np.float32)
+        if len(doc_ids):
+            np.add.at(sims, doc_ids, (self.centroids[:, indices] * weights).T)
+        logits = sims / TEMPERATURE
+        logits -= logits.max(axis=1, keepdims=True)
+        probs = np.exp(logits)
+        return probs / probs.sum(axis=1, keepdims=True)
+
+    def predict(self, texts, threshold=CATEGORY_TIER_THRESHOLD):
+        """One (label, confidence) per text, with label None when confidence is below threshold."""
+        if not texts:
+            return []
+        probs = self.scores(texts)
+        best = probs.argmax(axis=1)
+        results = []
+        for row, column in enumerate(best):
+            confidence = float(probs[row, column])
+            label = self.labels[column] if confidence >= threshold else None
+            results.append((label, confidence))
+        return results
+
+    def save(self, path=CATEGORY_TIER_PATH):
+        with atomic_write(path, "wb") as f:
+            np.savez_compressed(f, labels=np.array(self.labels), centroids=self.centroids,
+                            idf=self.idf, trained_docs=np.array(self.trained_docs))
+
+    @classmethod
+    def load(cls, path=CATEGORY_TIER_PATH):
+        """Load a trained tier, or None if it has not been trained yet."""
+        if not os.path.exists(path):
+            return None
+        try:
+            data = np.load(path)
+            return cls([str(label) for label in data["labels"]], data["centroids"], data["idf"],
+                       int(data["trained_docs"]))
+        except Exception as e:
+            print(f"⚠️ Could not load category tier from {path}: {e}", file=sys.stderr)
+            return None
+
+
+# -------------------- TIERED ASSIGNMENT -------------------- #
+_tier = None
+_tier_loaded = False
+
+
+def get_tier():
+    """The trained tier from CATEGORY_TIER_PATH (loaded once), or None if it was never trained."""
+    global _tier, _tier_loaded
+    if not _tier_loaded:
+        _tier = CentroidClassifier.load()
+        _tier_loaded = True
+    return _tier
+
+
+class TierStats:
+    """What the fast tier decided during one run, and how often it agreed with MNLI."""
+
+    def __init__(self):
+        self.fast_path = 0
+        self.escalated = 0
+        self.audited = 0
+        self.agreed = 0
+
+    def report(self):
+        total = self.fast_path + self.escalated
+        skipped = self.fast_path - self.audited
+        skipped_pct = 100.0 * skipped / total if total else 0.0
+        agreement = f"{100.0 * self.agreed / self.audited:.1f}%" if self.audited else "n/a"
+        return (f"🏷️ Category tier: {skipped}/{total} articles skipped MNLI ({skipped_pct:.1f}%), "
+                f"{self.escalated} escalated; agreement with MNLI on {self.audited} audited: {agreement}")
+
+
+def split_by_confidence(tier, texts, threshold=CATEGORY_TIER_THRESHOLD, audit_rate=CATEGORY_TIER_AUDIT_RATE,
+                        stats=None, rng=random):
+    """
+    Run the fast tier over `texts`. Returns (decided, escalate, audit):
+      decided  - {index: [label]} for confident texts,
+      escalate - indices that need MNLI,
+      audit    - confident indices that should also go to MNLI so agreement can be measured.
+    With no trained tier every text escalates, i.e. behaviour is unchanged.
+    """
+    if tier is None:
+        if stats is not None:
+            stats.escalated += len(texts)
+        return {}, list(range(len(texts))), []
+
+    decided, escalate, audit = {}, [], []
+    for i, (label, _) in enumerate(tier.predict(texts, threshold)):
+        if label is None:
+            escalate.append(i)
+            continue
+        decided[i] = [label]
+        if rng.random() < audit_rate:
+            audit.append(i)
+    if stats is not None:
+        stats.fast_path += len(decided)
+        stats.escalated += len(escalate)
+    return decided, escalate, audit
+
+
+def record_agreement(stats, tier_labels, mnli_labels):
+    """Agreement = the tier's label is among the categories MNLI assigned."""
+    stats.audited += 1
+    if tier_labels[0] in mnli_labels:
+        stats.agreed += 1
+
+
+# -------------------- TRAINING ENTRY POINT -------------------- #
+if __name__ == "__main__":
+    import argparse
+
+    from services.rss_fetcher import TARGET_CATEGORIES, get_collection
+
+    arg_parser = argparse.ArgumentParser(description="Train the fast category tier from stored articles.")
+    arg_parser.add_argument("--limit", type=int, default=50000, help="most recent articles to train on")
+    arg_parser.add_argument("--output", default=CATEGORY_TIER_PATH)
+    args = arg_parser.parse_args()
+
+    cursor = (get_collection()
+              .find({"categories.0": {"$exists": True}}, {"title": 1, "summary": 1, "categories": 1})
+              .sort("publishedAt", -1)
+              .limit(args.limit))
+    texts, label_lists = [], []
+    for doc in cursor:
+        texts.append(f"{doc.get('title', '')}. {doc.get('summary', '')}")
+        label_lists.append(doc.get("categories", []))
+
+    tier = CentroidClassifier.train(TARGET_CATEGORIES, texts, label_lists)
+    tier.save(args.output)
+    print(f"✅ Trained category tier on {len(texts)} articles -> {args.output}", file=sys.stderr)
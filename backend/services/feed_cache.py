@@ -0,0 +1,108 @@
+# File: backend/services/feed_cache.py
+
+import os
+import time
+import hashlib
+import threading
+
+from services.state_store import state_path, load_state, save_state
+
+FEED_CACHE_PATH = os.getenv("RSS_FEED_CACHE_PATH", state_path("feed_cache.json"))
+
+
+def content_hash(body):
+    return hashlib.sha256(body).hexdigest()
+
+
+class FeedCache:
+    """
+    Persistent per-feed HTTP validator cache, keyed by feed URL.
+
+    For every feed we remember the ETag, Last-Modified and a hash of the last body we
+    processed, plus its size and how long it took to parse. On the next run the
+    validators are sent back as If-None-Match / If-Modified-Since; a 304 or a body with
+    the same hash means the feed can be skipped without parsing. The counters record
+    how many bytes and how much parse time that saved during this run.
+    """
+
+    def __init__(self, path=FEED_CACHE_PATH):
+        self.path = path
+        self.entries = load_state(path)
+        self.not_modified = 0
+        self.unchanged = 0
+        self.bytes_saved = 0
+        self.parse_seconds_saved = 0.0
+        # Pipeline stages call is_unchanged/update from several threads.
+        self._lock = threading.Lock()
+
+    def request_headers(self, url):
+        """Conditional GET headers for `url` (empty if we have never seen it)."""
+        entry = self.entries.get(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def all_request_headers(self, urls):
+        """{url: headers} for download_feeds(request_headers=...)."""
+        headers = {}
+        for url in urls:
+            conditional = self.request_headers(url)
+            if conditional:
+                headers[url] = conditional
+        return headers
+
+    def is_unchanged(self, download):
+        """
+        True if `download` carries nothing new: the server answered 304, or the body hashes
+        to what we processed last time. Updates the savings counters when it does.
+        """
+        with self._lock:
+            return self._is_unchanged(download)
+
+    def _is_unchanged(self, download):
+        entry = self.entries.get(download.url)
+        if not entry:
+            return False
+        if download.status == 304:
+            self.not_modified += 1
+            self.bytes_saved += entry.get("size", 0)
+            self.parse_seconds_saved += entry.get("parse_seconds", 0.0)
+            return True
+        if download.ok and content_hash(download.body) == entry.get("hash"):
+            self.unchanged += 1
+            self.parse_seconds_saved += entry.get("parse_seconds", 0.0)
+            # Refresh validators in case the server only now started sending them.
+            self._store_validators(entry, download)
+            return True
+        return False
+
+    def update(self, download, parse_seconds):
+        """Record validators and body hash once a feed has been fully processed."""
+        with self._lock:
+            entry = self.entries.setdefault(download.url, {})
+            entry["hash"] = content_hash(download.body)
+            entry["size"] = len(download.body)
+            entry["parse_seconds"] = round(parse_seconds, 4)
+            self._store_validators(entry, download)
+
+    def _store_validators(self, entry, download):
+        entry["etag"] = download.headers.get("etag")
+        entry["last_modified"] = download.headers.get("last-modified")
+        entry["checked_at"] = time.time()
+
+    def save(self):
+        with self._lock:
+            save_state(self.path, self.entries)
+
+    def stats(self):
+        return {
+            "not_modified": self.not_modified,
+            "unchanged": self.unchanged,
+            "bytes_saved": self.bytes_saved,
+            "parse_seconds_saved": round(self.parse_seconds_saved, 3),
+        }
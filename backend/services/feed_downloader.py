@@ -0,0 +1,175 @@
+# File: backend/services/feed_downloader.py
+
+import os
+import sys
+import time
+import gzip
+import zlib
+import urllib.request
+import urllib.error
+from collections import OrderedDict, deque, Counter
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlparse
+
+# -------------------- DOWNLOAD CONFIGURATION -------------------- #
+# Total sockets open at once, sockets open per host, and the wall-clock budget for a single feed.
+MAX_CONNECTIONS = int(os.getenv("RSS_MAX_CONNECTIONS", "16"))
+PER_HOST_CONNECTIONS = int(os.getenv("RSS_PER_HOST_CONNECTIONS", "2"))
+FEED_TIMEOUT = float(os.getenv("RSS_FEED_TIMEOUT", "10"))
+
+USER_AGENT = "news-aggregator-ai/1.0 (+rss_fetcher)"
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class FeedDownload:
+    """Outcome of downloading one feed: the raw body (or an error) plus timing."""
+
+    def __init__(self, source, url, status=None, body=b"", headers=None, elapsed=0.0, error=None):
+        self.source = source
+        self.url = url
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+        self.elapsed = elapsed
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None and self.status == 200
+
+
+# -------------------- HELPER FUNCTIONS -------------------- #
+def _decode_body(body, headers):
+    """Undo gzip/deflate transfer compression so feedparser sees the raw XML."""
+    encoding = headers.get("content-encoding", "").lower()
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+def _set_read_timeout(response, seconds):
+    """Set the socket timeout of an open urllib response (no-op if the socket is not reachable)."""
+    sock = getattr(getattr(response.fp, "raw", None), "_sock", None)
+    if sock is not None:
+        sock.settimeout(seconds)
+
+
+def download_feed(source, url, timeout=FEED_TIMEOUT, request_headers=None):
+    """
+    Download a single feed, enforcing `timeout` as a deadline for the whole body transfer,
+    not just per socket operation: before every read the socket timeout is cut to the
+    time left, and read1() returns whatever has arrived, so a server dripping a byte at
+    a time cannot stretch the download. Connecting and reading the response headers are
+    bounded by `timeout` per socket operation; DNS resolution is not covered (the
+    resolver call has no timeout).
+    Never raises; failures are reported through FeedDownload.error.
+    """
+    headers = {
+        "User-Agent": USER_AGENT,
+        "Accept-Encoding": "gzip, deflate",
+        "Accept": "application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8",
+    }
+    if request_headers:
+        headers.update(request_headers)
+
+    start_time = time.perf_counter()
+    deadline = start_time + timeout
+    try:
+        request = urllib.request.Request(url, headers=headers)
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            chunks = []
+            while True:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    raise TimeoutError(f"exceeded {timeout:.1f}s feed timeout")
+                _set_read_timeout(response, remaining)
+                chunk = response.read1(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            response_headers = {key.lower(): value for key, value in response.headers.items()}
+            body = _decode_body(b"".join(chunks), response_headers)
+            # Lets feedparser resolve relative links against the feed URL.
+            response_headers.setdefault("content-location", response.geturl())
+            response_headers.pop("content-encoding", None)
+            return FeedDownload(
+                source, url,
+                status=response.status,
+                body=body,
+                headers=response_headers,
+                elapsed=time.perf_counter() - start_time,
+            )
+    except urllib.error.HTTPError as e:
+        response_headers = {key.lower(): value for key, value in e.headers.items()} if e.headers else {}
+        return FeedDownload(
+            source, url,
+            status=e.code,
+            headers=response_headers,
+            elapsed=time.perf_counter() - start_time,
+            error=None if e.code == 304 else f"HTTP {e.code}",
+        )
+    except Exception as e:
+        return FeedDownload(source, url, elapsed=time.perf_counter() - start_time, error=str(e) or type(e).__name__)
+
+
+def download_feeds(feeds, max_connections=MAX_CONNECTIONS, per_host=PER_HOST_CONNECTIONS,
+                   timeout=FEED_TIMEOUT, request_headers=None):
+    """
+    Download every feed in `feeds` ({source: url}) concurrently and yield a FeedDownload
+    as soon as each one finishes, so callers can parse early feeds while slow hosts are
+    still transferring.
+
+    At most `max_connections` downloads run at once and at most `per_host` against any
+    single host. Work is handed out round-robin across hosts, so a host with many feeds
+    (e.g. feeds.reuters.com) never occupies worker threads that are just waiting on it.
+    `request_headers` optionally maps a feed URL to extra headers for that request.
+    """
+    request_headers = request_headers or {}
+    max_connections = max(1, max_connections)
+    per_host = max(1, per_host)
+    pending_by_host = OrderedDict()
+    for source, url in feeds.items():
+        host = urlparse(url).netloc.lower()
+        pending_by_host.setdefault(host, deque()).append((source, url))
+
+    active_by_host = Counter()
+    in_flight = {}
+
+    with ThreadPoolExecutor(max_workers=max_connections) as executor:
+        def fill():
+            submitted = True
+            while submitted and len(in_flight) < max_connections:
+                submitted = False
+                for host, queue in pending_by_host.items():
+                    if len(in_flight) >= max_connections:
+                        break
+                    if queue and active_by_host[host] < per_host:
+                        source, url = queue.popleft()
+                        future = executor.submit(
+                            download_feed, source, url, timeout, request_headers.get(url)
+                        )
+                        in_flight[future] = host
+                        active_by_host[host] += 1
+                        submitted = True
+
+        fill()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                host = in_flight.pop(future)
+                active_by_host[host] -= 1
+                yield future.result()
+            fill()
+
+
+def log_download_timings(downloads, slowest=5):
+    """Print the slowest feeds of a run to stderr."""
+    ranked = sorted(downloads, key=lambda d: d.elapsed, reverse=True)[:slowest]
+    for download in ranked:
+        outcome = download.error or f"HTTP {download.status}"
+        print(f"⏱️ {download.source}: {download.elapsed:.2f}s ({outcome})", file=sys.stderr)
@@ -0,0 +1,180 @@
+# File: backend/services/feed_scheduler.py
+
+import os
+import time
+import calendar
+import threading
+
+from services.state_store import state_path, load_state, save_state
+
+# -------------------- CONFIGURATION -------------------- #
+FEED_SCHEDULE_PATH = os.getenv("RSS_FEED_SCHEDULE_PATH", state_path("feed_schedule.json"))
+# Poll intervals are kept between these bounds (seconds). New feeds start at the default.
+MIN_POLL_INTERVAL = float(os.getenv("RSS_MIN_POLL_INTERVAL", str(5 * 60)))
+MAX_POLL_INTERVAL = float(os.getenv("RSS_MAX_POLL_INTERVAL", str(12 * 3600)))
+DEFAULT_POLL_INTERVAL = float(os.getenv("RSS_DEFAULT_POLL_INTERVAL", str(30 * 60)))
+# Aim for about this many new entries per poll: a feed publishing 6/hour is polled every 20 min.
+TARGET_NEW_PER_POLL = float(os.getenv("RSS_TARGET_NEW_PER_POLL", "2"))
+# Consecutive failures before the circuit opens, and how long it stays open the first time.
+BREAKER_THRESHOLD = int(os.getenv("RSS_BREAKER_THRESHOLD", "5"))
+BREAKER_OPEN_SECONDS = float(os.getenv("RSS_BREAKER_OPEN_SECONDS", str(6 * 3600)))
+MAX_BREAKER_OPEN_SECONDS = 7 * 24 * 3600
+# A feed due this close to now is polled on this run: cron ticks start the fetcher a few
+# seconds apart, and waiting for the next tick would add a whole tick to the interval.
+DUE_SLACK_SECONDS = float(os.getenv("RSS_DUE_SLACK_SECONDS", "30"))
+
+# Weight of the newest rate estimate against the learned one.
+RATE_SMOOTHING = 0.5
+# Each consecutive empty poll stretches the interval by this factor.
+EMPTY_POLL_FACTOR = 1.5
+
+
+def entry_timestamp(entry):
+    """Unix publish (or update) time of a feedparser entry, or None if it has none."""
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if not parsed:
+        return None
+    try:
+        return float(calendar.timegm(parsed))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def entry_timestamps(entries):
+    """Unix publish (or update) times of feedparser entries that carry one."""
+    return [t for t in (entry_timestamp(entry) for entry in entries) if t is not None]
+
+
+class FeedScheduler:
+    """
+    Decides which feeds are worth polling on this run, keyed by feed URL.
+
+    Each feed's publish rate (entries/second) is learned from its entries' timestamps and
+    smoothed across polls; the next poll is scheduled when about TARGET_NEW_PER_POLL new
+    entries are expected. Polls that find nothing new stretch the interval. Failures back
+    off exponentially, and after BREAKER_THRESHOLD in a row the circuit opens: the feed is
+    left alone for BREAKER_OPEN_SECONDS (doubling on every re-trip), then probed once.
+    The next poll is timed from when the run selected the feed (`due_feeds`), not from when
+    its download and parse finished, so a 300s feed is due again on the next 5-minute tick.
+    `clock` returns the current Unix time and can be replaced by a simulated clock.
+    """
+
+    def __init__(self, path=FEED_SCHEDULE_PATH, clock=time.time):
+        self.path = path
+        self.clock = clock
+        self.feeds = load_state(path) if path else {}
+        # url -> when this run selected the feed; outcomes are scheduled from there.
+        self._selected_at = {}
+        self._lock = threading.Lock()
+
+    def _feed(self, url):
+        return self.feeds.setdefault(url, {
+            "rate": None,
+            "interval": DEFAULT_POLL_INTERVAL,
+            "next_poll_at": 0.0,
+            "newest_published": None,
+            "empty_polls": 0,
+            "failures": 0,
+            "circuit": "closed",
+            "trips": 0,
+        })
+
+    # -------------------- SELECTION -------------------- #
+    def is_due(self, url):
+        with self._lock:
+            feed = self.feeds.get(url)
+            return feed is None or feed["next_poll_at"] <= self.clock() + DUE_SLACK_SECONDS
+
+    def due_feeds(self, feeds, force=False):
+        """The subset of `feeds` ({source: url}) that should be polled now (all of them with `force`)."""
+        now = self.clock()
+        due = {source: url for source, url in feeds.items() if force or self.is_due(url)}
+        with self._lock:
+            for url in due.values():
+                self._selected_at[url] = now
+        return due
+
+    def _poll_started(self, url, now):
+        return min(self._selected_at.get(url, now), now)
+
+    # -------------------- OUTCOMES -------------------- #
+    def record_success(self, url, timestamps, new_entries):
+        """
+        A poll that returned a parsed feed; `timestamps` are its entries' publish times and
+        `new_entries` how many of its entries had not been seen before. The poll counts as
+        empty by that count, not by the timestamps, so feeds without dates back off correctly.
+        """
+        with self._lock:
+            now = self.clock()
+            feed = self._feed(url)
+            feed["failures"] = 0
+            feed["circuit"] = "closed"
+            feed["trips"] = 0
+            feed["last_polled_at"] = now
+
+            # Timestamps in the future are clock skew on the publisher's side.
+            timestamps = [min(t, now) for t in timestamps]
+            newest = max(timestamps) if timestamps else None
+            previous_newest = feed["newest_published"]
+            if newest is not None:
+                feed["newest_published"] = max(newest, previous_newest or newest)
+
+            if timestamps:
+                # Entries per second over the window the feed covers, up to now, so a feed that
+                # has gone quiet decays instead of keeping its old rate forever.
+                span = max(now - min(timestamps), MIN_POLL_INTERVAL)
+                observed = len(timestamps) / span
+                feed["rate"] = observed if feed["rate"] is None else (
+                    RATE_SMOOTHING * observed + (1 - RATE_SMOOTHING) * feed["rate"]
+                )
+
+            feed["empty_polls"] = 0 if new_entries else feed["empty_polls"] + 1
+            self._schedule(feed, self._poll_started(url, now))
+
+    def record_unchanged(self, url):
+        """A poll that came back 304 / byte-identical: nothing new, so treat it as empty."""
+        with self._lock:
+            now = self.clock()
+            feed = self._feed(url)
+            feed["failures"] = 0
+            feed["circuit"] = "closed"
+            feed["trips"] = 0
+            feed["last_polled_at"] = now
+            feed["empty_polls"] += 1
+            self._schedule(feed, self._poll_started(url, now))
+
+    def record_failure(self, url, error=None):
+        """A poll that failed (HTTP error, timeout, unparseable feed)."""
+        with self._lock:
+            now = self.clock()
+            feed = self._feed(url)
+            feed["failures"] += 1
+            feed["last_polled_at"] = now
+            feed["last_error"] = error
+            if feed["failures"] >= BREAKER_THRESHOLD:
+                feed["circuit"] = "open"
+                feed["trips"] += 1
+                wait = min(BREAKER_OPEN_SECONDS * 2 ** (feed["trips"] - 1), MAX_BREAKER_OPEN_SECONDS)
+            else:
+                wait = min(MIN_POLL_INTERVAL * 2 ** feed["failures"], MAX_POLL_INTERVAL)
+            feed["next_poll_at"] = self._poll_started(url, now) + wait
+
+    def _schedule(self, feed, started):
+        if feed["rate"]:
+            interval = TARGET_NEW_PER_POLL / feed["rate"]
+        else:
+            interval = DEFAULT_POLL_INTERVAL
+        interval *= EMPTY_POLL_FACTOR ** feed["empty_polls"]
+        feed["interval"] = min(max(interval, MIN_POLL_INTERVAL), MAX_POLL_INTERVAL)
+        feed["next_poll_at"] = started + feed["interval"]
+
+    # -------------------- PERSISTENCE / REPORTING -------------------- #
+    def save(self):
+        if self.path:
+            with self._lock:
+                save_state(self.path, self.feeds)
+
+    def report(self, polled, total):
+        with self._lock:
+            open_circuits = sum(1 for feed in self.feeds.values() if feed["circuit"] == "open")
+        return f"🗓️ Scheduler: polled {polled}/{total} feeds this run; {open_circuits} circuit(s) open"
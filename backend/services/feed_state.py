@@ -0,0 +1,105 @@
+# File: backend/services/feed_state.py
+
+import os
+import time
+import hashlib
+import threading
+
+from services.state_store import state_path, load_state, save_state
+from services.feed_scheduler import entry_timestamp
+
+# -------------------- CONFIGURATION -------------------- #
+FEED_STATE_PATH = os.getenv("RSS_FEED_STATE_PATH", state_path("feed_state.json"))
+# Entries up to this much older than a feed's high-water mark still count as new, so
+# publishers with skewed clocks or late, back-dated posts are not lost.
+CLOCK_SKEW_SECONDS = float(os.getenv("RSS_CLOCK_SKEW_SECONDS", str(2 * 3600)))
+# Entry keys remembered per feed (a few feed windows' worth).
+RECENT_KEYS = int(os.getenv("RSS_RECENT_ENTRY_KEYS", "300"))
+
+
+def entry_key(entry):
+    """Stable identity of a feed entry: its id/guid, else its link, else a content hash."""
+    if entry.get("id"):
+        return "id:" + entry["id"]
+    if entry.get("link"):
+        return "link:" + entry["link"]
+    content = "\x1f".join(str(entry.get(field, "")) for field in ("title", "summary", "published"))
+    return "hash:" + hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+class FeedState:
+    """
+    Per-feed high-water marks, keyed by feed URL, so a poll only hands on entries it has
+    not processed before.
+
+    Each feed remembers the newest publish time it has processed (the mark) and the keys
+    of its most recent entries, with their publish times. An entry whose key is not
+    remembered is new, unless it is no newer than the newest key already forgotten
+    (`covered_from`): then keys cannot tell, and it must also not be older than the mark
+    minus CLOCK_SKEW_SECONDS. So items that show up late (e.g. a Hacker News front page)
+    are kept however old they are, as long as the remembered keys still cover their
+    publish time. Entries without a timestamp are judged by key alone. Keys come from
+    guid/link rather than content, so an older
+    item that the publisher edits (new title, bumped <updated>) is not processed again,
+    and publish times in the future are clamped to now before they can raise the mark.
+    """
+
+    def __init__(self, path=FEED_STATE_PATH, clock=time.time):
+        self.path = path
+        self.clock = clock
+        self.feeds = load_state(path) if path else {}
+        self._lock = threading.Lock()
+
+    def new_entries(self, url, entries):
+        """The entries of `entries` that are past this feed's mark, in feed order."""
+        with self._lock:
+            state = self.feeds.get(url)
+        if not state:
+            return list(entries)
+        recent = set(state.get("recent", []))
+        mark = state.get("mark")
+        # State written before keys carried publish times: nothing up to the mark is covered.
+        covered_from = state.get("covered_from", mark)
+        fresh = []
+        for entry in entries:
+            if entry_key(entry) in recent:
+                continue
+            published = entry_timestamp(entry)
+            beyond_keys = covered_from is not None and published is not None and published <= covered_from
+            if beyond_keys and mark is not None and published < mark - CLOCK_SKEW_SECONDS:
+                continue
+            fresh.append(entry)
+        return fresh
+
+    def mark(self, url, entries):
+        """Record `entries` (everything the poll looked at) as processed and advance the mark."""
+        now = self.clock()
+        keys = [entry_key(entry) for entry in entries]
+        published = {}
+        for key, entry in zip(keys, entries):
+            timestamp = entry_timestamp(entry)
+            if timestamp is not None:
+                published[key] = min(timestamp, now)
+        with self._lock:
+            state = self.feeds.setdefault(url, {"mark": None, "recent": [], "published": {}, "covered_from": None})
+            state.setdefault("covered_from", state["mark"])
+            if published:
+                newest = max(published.values())
+                state["mark"] = newest if state["mark"] is None else max(state["mark"], newest)
+            # Keys from this poll go last, so the feed's current window is never the part evicted.
+            current = set(keys)
+            recent = [key for key in state["recent"] if key not in current] + keys
+            remembered = {**state.get("published", {}), **published}
+            for key in recent[:-RECENT_KEYS]:
+                # An evicted key can no longer vouch for its entry: raise the covered floor past it.
+                timestamp = remembered.get(key)
+                if timestamp is not None and (state["covered_from"] is None or timestamp > state["covered_from"]):
+                    state["covered_from"] = timestamp
+            state["recent"] = recent[-RECENT_KEYS:]
+            state["published"] = {key: remembered[key] for key in state["recent"] if key in remembered}
+            state["updated_at"] = now
+
+    def save(self):
+        if self.path:
+            with self._lock:
+                save_state(self.path, self.feeds)
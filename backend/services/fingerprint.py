@@ -0,0 +1,72 @@
+# File: backend/services/fingerprint.py
+
+import re
+import html
+import hashlib
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+# Query parameters that only carry tracking/campaign info and never change the article.
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "ref", "ref_src", "referrer",
+    "cmpid", "cmp", "ito", "taid", "ocid", "smid", "smtyp", "s_cid", "mbid", "rss", "source",
+    "sr_share", "guccounter", "_ga", "amp", "outputtype",
+}
+TRACKING_PREFIXES = ("utm_", "ns_", "at_", "pk_", "mkt_")
+
+# Host prefixes that point at the same article as the bare domain.
+HOST_PREFIXES = ("www.", "amp.", "m.", "mobile.")
+
+# Below this many normalized words a title+summary is too generic to identify a story.
+MIN_CONTENT_WORDS = 8
+
+
+def canonicalize_url(url):
+    """
+    Reduce an article URL (as returned by sanitize_url) to a canonical form so that the
+    same story reached via http/https, www/amp/mobile hosts, AMP paths, tracking
+    parameters or fragments maps to one key. Returns None for empty input.
+    """
+    if not url:
+        return None
+    parsed = urlparse(url.strip())
+    if not parsed.netloc:
+        return None
+
+    host = (parsed.hostname or "").lower()
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix) and host.count(".") > 1:
+            host = host[len(prefix):]
+            break
+    if parsed.port and parsed.port not in (80, 443):
+        host = f"{host}:{parsed.port}"
+
+    path = re.sub(r"/{2,}", "/", parsed.path or "/")
+    # AMP variants: /amp/story, /story/amp, /story.amp, /story.amp.html
+    path = re.sub(r"^/amp(?=/)", "", path)
+    path = re.sub(r"/amp/?$", "", path)
+    path = re.sub(r"\.amp(?=\.html?$|$)", "", path)
+    if len(path) > 1:
+        path = path.rstrip("/")
+    path = path or "/"
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunparse(("https", host, path, "", urlencode(query), ""))
+
+
+def normalize_content(title, summary):
+    """Lowercase title + summary with HTML, entities and punctuation stripped."""
+    text = f"{title or ''} {summary or ''}"
+    text = html.unescape(re.sub(r"<[^>]*>", " ", text))
+    return " ".join(re.findall(r"[a-z0-9]+", text.lower()))
+
+
+def content_hash(title, summary):
+    """Stable hash of the normalized title and summary, or None if the text is too short to trust."""
+    normalized = normalize_content(title, summary)
+    if len(normalized.split()) < MIN_CONTENT_WORDS:
+        return None
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
@@ -0,0 +1,117 @@
+# File: backend/services/html_extract.py
+
+import re
+from html.parser import HTMLParser
+
+# Tags whose boundaries separate words ("<p>a</p><p>b</p>" is "a b", not "ab").
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "figcaption",
+    "figure", "footer", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav",
+    "ol", "p", "pre", "section", "table", "td", "th", "tr", "ul",
+}
+# Tags whose content is never readable text.
+SKIP_TAGS = {"script", "style", "template", "noscript"}
+
+WHITESPACE_RE = re.compile(r"\s+")
+# Lowercased words; the keyword extractor keeps the ones with MIN_KEYWORD_LENGTH (3)+ letters.
+TOKEN_RE = re.compile(r"\b[a-z]+\b")
+
+
+class ExtractedHtml:
+    """Everything the ingest path needs from one HTML fragment, from a single parse."""
+
+    __slots__ = ("text", "first_image", "tokens")
+
+    def __init__(self, text, first_image, tokens):
+        self.text = text
+        self.first_image = first_image
+        self.tokens = tokens
+
+
+class _SinglePassParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.first_image = None
+        self.seen_image = False
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "img" and not self.seen_image:
+            # Same result as BeautifulSoup(html, "html.parser").find("img").get("src"):
+            # only the first <img> counts, a repeated attribute keeps its last value and a
+            # bare `src` is "".
+            self.seen_image = True
+            src = dict(attrs).get("src")
+            self.first_image = src or None
+        if tag in SKIP_TAGS:
+            self.skip_depth += 1
+        elif tag in BLOCK_TAGS:
+            self.parts.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+        elif tag in BLOCK_TAGS:
+            self.parts.append(" ")
+
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.parts.append(data)
+
+
+def _from_text(text):
+    text = WHITESPACE_RE.sub(" ", text).strip()
+    return ExtractedHtml(text, None, TOKEN_RE.findall(text.lower()))
+
+
+def extract_html(markup):
+    """
+    Parse an HTML fragment once and return its plain text (entities decoded, whitespace
+    collapsed), the src of its first <img> (or None) and its lowercased word tokens.
+    Markup without tags or entities skips the parser entirely.
+    """
+    if not markup:
+        return ExtractedHtml("", None, [])
+    if "<" not in markup and "&" not in markup:
+        return _from_text(markup)
+
+    parser = _SinglePassParser()
+    try:
+        parser.feed(markup)
+        parser.close()
+    except Exception:
+        # HTMLParser is very lenient; anything it still rejects is treated as plain text.
+        return _from_text(markup)
+    extracted = _from_text("".join(parser.parts))
+    extracted.first_image = parser.first_image
+    return extracted
+
+
+def field_html(value):
+    """A feed field (string, or feedparser's list of content dicts) as one HTML string."""
+    if isinstance(value, list):
+        if all(isinstance(item, dict) for item in value):
+            return " ".join(item.get("value", "") for item in value)
+        return " ".join(str(item) for item in value)
+    return value if isinstance(value, str) else ""
+
+
+class EntryHtml:
+    """
+    The parsed HTML fields of one feed entry: `content` (content:encoded / content, or
+    None when the entry has none) and `summary`. Identical fields are parsed only once.
+    """
+
+    __slots__ = ("content", "summary")
+
+    def __init__(self, entry):
+        content_html = field_html(entry.get("content:encoded") or entry.get("content"))
+        summary_html = field_html(entry.get("summary"))
+        self.summary = extract_html(summary_html)
+        if not content_html:
+            self.content = None
+        elif content_html == summary_html:
+            self.content = self.summary
+        else:
+            self.content = extract_html(content_html)
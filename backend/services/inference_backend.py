@@ -0,0 +1,88 @@
+# File: backend/services/inference_backend.py
+
+import os
+import re
+import sys
+
+from services.state_store import state_path
+
+# -------------------- CONFIGURATION -------------------- #
+# How the BART pipelines run:
+#   torch - fp32 PyTorch (GPU when available), the original behaviour
+#   int8  - PyTorch with nn.Linear layers dynamically quantized to int8 (CPU)
+#   onnx  - ONNX Runtime via optimum (CPU); checkpoints are exported once and reused
+# SUMMARIZER_BACKEND / CLASSIFIER_BACKEND override it per model.
+INFERENCE_BACKEND = os.getenv("INFERENCE_BACKEND", "torch").lower()
+BACKENDS = ("torch", "int8", "onnx")
+# Exported ONNX models are written here (one directory per model).
+ONNX_EXPORT_DIR = os.getenv("ONNX_EXPORT_DIR", state_path("onnx"))
+
+# transformers task -> optimum ORTModel class name
+ORT_MODEL_CLASSES = {
+    "summarization": "ORTModelForSeq2SeqLM",
+    "zero-shot-classification": "ORTModelForSequenceClassification",
+}
+
+
+def backend_for(model_env):
+    """Backend for one model: its own override (e.g. SUMMARIZER_BACKEND), else INFERENCE_BACKEND."""
+    backend = os.getenv(model_env, INFERENCE_BACKEND).lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown inference backend '{backend}' (expected one of {', '.join(BACKENDS)})")
+    return backend
+
+
+def _quantize_int8(model):
+    import torch
+
+    model.eval()
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def _onnx_model(task, model_name):
+    """Load an exported ONNX model, exporting (and saving) it on first use."""
+    import optimum.onnxruntime as ort
+
+    model_class = getattr(ort, ORT_MODEL_CLASSES[task])
+    if os.path.isdir(model_name) and any(name.endswith(".onnx") for name in os.listdir(model_name)):
+        return model_class.from_pretrained(model_name)
+
+    export_dir = os.path.join(ONNX_EXPORT_DIR, re.sub(r"[^A-Za-z0-9_.-]+", "--", model_name.strip("/")))
+    if os.path.isdir(export_dir) and any(name.endswith(".onnx") for name in os.listdir(export_dir)):
+        return model_class.from_pretrained(export_dir)
+
+    print(f"📦 Exporting {model_name} to ONNX in {export_dir} (first use only)", file=sys.stderr)
+    model = model_class.from_pretrained(model_name, export=True)
+    model.save_pretrained(export_dir)
+    return model
+
+
+def load_pipeline(task, model_name, backend, device=-1):
+    """
+    Build a transformers pipeline for `task` on the given backend (see BACKENDS).
+    `device` (pipeline convention: 0 = GPU, -1 = CPU) only applies to the torch backend.
+    """
+    from transformers import pipeline, AutoTokenizer
+
+    if backend == "torch":
+        return pipeline(task, model=model_name, device=device)
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    if backend == "int8":
+        from transformers import AutoModelForSeq2SeqLM, AutoModelForSequenceClassification
+
+        model_class = AutoModelForSeq2SeqLM if task == "summarization" else AutoModelForSequenceClassification
+        model = _quantize_int8(model_class.from_pretrained(model_name))
+    else:
+        model = _onnx_model(task, model_name)
+    # Quantized and ONNX Runtime models run on the CPU.
+    return pipeline(task, model=model, tokenizer=tokenizer, device=-1)
+
+
+def is_torch_module(model):
+    """False for ONNX Runtime models, whose sessions must not be shared across fork."""
+    try:
+        import torch
+    except ImportError:
+        return False
+    return isinstance(model, torch.nn.Module)
@@ -0,0 +1,150 @@
+# File: backend/services/inference_pool.py
+
+import os
+import gc
+import sys
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from services import model_registry
+from services.inference_backend import is_torch_module
+
+# -------------------- CONFIGURATION -------------------- #
+# Number of inference processes; 1 keeps inference in-process (no pool).
+INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", "1"))
+# Torch intra-op threads per worker; 0 splits the machine's cores evenly between workers.
+TORCH_THREADS_PER_WORKER = int(os.getenv("TORCH_THREADS_PER_WORKER", "0"))
+# Smallest slice of a request handed to one worker, so each still runs a real batch.
+MIN_CHUNK = int(os.getenv("INFERENCE_MIN_CHUNK", "4"))
+
+POOLED_MODELS = ("summarizer", "classifier")
+
+
+# -------------------- WORKER SIDE -------------------- #
+def _init_worker(threads):
+    import torch
+
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # already fixed for this process
+
+    # A SQLite connection must not be shared across fork: give the child its own cache handle.
+    from services.summarization import summarizer
+    summarizer.summary_cache = summarizer.SummaryCache()
+
+
+def _ready(_):
+    return os.getpid()
+
+
+def _summarize_chunk(args):
+    from services.summarization.summarizer import summarize_batch
+    texts, options = args
+    return summarize_batch(texts, **options)
+
+
+def _classify_chunk(args):
+    from services.zero_shot import classify_batch
+    texts, labels = args
+    return classify_batch(model_registry.get("classifier"), texts, labels)
+
+
+# -------------------- POOL -------------------- #
+def _split(items, parts):
+    """Contiguous, near-equal chunks (no smaller than MIN_CHUNK unless there is less input)."""
+    parts = max(1, min(parts, len(items) // MIN_CHUNK or 1))
+    size, extra = divmod(len(items), parts)
+    chunks, start = [], 0
+    for n in range(parts):
+        end = start + size + (1 if n < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+class InferencePool:
+    """
+    Multi-process summarization/classification that loads the model weights only once.
+
+    The models are loaded in the parent and put in eval mode, then `gc.freeze()` moves
+    every existing object out of the collector's reach, and the workers are forked.
+    Tensor storage lives outside Python objects, so workers share the parent's weight
+    pages copy-on-write and N workers cost roughly one copy of the weights plus their
+    activations. Each worker is pinned to `threads` torch intra-op threads so workers do
+    not oversubscribe the cores.
+
+    Must be started before the process runs any inference itself (torch's OpenMP pool
+    is not fork-safe once it has spun up) and before the ingest pipeline starts threads.
+
+    If a worker dies (e.g. killed by the OOM killer), the call in progress and every
+    later one raise BrokenProcessPool instead of waiting forever, so the caller fails
+    that batch.
+    """
+
+    def __init__(self, workers=INFERENCE_WORKERS, threads_per_worker=TORCH_THREADS_PER_WORKER, models=POOLED_MODELS):
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("InferencePool needs the 'fork' start method to share model weights")
+
+        self.workers = max(1, workers)
+        self.threads = threads_per_worker or max(1, (os.cpu_count() or 1) // self.workers)
+
+        model_registry.preload(*models)
+        for name in models:
+            model = model_registry.get(name).model
+            if not is_torch_module(model):
+                raise RuntimeError(f"InferencePool needs torch models; '{name}' runs on ONNX Runtime")
+            model.eval()
+            for parameter in model.parameters():
+                parameter.requires_grad_(False)
+        gc.collect()
+        gc.freeze()
+
+        self._executor = ProcessPoolExecutor(
+            self.workers, mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker, initargs=(self.threads,),
+        )
+        # The executor forks on first use: do it now, while this process has no other threads.
+        list(self._executor.map(_ready, range(self.workers)))
+        print(f"🧵 Inference pool: {self.workers} workers x {self.threads} torch threads", file=sys.stderr)
+
+    def summarize_batch(self, texts, **options):
+        """summarize_batch (same keyword options) spread over the workers; results in input order."""
+        if not texts:
+            return []
+        chunks = [(chunk, options) for chunk in _split(list(texts), self.workers)]
+        results = self._executor.map(_summarize_chunk, chunks)
+        return [summary for chunk in results for summary in chunk]
+
+    def classify_batch(self, texts, labels):
+        """zero_shot.classify_batch spread over the workers; results in input order."""
+        if not texts:
+            return []
+        chunks = [(chunk, list(labels)) for chunk in _split(list(texts), self.workers)]
+        results = self._executor.map(_classify_chunk, chunks)
+        return [scores for chunk in results for scores in chunk]
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        gc.unfreeze()
+
+
+_pool = None
+
+
+def start_pool(models=POOLED_MODELS):
+    """Start the shared pool once if INFERENCE_WORKERS > 1; returns it (or None)."""
+    global _pool
+    if _pool is None and INFERENCE_WORKERS > 1:
+        try:
+            _pool = InferencePool(models=models)
+        except RuntimeError as e:
+            # ONNX Runtime sessions are not fork-safe; they use their own intra-op threads instead.
+            print(f"⚠️ Inference pool disabled, running in-process: {e}", file=sys.stderr)
+    return _pool
+
+
+def active_pool():
+    """The running pool, or None when inference should stay in-process."""
+    return _pool
@@ -0,0 +1,74 @@
+# File: backend/services/ingest_worker.py
+
+import os
+import sys
+import json
+import socket
+import threading
+import socketserver
+
+# Where a warm rss_fetcher worker listens (localhost only).
+WORKER_HOST = os.getenv("RSS_WORKER_HOST", "127.0.0.1")
+WORKER_PORT = int(os.getenv("RSS_WORKER_PORT", "8765"))
+CONNECT_TIMEOUT = 1.0
+
+
+def serve(handler, host=WORKER_HOST, port=WORKER_PORT):
+    """
+    Run a long-lived worker that answers one JSON request per connection with
+    `handler(request) -> response dict`. Jobs never overlap: a request that arrives while
+    another is running is answered with {"ok": False, "error": "busy"} instead of queueing,
+    so a slow cycle cannot pile up cron invocations behind it.
+    """
+    job_lock = threading.Lock()
+
+    class RequestHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            line = self.rfile.readline()
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                response = {"ok": False, "error": f"Invalid request: {e}"}
+            else:
+                if request.get("cmd") == "ping":
+                    response = {"ok": True}
+                elif not job_lock.acquire(blocking=False):
+                    response = {"ok": False, "error": "busy"}
+                else:
+                    try:
+                        response = handler(request)
+                    except Exception as e:
+                        print(f"❌ Worker job failed: {e}", file=sys.stderr)
+                        response = {"ok": False, "error": str(e)}
+                    finally:
+                        job_lock.release()
+            self.wfile.write((json.dumps(response, default=str) + "\n").encode("utf-8"))
+
+    socketserver.ThreadingTCPServer.allow_reuse_address = True
+    with socketserver.ThreadingTCPServer((host, port), RequestHandler) as server:
+        server.daemon_threads = True
+        print(f"🔥 Warm worker listening on {host}:{port}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("Worker: KeyboardInterrupt received, shutting down gracefully.", file=sys.stderr)
+
+
+def submit(request, host=WORKER_HOST, port=WORKER_PORT):
+    """
+    Send `request` to a running worker and wait for its response.
+    Returns None if no worker is listening, so the caller can fall back to running the job itself.
+    """
+    try:
+        connection = socket.create_connection((host, port), timeout=CONNECT_TIMEOUT)
+    except OSError:
+        return None
+
+    with connection:
+        connection.settimeout(None)  # jobs can legitimately take minutes
+        connection.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        with connection.makefile("rb") as reader:
+            line = reader.readline()
+    if not line:
+        return {"ok": False, "error": "worker closed the connection"}
+    return json.loads(line)
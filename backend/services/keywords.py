@@ -0,0 +1,176 @@
+# File: backend/services/keywords.py
+
+import os
+import sys
+import threading
+
+import numpy as np
+
+from services import model_registry
+from services.state_store import state_path, atomic_write
+
+# -------------------- CONFIGURATION -------------------- #
+KEYWORD_DF_PATH = os.getenv("KEYWORD_DF_PATH", state_path("keyword_df.npz"))
+# Terms kept in the persisted vocabulary; the rarest are pruned when it grows past this.
+KEYWORD_MAX_VOCAB = int(os.getenv("KEYWORD_MAX_VOCAB", "500000"))
+MIN_KEYWORD_LENGTH = 3
+
+# English function words; never a useful keyword. The category tier (services/category_tier.py)
+# drops the same words.
+STOPWORDS = set("""
+a about above according across after afterwards again against ago all almost along already also
+although always am among an and another any anyone anything are around as at back be became
+because become been before being below between beyond both but by can cannot could did do does
+doing done down during each either else enough even ever every few for former from further get
+gets getting given gives go going gone got had has have having he her here hers herself him
+himself his how however i if in including into is it its itself just least less let like made
+make makes many may me might more most mostly much must my myself near nearly need never new
+next no nor not now of off often on once only onto or other others our ours out over own per
+perhaps put quite rather really said same say says see seen several she should since so some
+something still such take than that the their theirs them themselves then there these they
+thing things this those though through thus to together told too under until up upon us use
+used very via want was way we well were what whatever when where whether which while who whole
+whom whose why will with within without would yet you your yours yourself
+""".split())
+# News boilerplate and time words: noise as keywords, but still a signal for categories.
+KEYWORD_STOPWORDS = STOPWORDS | set("""
+news latest today year years first last one two three show read reading click continue full
+story article image images photo video watch getty reuters subscribe newsletter sign copyright
+rights reserved
+""".split())
+
+
+def keyword_tokens(tokens):
+    """Tokens that may become keywords: long enough and not a stopword."""
+    return [token for token in tokens if len(token) >= MIN_KEYWORD_LENGTH and token not in KEYWORD_STOPWORDS]
+
+
+class KeywordEngine:
+    """
+    TF-IDF keyword extraction against document frequencies of everything ingested so far.
+
+    The vocabulary is a term -> id dict over a growable NumPy array of document counts,
+    persisted as one compressed .npz (terms joined into a single byte string). `observe`
+    adds a feed's articles to the counts; `score_batch` ranks the keywords of every
+    article in one vectorized pass.
+    """
+
+    def __init__(self, terms=(), doc_freq=None, total_docs=0, path=KEYWORD_DF_PATH):
+        self.path = path
+        self.terms = list(terms)
+        self.vocab = {term: index for index, term in enumerate(self.terms)}
+        self.doc_freq = np.zeros(max(1024, 2 * len(self.terms)), dtype=np.int64)
+        if doc_freq is not None:
+            self.doc_freq[:len(doc_freq)] = doc_freq
+        self.total_docs = int(total_docs)
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    # -------------------- DOCUMENT FREQUENCIES -------------------- #
+    def _term_id(self, term):
+        index = self.vocab.get(term)
+        if index is None:
+            index = len(self.terms)
+            self.vocab[term] = index
+            self.terms.append(term)
+            if index >= len(self.doc_freq):
+                grown = np.zeros(2 * len(self.doc_freq), dtype=np.int64)
+                grown[:len(self.doc_freq)] = self.doc_freq
+                self.doc_freq = grown
+        return index
+
+    def observe(self, token_lists):
+        """Count each article's distinct keyword tokens once towards document frequency."""
+        with self._lock:
+            ids = [self._term_id(term) for tokens in token_lists for term in set(keyword_tokens(tokens))]
+            if ids:
+                np.add.at(self.doc_freq, np.array(ids, dtype=np.int64), 1)
+            self.total_docs += len(token_lists)
+            self._dirty = True
+
+    # -------------------- SCORING -------------------- #
+    def score_batch(self, token_lists, num_keywords=5):
+        """
+        Top `num_keywords` keywords per article by TF-IDF ((1 + log tf) * smoothed idf).
+        Terms the corpus has never seen count as df 0. Ties keep first-seen order.
+        """
+        columns, doc_ids, column_terms = {}, [], []
+        for doc_id, tokens in enumerate(token_lists):
+            for term in keyword_tokens(tokens):
+                column = columns.get(term)
+                if column is None:
+                    column = columns[term] = len(column_terms)
+                    column_terms.append(term)
+                doc_ids.append((doc_id, column))
+        keywords = [[] for _ in token_lists]
+        if not doc_ids:
+            return keywords
+
+        with self._lock:
+            df = np.array([self.doc_freq[self.vocab[term]] if term in self.vocab else 0 for term in column_terms],
+                          dtype=np.float64)
+            total_docs = self.total_docs
+        idf = np.log((1.0 + total_docs) / (1.0 + df)) + 1.0
+
+        pairs = np.array(doc_ids, dtype=np.int64)
+        width = len(column_terms)
+        unique_pairs, counts = np.unique(pairs[:, 0] * width + pairs[:, 1], return_counts=True)
+        docs, cols = unique_pairs // width, unique_pairs % width
+        scores = (1.0 + np.log(counts)) * idf[cols]
+
+        # Sort by article, then descending score, then first appearance; keep each article's first k.
+        order = np.lexsort((cols, -scores, docs))
+        docs, cols = docs[order], cols[order]
+        group_starts = np.flatnonzero(np.r_[True, docs[1:] != docs[:-1]])
+        group_sizes = np.diff(np.r_[group_starts, len(docs)])
+        ranks = np.arange(len(docs)) - np.repeat(group_starts, group_sizes)
+        for doc_id, column in zip(docs[ranks < num_keywords], cols[ranks < num_keywords]):
+            keywords[doc_id].append(column_terms[column])
+        return keywords
+
+    def extract_batch(self, token_lists, num_keywords=5):
+        """Observe a feed's articles, then score all of them in one pass."""
+        self.observe(token_lists)
+        return self.score_batch(token_lists, num_keywords)
+
+    # -------------------- PERSISTENCE -------------------- #
+    def save(self):
+        """Atomically persist the counts (pruning the rarest terms past KEYWORD_MAX_VOCAB)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            terms = self.terms
+            doc_freq = self.doc_freq[:len(terms)]
+            if len(terms) > KEYWORD_MAX_VOCAB:
+                keep = np.sort(np.argsort(-doc_freq, kind="stable")[:KEYWORD_MAX_VOCAB])
+                terms = [terms[index] for index in keep]
+                doc_freq = doc_freq[keep]
+                self.terms = terms
+                self.vocab = {term: index for index, term in enumerate(terms)}
+                self.doc_freq = np.zeros(max(1024, 2 * len(terms)), dtype=np.int64)
+                self.doc_freq[:len(terms)] = doc_freq
+            joined = np.frombuffer("\n".join(terms).encode("utf-8"), dtype=np.uint8)
+            with atomic_write(self.path, "wb") as f:
+                np.savez_compressed(f, terms=joined, doc_freq=doc_freq, total_docs=np.array(self.total_docs))
+            self._dirty = False
+
+    @classmethod
+    def load(cls, path=KEYWORD_DF_PATH):
+        """Load persisted counts, or start an empty corpus if there are none (or they are unreadable)."""
+        if not os.path.exists(path):
+            return cls(path=path)
+        try:
+            data = np.load(path)
+            joined = data["terms"].tobytes().decode("utf-8")
+            terms = joined.split("\n") if joined else []
+            return cls(terms, data["doc_freq"], int(data["total_docs"]), path)
+        except Exception as e:
+            print(f"⚠️ Could not load keyword document frequencies from {path}, starting fresh: {e}", file=sys.stderr)
+            return cls(path=path)
+
+
+model_registry.register("keywords", KeywordEngine.load)
+
+
+def get_keyword_engine():
+    return model_registry.get("keywords")
@@ -0,0 +1,210 @@
+# File: backend/services/metrics.py
+
+import os
+import sys
+import time
+import json
+import pstats
+import cProfile
+import threading
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from services.state_store import state_path, atomic_write
+
+# -------------------- CONFIGURATION -------------------- #
+# Per-run report; a .prom path writes Prometheus text format (node_exporter textfile
+# collector), anything else JSON. An empty value disables the report.
+METRICS_PATH = os.getenv("RSS_METRICS_PATH", state_path("ingest_metrics.json"))
+# Opt-in cProfile of every pipeline thread, merged into one .prof (snakeviz / pstats).
+PROFILE = os.getenv("RSS_PROFILE", "").lower() in ("1", "true", "yes")
+PROFILE_PATH = os.getenv("RSS_PROFILE_PATH", state_path("ingest.prof"))
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def percentile(sorted_values, fraction):
+    """Linear-interpolated percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+class Histogram:
+    """Every observation of one run (a cycle is at most a few thousand per stage)."""
+
+    def __init__(self):
+        self.values = []
+
+    def observe(self, value):
+        self.values.append(value)
+
+    def summary(self):
+        values = sorted(self.values)
+        result = {"count": len(values), "sum": round(sum(values), 6), "max": round(values[-1], 6) if values else 0.0}
+        for q in QUANTILES:
+            result[f"p{int(q * 100)}"] = round(percentile(values, q), 6)
+        return result
+
+
+class RunMetrics:
+    """
+    Timing histograms for one ingest cycle, by stage and by (source, stage), plus counters.
+    Stage functions call observe()/timer() from any thread; write() saves the report.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.started_at = datetime.now(timezone.utc)
+        self.wall_seconds = 0.0
+        self.stages = defaultdict(Histogram)
+        self.sources = defaultdict(lambda: defaultdict(Histogram))
+        self.counters = Counter()
+        self._lock = threading.Lock()
+
+    def observe(self, stage, seconds, source=None):
+        with self._lock:
+            self.stages[stage].observe(seconds)
+            if source is not None:
+                self.sources[source][stage].observe(seconds)
+
+    @contextmanager
+    def timer(self, stage, source=None):
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start_time, source)
+
+    def report(self):
+        with self._lock:
+            return {
+                "run": self.name,
+                "started_at": self.started_at.isoformat(),
+                "wall_seconds": round(self.wall_seconds, 3),
+                "stages": {stage: hist.summary() for stage, hist in sorted(self.stages.items())},
+                "sources": {
+                    source: {stage: hist.summary() for stage, hist in sorted(stages.items())}
+                    for source, stages in sorted(self.sources.items())
+                },
+                "counters": dict(self.counters),
+            }
+
+    def to_prometheus(self):
+        """The report as Prometheus text exposition format (summaries + counters)."""
+        report = self.report()
+        prefix = f"rss_{self.name}"
+        lines = [f"# TYPE {prefix}_stage_seconds summary"]
+        for stage, summary in report["stages"].items():
+            lines.extend(_summary_lines(f"{prefix}_stage_seconds", {"stage": stage}, summary))
+        lines.append(f"# TYPE {prefix}_source_stage_seconds summary")
+        for source, stages in report["sources"].items():
+            for stage, summary in stages.items():
+                lines.extend(_summary_lines(f"{prefix}_source_stage_seconds", {"source": source, "stage": stage}, summary))
+        lines.append(f"# TYPE {prefix}_events_total counter")
+        for key, value in sorted(report["counters"].items()):
+            lines.append(f"{prefix}_events_total{_labels({'event': key})} {value}")
+        lines.append(f"# TYPE {prefix}_wall_seconds gauge")
+        lines.append(f"{prefix}_wall_seconds {report['wall_seconds']}")
+        lines.append(f"# TYPE {prefix}_last_run_timestamp_seconds gauge")
+        lines.append(f"{prefix}_last_run_timestamp_seconds {self.started_at.timestamp():.0f}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path=METRICS_PATH):
+        """Atomically write the report (JSON, or Prometheus text for a .prom path)."""
+        if not path:
+            return None
+        body = self.to_prometheus() if path.endswith(".prom") else json.dumps(self.report(), indent=2)
+        with atomic_write(path) as f:
+            f.write(body)
+        return path
+
+    def log(self, slowest_sources=5):
+        """Stage percentiles and the sources that cost the most time, to stderr."""
+        report = self.report()
+        for stage, s in report["stages"].items():
+            print(f"📈 {stage:<18} n={s['count']:<5} p50 {s['p50'] * 1000:8.1f}ms  p95 {s['p95'] * 1000:8.1f}ms  "
+                  f"p99 {s['p99'] * 1000:8.1f}ms  total {s['sum']:.2f}s", file=sys.stderr)
+        totals = sorted(
+            ((sum(s["sum"] for s in stages.values()), source) for source, stages in report["sources"].items()),
+            reverse=True,
+        )[:slowest_sources]
+        for seconds, source in totals:
+            print(f"   {source}: {seconds:.2f}s across stages", file=sys.stderr)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels):
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _summary_lines(metric, labels, summary):
+    lines = []
+    for q in QUANTILES:
+        lines.append(f"{metric}{_labels({**labels, 'quantile': q})} {summary[f'p{int(q * 100)}']}")
+    lines.append(f"{metric}_sum{_labels(labels)} {summary['sum']}")
+    lines.append(f"{metric}_count{_labels(labels)} {summary['count']}")
+    return lines
+
+
+# -------------------- PROFILING -------------------- #
+class Profiler:
+    """
+    cProfile for a multi-threaded run: cProfile only sees the thread that enabled it, so
+    each thread started through wrap() gets its own profile and dump() merges them.
+    Threads keep descriptive names (e.g. ingest-infer-0) for `py-spy dump`/`py-spy top`.
+    """
+
+    def __init__(self):
+        self._profiles = []
+        self._lock = threading.Lock()
+
+    def _new_profile(self):
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        return profile
+
+    def wrap(self, target):
+        """Wrap a thread target so it runs under its own profile."""
+        def profiled(*args, **kwargs):
+            with self.section():
+                return target(*args, **kwargs)
+        return profiled
+
+    @contextmanager
+    def section(self):
+        """Profile the calling thread for the duration of a with-block."""
+        profile = self._new_profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Python 3.12+ allows one active cProfile per interpreter, and it already sees every thread.
+            yield
+            return
+        try:
+            yield
+        finally:
+            profile.disable()
+
+    def dump(self, path=PROFILE_PATH, top=25):
+        """Merge every thread's profile into `path` and print the top functions by cumulative time."""
+        with self._lock:
+            profiles = [profile for profile in self._profiles if profile.getstats()]
+        if not profiles:
+            return None
+        stats = pstats.Stats(profiles[0], stream=sys.stderr)
+        for profile in profiles[1:]:
+            stats.add(profile)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        stats.dump_stats(path)
+        print(f"🔬 Profile of {len(profiles)} threads written to {path}", file=sys.stderr)
+        stats.sort_stats("cumulative").print_stats(top)
+        return path
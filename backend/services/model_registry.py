@@ -0,0 +1,59 @@
+# File: backend/services/model_registry.py
+
+import sys
+import time
+import threading
+
+# Heavy shared resources (ML pipelines, DB clients) are registered here as factories and
+# only built on first use, so importing rss_fetcher/summarizer costs nothing until an
+# article actually needs a model.
+_factories = {}
+_instances = {}
+_locks = {}
+_registry_lock = threading.Lock()
+
+
+def register(name, factory):
+    """Register a zero-argument `factory` that builds the resource called `name`."""
+    with _registry_lock:
+        _factories[name] = factory
+        _locks.setdefault(name, threading.Lock())
+
+
+def get(name):
+    """Return the resource called `name`, building it on first use (thread-safe)."""
+    instance = _instances.get(name)
+    if instance is not None:
+        return instance
+
+    with _registry_lock:
+        if name not in _factories:
+            raise KeyError(f"No resource registered as '{name}'")
+        lock = _locks[name]
+
+    with lock:
+        instance = _instances.get(name)
+        if instance is None:
+            start_time = time.perf_counter()
+            instance = _factories[name]()
+            _instances[name] = instance
+            print(f"🔌 Loaded {name} in {time.perf_counter() - start_time:.1f}s", file=sys.stderr)
+        return instance
+
+
+def is_loaded(name):
+    return name in _instances
+
+
+def preload(*names):
+    """Build the named resources now (used by the warm worker so the first job is fast)."""
+    for name in names:
+        get(name)
+
+
+def reset(name=None):
+    """Forget one (or every) built resource; the next get() builds it again."""
+    if name is None:
+        _instances.clear()
+    else:
+        _instances.pop(name, None)
@@ -0,0 +1,210 @@
+# File: backend/services/near_duplicates.py
+
+import os
+import time
+import zlib
+import uuid
+import threading
+from collections import deque
+
+import numpy as np
+
+from services.fingerprint import normalize_content, MIN_CONTENT_WORDS
+
+# -------------------- CONFIGURATION -------------------- #
+NEAR_DUP_CLUSTERING = os.getenv("NEAR_DUP_CLUSTERING", "1").lower() in ("1", "true", "yes")
+# Estimated Jaccard similarity of title + summary shingles at which two articles are one story.
+# Lower values merge different stories that share boilerplate or templated text.
+NEAR_DUP_THRESHOLD = float(os.getenv("NEAR_DUP_THRESHOLD", "0.75"))
+# A match must also share its headline or lead with the representative (word-set Jaccard at
+# least this), or the article is treated as a story of its own and summarized itself.
+NEAR_DUP_LEAD_THRESHOLD = float(os.getenv("NEAR_DUP_LEAD_THRESHOLD", "0.5"))
+# Stories are only matched against representatives indexed within this window.
+NEAR_DUP_WINDOW_SECONDS = float(os.getenv("NEAR_DUP_WINDOW_SECONDS", str(48 * 3600)))
+
+# 128 hash functions in 32 bands of 4 rows: a pair with Jaccard 0.75 shares a band with
+# probability 1 - (1 - 0.75 ** 4) ** 32 > 0.99999. Looser pairs become candidates too and
+# are rejected by comparing full signatures.
+NUM_PERMUTATIONS = 128
+NUM_BANDS = 32
+ROWS_PER_BAND = NUM_PERMUTATIONS // NUM_BANDS
+SHINGLE_WORDS = 3
+# Words of the summary that make up an article's lead.
+LEAD_WORDS = 30
+
+# Multiply-shift hash family: h(x) = ((a * x + b) mod 2^64) >> 32, a odd. Fixed seed, so
+# signatures are comparable across processes and runs.
+_rng = np.random.default_rng(20240601)
+_HASH_A = _rng.integers(1, 2 ** 63, size=NUM_PERMUTATIONS, dtype=np.uint64) | np.uint64(1)
+_HASH_B = _rng.integers(0, 2 ** 63, size=NUM_PERMUTATIONS, dtype=np.uint64)
+
+
+def shingles(tokens, size=SHINGLE_WORDS):
+    """Distinct word `size`-grams of a token list, hashed to uint64 (crc32)."""
+    if len(tokens) < size:
+        size = max(1, len(tokens))
+    grams = {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+    return np.fromiter((zlib.crc32(gram.encode("utf-8")) for gram in grams), dtype=np.uint64, count=len(grams))
+
+
+def minhash(shingle_hashes):
+    """MinHash signature (NUM_PERMUTATIONS uint32 minima) of a non-empty shingle hash array."""
+    with np.errstate(over="ignore"):
+        hashed = (shingle_hashes[:, None] * _HASH_A[None, :] + _HASH_B[None, :]) >> np.uint64(32)
+    return hashed.min(axis=0).astype(np.uint32)
+
+
+def story_signature(title, summary):
+    """MinHash signature of an article's title + summary, or None if the text is too short to trust."""
+    tokens = normalize_content(title, summary).split()
+    if len(tokens) < MIN_CONTENT_WORDS:
+        return None
+    return minhash(shingles(tokens))
+
+
+def similarity(signature_a, signature_b):
+    """Estimated Jaccard similarity: the fraction of hash functions whose minima agree."""
+    return float(np.count_nonzero(signature_a == signature_b)) / NUM_PERMUTATIONS
+
+
+def story_lead(title, summary):
+    """(headline words, lead words) of an article, normalized like its signature."""
+    return (frozenset(normalize_content(title, "").split()),
+            frozenset(normalize_content("", summary).split()[:LEAD_WORDS]))
+
+
+def _word_jaccard(a, b):
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+
+def same_lead(lead_a, lead_b, threshold=NEAR_DUP_LEAD_THRESHOLD):
+    """Whether two story_lead() values share their headline or their lead."""
+    return (_word_jaccard(lead_a[0], lead_b[0]) >= threshold
+            or _word_jaccard(lead_a[1], lead_b[1]) >= threshold)
+
+
+class StoryCluster:
+    """One story: its representative's signature and lead and, once inferred, its summary and categories."""
+
+    __slots__ = ("cluster_id", "signature", "lead", "band_keys", "added_at", "size", "summary", "categories")
+
+    def __init__(self, cluster_id, signature, added_at, lead=None):
+        self.cluster_id = cluster_id
+        self.signature = signature
+        self.lead = lead
+        self.band_keys = [signature[i * ROWS_PER_BAND:(i + 1) * ROWS_PER_BAND].tobytes() for i in range(NUM_BANDS)]
+        self.added_at = added_at
+        self.size = 1
+        self.summary = None
+        self.categories = None
+
+
+class StoryClusters:
+    """
+    In-memory LSH index of recent story representatives, for near-duplicate detection
+    across sources (the same wire story published by several feeds).
+
+    Each representative's MinHash signature is split into NUM_BANDS bands; articles that
+    share a band with a representative are candidates, and the best candidate whose
+    estimated Jaccard similarity reaches `threshold` (and, when leads are given, whose
+    headline or lead matches, see same_lead) is the article's cluster. Clusters
+    older than `window_seconds` are evicted, so the index stays bounded and old stories
+    are not matched against today's follow-ups. `clock` returns the current Unix time
+    and can be replaced by a simulated clock.
+    """
+
+    def __init__(self, threshold=NEAR_DUP_THRESHOLD, window_seconds=NEAR_DUP_WINDOW_SECONDS, clock=time.time):
+        self.threshold = threshold
+        self.window_seconds = window_seconds
+        self.clock = clock
+        self.clusters = {}
+        self._buckets = [{} for _ in range(NUM_BANDS)]
+        self._order = deque()
+        self._lock = threading.Lock()
+
+    def _evict(self, now):
+        while self._order and self._order[0].added_at < now - self.window_seconds:
+            self._remove(self._order.popleft())
+
+    def _remove(self, cluster):
+        if self.clusters.pop(cluster.cluster_id, None) is None:
+            return
+        for band, key in enumerate(cluster.band_keys):
+            members = self._buckets[band].get(key)
+            if members is not None:
+                members.discard(cluster.cluster_id)
+                if not members:
+                    del self._buckets[band][key]
+
+    def match(self, signature, lead=None):
+        """The cluster `signature` (with `lead`, see story_lead) belongs to, or None if it starts a new story."""
+        with self._lock:
+            self._evict(self.clock())
+            return self._match(signature, lead)
+
+    def _match(self, signature, lead):
+        candidates = set()
+        for band in range(NUM_BANDS):
+            members = self._buckets[band].get(signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND].tobytes())
+            if members:
+                candidates.update(members)
+        best, best_score = None, self.threshold
+        for cluster_id in candidates:
+            cluster = self.clusters[cluster_id]
+            score = similarity(signature, cluster.signature)
+            if score >= best_score and (lead is None or cluster.lead is None or same_lead(lead, cluster.lead)):
+                best, best_score = cluster, score
+        return best
+
+    def assign(self, signature, cluster_id=None, lead=None):
+        """
+        Put an article in a cluster: (cluster, True) if it joined an existing story,
+        (cluster, False) if it became the representative of a new one.
+        """
+        with self._lock:
+            now = self.clock()
+            self._evict(now)
+            cluster = self._match(signature, lead)
+            if cluster is not None:
+                cluster.size += 1
+                return cluster, True
+            cluster = StoryCluster(cluster_id or uuid.uuid4().hex, signature, now, lead)
+            self._add(cluster)
+            return cluster, False
+
+    def _add(self, cluster):
+        self.clusters[cluster.cluster_id] = cluster
+        for band, key in enumerate(cluster.band_keys):
+            self._buckets[band].setdefault(key, set()).add(cluster.cluster_id)
+        self._order.append(cluster)
+
+    def restore(self, cluster_id, signature, added_at, summary, categories, lead=None):
+        """
+        Re-index a representative stored by an earlier run (`signature` as bytes, `added_at`
+        as Unix time), so a fresh process still matches the stories of the current window.
+        Call in `added_at` order. Returns False if the cluster is known, out of the window,
+        or its signature has a different length (NUM_PERMUTATIONS changed).
+        """
+        signature = np.frombuffer(signature, dtype=np.uint32)
+        if len(signature) != NUM_PERMUTATIONS:
+            return False
+        with self._lock:
+            if cluster_id in self.clusters or added_at < self.clock() - self.window_seconds:
+                return False
+            cluster = StoryCluster(cluster_id, signature, added_at, lead)
+            cluster.summary = summary
+            cluster.categories = categories
+            self._add(cluster)
+            return True
+
+    def discard(self, clusters):
+        """Drop clusters whose representative never got its inference results (e.g. the batch failed)."""
+        with self._lock:
+            for cluster in clusters:
+                self._remove(cluster)
+
+    def report(self, near_duplicates):
+        with self._lock:
+            multi = sum(1 for cluster in self.clusters.values() if cluster.size > 1)
+            return (f"🧩 Reused a representative's summary and categories for {near_duplicates} near-duplicate "
+                    f"articles; {len(self.clusters)} stories indexed, {multi} with duplicates")
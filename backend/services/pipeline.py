@@ -0,0 +1,237 @@
+# File: backend/services/pipeline.py
+
+import os
+import sys
+import time
+import queue
+import threading
+from collections import Counter
+
+# Items allowed to wait between two stages before the upstream stage blocks (backpressure).
+PIPELINE_QUEUE_SIZE = int(os.getenv("RSS_PIPELINE_QUEUE_SIZE", "8"))
+
+_STOP = object()
+
+
+class Stage:
+    """
+    One step of a Pipeline.
+
+    `func(item)` returns an iterable of zero or more output items (return [] to drop an
+    item). With `batch_size`, the stage is a batcher instead: `func(items)` receives up to
+    `batch_size` queued items at once, waiting at most `batch_wait` seconds for more after
+    the first one arrives, and returns the outputs for the whole batch.
+    `on_error(items, error)`, if given, is called with the dropped items when `func` raises.
+    """
+
+    def __init__(self, name, func, workers=1, batch_size=None, batch_wait=0.05, queue_size=PIPELINE_QUEUE_SIZE,
+                 on_error=None):
+        self.name = name
+        self.func = func
+        self.on_error = on_error
+        self.workers = max(1, workers)
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.queue = queue.Queue(maxsize=max(1, queue_size))
+
+        self.items_in = 0
+        self.items_out = 0
+        self.calls = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.max_depth = 0
+        self._depth_total = 0
+        self._depth_samples = 0
+        self._lock = threading.Lock()
+
+    def _sample_depth(self):
+        depth = self.queue.qsize()
+        with self._lock:
+            self.max_depth = max(self.max_depth, depth)
+            self._depth_total += depth
+            self._depth_samples += 1
+
+    def _record(self, items_in, items_out, seconds, failed=False):
+        with self._lock:
+            self.items_in += items_in
+            self.items_out += items_out
+            self.calls += 1
+            self.busy_seconds += seconds
+            if failed:
+                self.errors += 1
+
+    def metrics(self, wall_seconds):
+        avg_depth = self._depth_total / self._depth_samples if self._depth_samples else 0.0
+        return {
+            "workers": self.workers,
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "calls": self.calls,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "items_per_second": round(self.items_in / wall_seconds, 2) if wall_seconds else 0.0,
+            "queue_max": self.max_depth,
+            "queue_avg": round(avg_depth, 2),
+        }
+
+
+class Pipeline:
+    """
+    Runs `source` (any iterable, e.g. a generator of downloads) through a chain of Stages
+    connected by bounded queues. Every stage has its own worker threads, so network I/O,
+    parsing, inference and DB writes for different items overlap, while the bounded
+    queues keep memory flat: a slow stage makes the stages before it wait.
+    Outputs of the last stage are collected and returned by run().
+
+    With a `metrics` RunMetrics (services/metrics.py) every stage call is also recorded as a
+    "pipeline.<stage>" timing; with a `profiler` every worker thread runs under cProfile.
+    """
+
+    def __init__(self, name, source, stages, metrics=None, profiler=None):
+        self.name = name
+        self.source = source
+        self.stages = stages
+        self.metrics = metrics
+        self.profiler = profiler
+        self.source_items = 0
+        self.source_seconds = 0.0
+        self.wall_seconds = 0.0
+        self.counters = Counter()
+        self._counter_lock = threading.Lock()
+        self._results = []
+        self._results_lock = threading.Lock()
+
+    def count(self, key, amount=1):
+        """Thread-safe run counter for stage functions (e.g. images extracted)."""
+        with self._counter_lock:
+            self.counters[key] += amount
+
+    def _emit(self, index, outputs):
+        if index + 1 < len(self.stages):
+            next_queue = self.stages[index + 1].queue
+            for output in outputs:
+                next_queue.put(output)
+        else:
+            with self._results_lock:
+                self._results.extend(outputs)
+
+    def _next_batch(self, stage):
+        """Block for one item, then gather up to batch_size within batch_wait. Returns (items, stopped)."""
+        first = stage.queue.get()
+        if first is _STOP:
+            return [], True
+        items = [first]
+        deadline = time.perf_counter() + stage.batch_wait
+        while len(items) < stage.batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = stage.queue.get(timeout=max(0.0, remaining)) if remaining > 0 else stage.queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return items, True
+            items.append(item)
+        return items, False
+
+    def _worker(self, index, finished):
+        stage = self.stages[index]
+        stopped = False
+        while not stopped:
+            stage._sample_depth()
+            if stage.batch_size:
+                items, stopped = self._next_batch(stage)
+                if not items:
+                    break
+                payload = items
+            else:
+                item = stage.queue.get()
+                if item is _STOP:
+                    break
+                items, payload = [item], item
+
+            start_time = time.perf_counter()
+            try:
+                outputs = list(stage.func(payload) or [])
+                seconds = time.perf_counter() - start_time
+                stage._record(len(items), len(outputs), seconds)
+            except Exception as e:
+                stage._record(len(items), 0, time.perf_counter() - start_time, failed=True)
+                print(f"❌ {self.name}/{stage.name} failed on {len(items)} item(s): {e}", file=sys.stderr)
+                if stage.on_error is not None:
+                    try:
+                        stage.on_error(items, e)
+                    except Exception as cleanup_error:
+                        print(f"❌ {self.name}/{stage.name} error handler failed: {cleanup_error}", file=sys.stderr)
+                continue
+            if self.metrics is not None:
+                self.metrics.observe(f"pipeline.{stage.name}", seconds)
+            self._emit(index, outputs)
+
+        # Each worker consumes exactly one STOP token, so sibling workers stop independently.
+        finished(index)
+
+    def run(self):
+        start = time.perf_counter()
+        remaining_workers = [stage.workers for stage in self.stages]
+        lock = threading.Lock()
+
+        def finished(index):
+            # The last worker of a stage to exit tells the next stage there is no more input.
+            with lock:
+                remaining_workers[index] -= 1
+                last = remaining_workers[index] == 0
+            if last and index + 1 < len(self.stages):
+                for _ in range(self.stages[index + 1].workers):
+                    self.stages[index + 1].queue.put(_STOP)
+
+        worker = self.profiler.wrap(self._worker) if self.profiler is not None else self._worker
+        threads = []
+        for index, stage in enumerate(self.stages):
+            for n in range(stage.workers):
+                thread = threading.Thread(
+                    target=worker, args=(index, finished),
+                    name=f"{self.name}-{stage.name}-{n}", daemon=True,
+                )
+                thread.start()
+                threads.append(thread)
+
+        # The source runs on this thread; put() blocks whenever the first stage is saturated.
+        first_queue = self.stages[0].queue
+        iterator = iter(self.source)
+        try:
+            while True:
+                produce_start = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                self.source_seconds += time.perf_counter() - produce_start
+                self.source_items += 1
+                first_queue.put(item)
+        finally:
+            for _ in range(self.stages[0].workers):
+                first_queue.put(_STOP)
+            for thread in threads:
+                thread.join()
+            self.wall_seconds = time.perf_counter() - start
+        return self._results
+
+    def metrics(self):
+        return {
+            "wall_seconds": round(self.wall_seconds, 3),
+            "source_items": self.source_items,
+            "source_seconds": round(self.source_seconds, 3),
+            "stages": {stage.name: stage.metrics(self.wall_seconds) for stage in self.stages},
+            "counters": dict(self.counters),
+        }
+
+    def log_metrics(self):
+        print(f"🚦 {self.name}: {self.source_items} source items in {self.wall_seconds:.2f}s", file=sys.stderr)
+        for stage in self.stages:
+            m = stage.metrics(self.wall_seconds)
+            print(
+                f"   {stage.name:<10} x{m['workers']}: {m['items_in']} in / {m['items_out']} out, "
+                f"busy {m['busy_seconds']:.2f}s, {m['items_per_second']:.2f} items/s, "
+                f"queue max {m['queue_max']} avg {m['queue_avg']:.1f}, errors {m['errors']}",
+                file=sys.stderr,
+            )
@@ -2,10 +2,12 @@
 
 import os
 import sys
+import time
 import feedparser
 import json
 import pymongo
-from datetime import datetime, timezone
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
 from bson import ObjectId
 from dateutil import parser
 from urllib.parse import urlparse, urlunparse
@@ -15,19 +17,45 @@ script_dir = os.path.dirname(os.path.abspath(__file__))        # e.g. /.../backe
 backend_dir = os.path.dirname(script_dir)                      # e.g. /.../backend
 sys.path.append(backend_dir)                                   # add backend to PYTHONPATH
 
-from services.summarization.summarizer import summarize_text as generate_summary, extract_keywords
+from services import model_registry
+from services.summarization.summarizer import summarize_batch
+from services.feed_downloader import download_feeds, log_download_timings
+from services.feed_cache import FeedCache
+from services.article_store import (SeenUrls, InFlightKeys, ensure_indexes, existing_urls, known_fingerprints,
+                                    insert_articles, recent_story_representatives)
+from services.fingerprint import canonicalize_url, content_hash
+from services.ingest_worker import serve, submit
+from services.zero_shot import classify_batch
+from services.category_tier import get_tier, split_by_confidence, record_agreement, TierStats
+from services.pipeline import Pipeline, Stage
+from services.html_extract import EntryHtml
+from services.keywords import get_keyword_engine
+from services.metrics import RunMetrics, Profiler, PROFILE
+from services.feed_scheduler import FeedScheduler, entry_timestamps
+from services.feed_state import FeedState
+from services.inference_pool import start_pool, active_pool
+from services.inference_backend import backend_for, load_pipeline
+from services.near_duplicates import StoryClusters, story_signature, story_lead, NEAR_DUP_CLUSTERING
 
 # -------------------- ZERO-SHOT CATEGORIZATION SETUP -------------------- #
-from transformers import pipeline
-import torch
+CLASSIFIER_MODEL = os.getenv("CLASSIFIER_MODEL", "facebook/bart-large-mnli")
+# torch | int8 | onnx (see services/inference_backend.py); defaults to INFERENCE_BACKEND.
+CLASSIFIER_BACKEND = backend_for("CLASSIFIER_BACKEND")
 
-# Use GPU if available (or CPU otherwise)
-device = 0 if torch.cuda.is_available() else -1
-classifier = pipeline(
-    "zero-shot-classification", 
-    model="facebook/bart-large-mnli", 
-    device=device
-)
+def _load_classifier():
+    device = -1
+    if CLASSIFIER_BACKEND == "torch":
+        import torch
+
+        # Use GPU if available (or CPU otherwise)
+        device = 0 if torch.cuda.is_available() else -1
+    return load_pipeline("zero-shot-classification", CLASSIFIER_MODEL, CLASSIFIER_BACKEND, device=device)
+
+# Built on first use only, so runs where every entry is a duplicate never load the model.
+model_registry.register("classifier", _load_classifier)
+
+def get_classifier():
+    return model_registry.get("classifier")
 
 # Define the target categories (candidate labels)
 TARGET_CATEGORIES = [
@@ -40,9 +68,48 @@ MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017/")
 DB_NAME = os.getenv("DB_NAME", "userdb")
 COLLECTION_NAME = os.getenv("COLLECTION_NAME", "NewsArticle")
 
-client = pymongo.MongoClient(MONGO_URI)
-db = client[DB_NAME]
-collection = db[COLLECTION_NAME]
+def _load_collection():
+    client = pymongo.MongoClient(MONGO_URI)
+    return client[DB_NAME][COLLECTION_NAME]
+
+model_registry.register("collection", _load_collection)
+
+def get_collection():
+    return model_registry.get("collection")
+
+# URLs known to be stored, so repeated entries across feeds/runs skip the DB lookup entirely.
+seen_urls = SeenUrls()
+# Canonical URLs / content hashes of stored articles (see services/fingerprint.py).
+seen_fingerprints = SeenUrls()
+# Recent stories by MinHash signature (see services/near_duplicates.py); kept across the
+# warm worker's cycles, so copies of a wire story arriving later reuse its inference too.
+# A cold start (one process per cron tick) seeds it from the stored representatives.
+story_clusters = StoryClusters()
+
+
+def seed_story_clusters(collection):
+    """Index the representatives stored within the clustering window, unless this process already has an index."""
+    if not NEAR_DUP_CLUSTERING or story_clusters.clusters:
+        return
+    since = datetime.now(timezone.utc) - timedelta(seconds=story_clusters.window_seconds)
+    restored = 0
+    for doc in recent_story_representatives(collection, since):
+        # The original lead is not stored; the representative's summary stands in for it.
+        restored += story_clusters.restore(doc["clusterId"], doc["storySignature"],
+                                           doc["_id"].generation_time.timestamp(),
+                                           doc.get("summary"), doc.get("categories") or [],
+                                           lead=story_lead(doc.get("title"), doc.get("summary")))
+    print(f"🧩 Restored {restored} stored stories for near-duplicate matching", file=sys.stderr)
+
+# -------------------- PIPELINE CONFIGURATION -------------------- #
+# Worker threads per stage of fetch_rss_articles. Inference is a single batcher (the models are
+# not thread-parallel); it waits up to INFER_BATCH_WAIT seconds to group INFER_BATCH_FEEDS feeds.
+PARSE_WORKERS = int(os.getenv("RSS_PARSE_WORKERS", "2"))
+DEDUP_WORKERS = int(os.getenv("RSS_DEDUP_WORKERS", "2"))
+ENRICH_WORKERS = int(os.getenv("RSS_ENRICH_WORKERS", "2"))
+PERSIST_WORKERS = int(os.getenv("RSS_PERSIST_WORKERS", "2"))
+INFER_BATCH_FEEDS = int(os.getenv("RSS_INFER_BATCH_FEEDS", "4"))
+INFER_BATCH_WAIT = float(os.getenv("RSS_INFER_BATCH_WAIT", "0.5"))
 
 # -------------------- RSS FEED CONFIGURATION -------------------- #
 # Existing feeds – you may later add more feeds (and limit total to 100)
@@ -123,7 +190,7 @@ def article_exists(url):
     """Check if an article with this URL already exists in the database."""
     if not url:
         return False
-    return collection.find_one({"url": url}) is not None
+    return get_collection().find_one({"url": url}) is not None
 
 def sanitize_url(url):
     """Ensure the URL is absolute and uses http or https."""
@@ -137,9 +204,10 @@ def sanitize_url(url):
         print(f"⚠️ URL sanitization error for {url}: {e}", file=sys.stderr)
         return None
 
-def extract_image_url(entry):
+def extract_image_url(entry, parsed_html=None):
     """
     Attempt multiple strategies to extract an image URL from an RSS feed entry.
+    Pass the entry's EntryHtml to reuse an HTML parse that has already been done.
     """
     # Strategy 1: Check 'media_content'
     media_content = entry.get("media_content")
@@ -173,46 +241,16 @@ def extract_image_url(entry):
             if sanitized:
                 return sanitized
 
-    # Strategy 4: Parse HTML from 'content:encoded' or 'content'
-    html_content = entry.get("content:encoded") or entry.get("content")
-    if html_content:
-        if isinstance(html_content, list):
-            # If items are dictionaries, join their 'value' fields; otherwise, join string representations.
-            if all(isinstance(item, dict) for item in html_content):
-                html_content = " ".join(item.get("value", "") for item in html_content)
-            else:
-                html_content = " ".join(str(item) for item in html_content)
-        try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
-            img_tag = soup.find('img')
-            if img_tag and img_tag.get('src'):
-                url = img_tag.get('src')
-                sanitized = sanitize_url(url)
-                if sanitized:
-                    return sanitized
-        except Exception as e:
-            print(f"⚠️ Error parsing HTML content for image extraction: {e}", file=sys.stderr)
-
-    # Strategy 5: Parse HTML from 'summary'
-    summary = entry.get("summary")
-    if summary:
-        if isinstance(summary, list):
-            if all(isinstance(item, dict) for item in summary):
-                summary = " ".join(item.get("value", "") for item in summary)
-            else:
-                summary = " ".join(str(item) for item in summary)
-        try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(summary, 'html.parser')
-            img_tag = soup.find('img')
-            if img_tag and img_tag.get('src'):
-                url = img_tag.get('src')
-                sanitized = sanitize_url(url)
-                if sanitized:
-                    return sanitized
-        except Exception as e:
-            print(f"⚠️ Error parsing summary content for image extraction: {e}", file=sys.stderr)
+    # Strategy 4: First <img> in 'content:encoded' or 'content'
+    # Strategy 5: First <img> in 'summary'
+    # Both fields come from the entry's single HTML pass (services/html_extract.py).
+    if parsed_html is None:
+        parsed_html = EntryHtml(entry)
+    for extracted in (parsed_html.content, parsed_html.summary):
+        if extracted is not None and extracted.first_image:
+            sanitized = sanitize_url(extracted.first_image)
+            if sanitized:
+                return sanitized
 
     # If all methods fail, return None so the UI fallback image will be used.
     return None
@@ -249,25 +287,23 @@ def classify_article(text):
     Returns a dictionary mapping labels to their scores.
     Uses multi_label=True so multiple categories can be returned.
     """
-    result = classifier(text, candidate_labels=TARGET_CATEGORIES, multi_label=True)
+    result = get_classifier()(text, candidate_labels=TARGET_CATEGORIES, multi_label=True)
     # Return a dictionary of label: score (scores are between 0 and 1)
     return dict(zip(result["labels"], result["scores"]))
 
-def assign_categories(entry, title, summary_text):
+def classify_articles(texts):
     """
-    Determine the article's categories.
-    1. First, attempt to extract categories from feed metadata.
-    2. If none found, use zero-shot classification on the article title and summary.
-    Returns a list of categories.
+    Batched classify_article: scores many texts x all TARGET_CATEGORIES in padded batches
+    (see services/zero_shot.py). Returns one label: score dict per text, in input order.
+    Runs on the inference pool's worker processes when one is running.
     """
-    assigned = extract_categories(entry)
-    if assigned:
-        return assigned
-
-    # Build text for classification from title and summary.
-    text_for_classification = f"{title}. {summary_text}"
-    classification_scores = classify_article(text_for_classification)
+    pool = active_pool()
+    if pool is not None:
+        return pool.classify_batch(texts, TARGET_CATEGORIES)
+    return classify_batch(get_classifier(), texts, TARGET_CATEGORIES)
 
+def categories_from_scores(classification_scores):
+    """Turn zero-shot scores into the final category list."""
     # Threshold: keep labels with score >= 0.5 (i.e. 50% or higher)
     ai_assigned = [label for label, score in classification_scores.items() if score >= 0.5]
     if not ai_assigned:
@@ -279,79 +315,371 @@ def assign_categories(entry, title, summary_text):
             ai_assigned = ["General"]
     return ai_assigned
 
-def fetch_rss_articles(limit=20):
+def assign_categories(entry, title, summary_text):
     """
-    Fetch articles from multiple RSS feeds, then:
-      - Summarize them using the summarization pipeline.
-      - Extract keywords.
-      - Extract an image URL.
-      - Determine categories (via feed data and/or AI fallback).
-    Inserts each article into MongoDB and logs metrics.
+    Determine the article's categories.
+    1. First, attempt to extract categories from feed metadata.
+    2. If none found, use zero-shot classification on the article title and summary.
+    Returns a list of categories.
     """
-    articles = []
-    total_articles = 0
-    images_extracted = 0
-    categories_assigned = 0
+    assigned = extract_categories(entry)
+    if assigned:
+        return assigned
 
-    for source, rss_url in RSS_FEEDS.items():
-        feed = feedparser.parse(rss_url)
-        print(f"📡 {source}: Found {len(feed.entries)} articles", file=sys.stderr)
+    # Build text for classification from title and summary.
+    text_for_classification = f"{title}. {summary_text}"
+    return categories_from_scores(classify_article(text_for_classification))
 
-        for entry in feed.entries[:limit]:
-            total_articles += 1
+def assign_categories_batch(entries, titles, summary_texts, tier_stats=None):
+    """
+    assign_categories for a whole feed:
+    1. Feed metadata, as before.
+    2. The fast centroid tier (services/category_tier.py) for articles it is confident about.
+    3. One batched zero-shot pass (classify_articles) for everything else, plus a small
+       audit sample of tier decisions so agreement with MNLI can be tracked.
+    Returns lists in input order.
+    """
+    results = [extract_categories(entry) for entry in entries]
+    pending = [i for i, assigned in enumerate(results) if not assigned]
+    if not pending:
+        return results
+
+    texts = [f"{titles[i]}. {summary_texts[i]}" for i in pending]
+    decided, escalate, audit = split_by_confidence(get_tier(), texts, stats=tier_stats)
+    for j, labels in decided.items():
+        results[pending[j]] = labels
+
+    to_classify = escalate + audit
+    if to_classify:
+        scores = classify_articles([texts[j] for j in to_classify])
+        for j, classification_scores in zip(to_classify, scores):
+            mnli_labels = categories_from_scores(classification_scores)
+            if j in decided and tier_stats is not None:
+                record_agreement(tier_stats, decided[j], mnli_labels)
+            results[pending[j]] = mnli_labels
+    return results
+
+def parse_published_at(entry):
+    """Publication date of an entry as an aware UTC datetime (now if missing or unparseable)."""
+    published_at_str = entry.get("published", None)
+    if published_at_str:
+        try:
+            published_at = parser.parse(published_at_str)
+            return published_at.astimezone(timezone.utc)
+        except Exception as e:
+            print(f"⚠️ Failed to parse date '{published_at_str}', using current UTC. Error: {e}", file=sys.stderr)
+    return datetime.now(timezone.utc)
+
+def fetch_rss_articles(limit=20, force=False):
+    """
+    Fetch, enrich and store articles from the feeds in RSS_FEEDS that are due (see
+    services/feed_scheduler.py; `force` polls every feed) as a streaming pipeline
+    (see services/pipeline.py). Each stage works on one feed at a time and has its own workers,
+    connected by bounded queues so downloads, parsing, inference and DB writes overlap:
+
+      fetch     - concurrent downloads with conditional GET (feed_downloader, feed_cache)
+      normalize - skip unchanged/failed feeds, feedparser parse, keep the first `limit` entries
+                  that are past the feed's high-water mark (feed_state)
+      dedup     - one $in query for known URLs, then canonical-URL / content fingerprints
+      enrich    - publication date and image URL per new article, TF-IDF keywords and
+                  MinHash signatures per feed
+      infer     - batcher: near-duplicate clustering, then summaries and categories for the
+                  cluster representatives of several feeds in one batched pass
+      persist   - one unordered bulk insert per feed, then record the feed in the cache
+
+    With INFERENCE_WORKERS > 1 the infer stage fans out to a process pool that shares the
+    model weights (see services/inference_pool.py).
+
+    Logs per-stage throughput and queue depth at the end, writes per-stage and per-source
+    timing percentiles to RSS_METRICS_PATH (services/metrics.py), profiles every stage
+    thread when RSS_PROFILE is set, and returns the inserted articles.
+    """
+    scheduler = FeedScheduler()
+    feeds = scheduler.due_feeds(RSS_FEEDS, force=force)
+    if not feeds:
+        # Nothing to poll: don't load models or fork workers for an empty run.
+        print(scheduler.report(0, len(RSS_FEEDS)), file=sys.stderr)
+        return []
+
+    # Fork inference workers (if configured) before the pipeline starts any threads.
+    pool = start_pool()
+    summarize = pool.summarize_batch if pool is not None else summarize_batch
+    downloads = []
+    run_metrics = RunMetrics("ingest")
+    profiler = Profiler() if PROFILE else None
+    tier_stats = TierStats()
+    feed_cache = FeedCache()
+    feed_state = FeedState()
+    # Keys of articles between dedup and persist, so concurrent feeds cannot both take the same story.
+    in_flight = InFlightKeys()
+    keyword_engine = get_keyword_engine()
+    collection = get_collection()
+    ensure_indexes(collection)
+    seed_story_clusters(collection)
+
+    def fetch():
+        # Conditional GET headers let unchanged feeds come back as 304 with no body.
+        request_headers = feed_cache.all_request_headers(feeds.values())
+        for download in download_feeds(feeds, request_headers=request_headers):
+            downloads.append(download)
+            run_metrics.observe("download", download.elapsed, download.source)
+            yield download
+
+    def normalize(download):
+        source = download.source
+        if feed_cache.is_unchanged(download):
+            print(f"💤 {source}: unchanged since last run (HTTP {download.status}), skipping", file=sys.stderr)
+            scheduler.record_unchanged(download.url)
+            return []
+        if not download.ok:
+            print(f"⚠️ {source}: download failed after {download.elapsed:.2f}s ({download.error or download.status})", file=sys.stderr)
+            scheduler.record_failure(download.url, download.error or f"HTTP {download.status}")
+            return []
+
+        parse_start = time.perf_counter()
+        feed = feedparser.parse(download.body, response_headers=download.headers)
+        parse_seconds = time.perf_counter() - parse_start
+        run_metrics.observe("parse", parse_seconds, source)
+        print(f"📡 {source}: Found {len(feed.entries)} articles (downloaded in {download.elapsed:.2f}s)", file=sys.stderr)
+        if feed.bozo and not feed.entries:
+            scheduler.record_failure(download.url, f"unparseable feed: {feed.get('bozo_exception')}")
+            return []
+
+        # Only entries past the feed's high-water mark go on to dedup and enrichment.
+        window = feed.entries[:limit]
+        entries = feed_state.new_entries(download.url, window)
+        scheduler.record_success(download.url, entry_timestamps(feed.entries), len(entries))
+        ingest.count("entries_below_mark", len(window) - len(entries))
+        ingest.count("total_articles", len(entries))
+        return [{"source": source, "download": download, "parse_seconds": parse_seconds,
+                 "window": window, "entries": entries}]
+
+    def dedup(batch):
+        # Resolve which entries are already stored with one query for the whole feed.
+        entries = batch["entries"]
+        query_start = time.perf_counter()
+        known_urls = existing_urls(collection, [entry.get("link", "") for entry in entries], seen_urls)
+        query_seconds = time.perf_counter() - query_start
+
+        # Fingerprint the survivors so syndicated/tracking/AMP variants of a stored story are
+        # caught before any model inference runs.
+        candidates = []
+        for entry in entries:
             article_url = entry.get("link", "")
-            if article_exists(article_url):
+            if article_url in known_urls:
+                continue
+            canonical_url = canonicalize_url(sanitize_url(article_url)) if article_url else None
+            fingerprint = content_hash(entry.get("title", ""), entry.get("summary", ""))
+            candidates.append((entry, article_url, canonical_url, fingerprint))
+
+        query_start = time.perf_counter()
+        known_canonical, known_hashes = known_fingerprints(
+            collection,
+            [canonical_url for _, _, canonical_url, _ in candidates],
+            [fingerprint for _, _, _, fingerprint in candidates],
+            seen_fingerprints,
+        )
+        run_metrics.observe("dedup_query", query_seconds + time.perf_counter() - query_start, batch["source"])
+
+        new_articles = []
+        for entry, article_url, canonical_url, fingerprint in candidates:
+            # A stored story, or one already claimed by this feed or another one still in flight.
+            if ((canonical_url and canonical_url in known_canonical) or (fingerprint and fingerprint in known_hashes)
+                    or not in_flight.claim([article_url, canonical_url, fingerprint])):
+                ingest.count("fingerprint_duplicates")
+                # Summarization always runs; classification only when the feed has no usable category.
+                ingest.count("inference_calls_avoided", 1 if extract_categories(entry) else 2)
                 continue
+            new_articles.append((entry, article_url, canonical_url, fingerprint))
 
-            title = entry.get("title", "No Title")
-
-            # Parse publication date
-            published_at_str = entry.get("published", None)
-            if published_at_str:
-                try:
-                    published_at = parser.parse(published_at_str)
-                    published_at = published_at.astimezone(timezone.utc)
-                except Exception as e:
-                    print(f"⚠️ Failed to parse date '{published_at_str}', using current UTC. Error: {e}", file=sys.stderr)
-                    published_at = datetime.now(timezone.utc)
-            else:
-                published_at = datetime.now(timezone.utc)
+        batch["new_articles"] = new_articles
+        # Feeds with nothing new still flow on, so persist can record them in the feed cache.
+        return [batch]
 
-            summary_text = entry.get("summary", "")
-            ai_summary = generate_summary(summary_text)
-            keywords = extract_keywords(summary_text)
+    def enrich(batch):
+        entries, docs, token_lists = [], [], []
+        for entry, article_url, canonical_url, fingerprint in batch["new_articles"]:
+            # Parse the entry's HTML once; text, image and keyword tokens all come from this pass.
+            html_start = time.perf_counter()
+            parsed_html = EntryHtml(entry)
+            run_metrics.observe("html_parse", time.perf_counter() - html_start, batch["source"])
+            summary_text = parsed_html.summary.text
 
             # Image extraction
-            image_url = extract_image_url(entry)
+            image_url = extract_image_url(entry, parsed_html)
             if image_url:
-                images_extracted += 1
-
-            # Categorization: assign categories either via feed fields or AI fallback.
-            assigned_categories = assign_categories(entry, title, summary_text)
-            if assigned_categories:
-                categories_assigned += 1
-
-            article_doc = {
-                "title": title,
-                "source": source,
-                "publishedAt": published_at,  # stored as datetime (UTC)
+                ingest.count("images_extracted")
+
+            entries.append(entry)
+            token_lists.append(parsed_html.summary.tokens)
+            docs.append({
+                "title": entry.get("title", "No Title"),
+                "source": batch["source"],
+                "publishedAt": parse_published_at(entry),  # stored as datetime (UTC)
                 "url": article_url,
-                "summary": ai_summary,
+                "summary": summary_text,  # replaced by the AI summary in infer
                 "urlToImage": image_url,  # may be None if not found
-                "keywords": keywords,
-                "categories": assigned_categories  # new field: list of categories
-            }
-            inserted = collection.insert_one(article_doc)
-            article_doc["_id"] = str(inserted.inserted_id)
-            articles.append(article_doc)
-            print(f"✅ Inserted {title} ({article_url}) with categories: {assigned_categories}", file=sys.stderr)
+                "keywords": [],  # filled in below, one TF-IDF pass for the whole feed
+                "categories": [],  # new field: list of categories (filled in by infer)
+                "canonicalUrl": canonical_url,
+                "contentHash": fingerprint,
+                "clusterId": None,  # near-duplicate story cluster (set in infer)
+                "storySignature": None  # MinHash signature, kept on cluster representatives only
+            })
+
+        # Keywords: add the feed to the corpus document frequencies, then score it in one batch.
+        with run_metrics.timer("keywords", batch["source"]):
+            keyword_lists = keyword_engine.extract_batch(token_lists)
+        for doc, keywords in zip(docs, keyword_lists):
+            doc["keywords"] = keywords
+
+        # Signatures for near-duplicate clustering across feeds (done in infer).
+        with run_metrics.timer("minhash", batch["source"]):
+            batch["signatures"] = [
+                story_signature(doc["title"], doc["summary"]) if NEAR_DUP_CLUSTERING else None for doc in docs
+            ]
+        batch["new_entries"] = entries
+        batch["docs"] = docs
+        return [batch]
+
+    def infer(batches):
+        # Cluster near-duplicates first: only each new story's representative is summarized
+        # and classified; the other copies reuse its results.
+        entries = [entry for batch in batches for entry in batch["new_entries"]]
+        docs = [doc for batch in batches for doc in batch["docs"]]
+        signatures = [signature for batch in batches for signature in batch["signatures"]]
+        representatives, duplicates, new_clusters = [], [], []
+        for i, (doc, signature) in enumerate(zip(docs, signatures)):
+            if signature is None:
+                representatives.append(i)
+                continue
+            cluster, is_duplicate = story_clusters.assign(signature, cluster_id=doc["contentHash"],
+                                                          lead=story_lead(doc["title"], doc["summary"]))
+            doc["clusterId"] = cluster.cluster_id
+            if is_duplicate:
+                duplicates.append((i, cluster))
+                ingest.count("near_duplicates")
+                ingest.count("inference_calls_avoided", 1 if extract_categories(entries[i]) else 2)
+            else:
+                representatives.append(i)
+                new_clusters.append((i, cluster))
+
+        try:
+            if representatives:
+                summary_texts = [docs[i]["summary"] for i in representatives]
+                # One batched summarization pass and one categorization pass across several feeds.
+                with run_metrics.timer("summarize"):
+                    summaries = summarize(summary_texts)
+                # Categorization: feed fields, then the fast tier, then one batched zero-shot pass for the rest.
+                with run_metrics.timer("classify"):
+                    categories = assign_categories_batch([entries[i] for i in representatives],
+                                                         [docs[i]["title"] for i in representatives],
+                                                         summary_texts, tier_stats)
+                for i, ai_summary, assigned_categories in zip(representatives, summaries, categories):
+                    docs[i]["summary"] = ai_summary
+                    docs[i]["categories"] = assigned_categories
+        except Exception:
+            # Nothing may reuse a representative that has no results.
+            story_clusters.discard([cluster for _, cluster in new_clusters])
+            raise
+
+        for i, cluster in new_clusters:
+            cluster.summary = docs[i]["summary"]
+            cluster.categories = docs[i]["categories"]
+            # Stored so the next cold run can rebuild the index (seed_story_clusters).
+            docs[i]["storySignature"] = cluster.signature.tobytes()
+        for i, cluster in duplicates:
+            docs[i]["summary"] = cluster.summary
+            # Categories given by the article's own feed still win over the representative's.
+            docs[i]["categories"] = extract_categories(entries[i]) or list(cluster.categories)
+        for doc in docs:
+            if doc["categories"]:
+                ingest.count("categories_assigned")
+        return batches
+
+    def release_claims(batches, error=None):
+        # A failed batch gives its stories back, so a copy from another feed (or the next run) can take them.
+        for batch in batches:
+            for _, article_url, canonical_url, fingerprint in batch.get("new_articles", []):
+                in_flight.release([article_url, canonical_url, fingerprint])
+
+    def persist(batch):
+        # Write the feed's new articles in one unordered bulk insert.
+        with run_metrics.timer("mongo_insert", batch["source"]):
+            inserted = insert_articles(collection, batch["docs"], seen_urls)
+        stored = {id(doc) for doc in inserted}
+        for doc in batch["docs"]:
+            if id(doc) not in stored:
+                in_flight.release([doc["url"], doc["canonicalUrl"], doc["contentHash"]])
+        for article_doc in inserted:
+            article_doc["_id"] = str(article_doc["_id"])
+            seen_fingerprints.update([article_doc["canonicalUrl"], article_doc["contentHash"]])
+            print(f"✅ Inserted {article_doc['title']} ({article_doc['url']}) with categories: {article_doc['categories']}", file=sys.stderr)
+
+        # Only remember the feed (and advance its mark) once all of its entries have been handled.
+        feed_cache.update(batch["download"], batch["parse_seconds"])
+        feed_state.mark(batch["download"].url, batch["window"])
+        return inserted
+
+    ingest = Pipeline("ingest", fetch(), [
+        Stage("normalize", normalize, workers=PARSE_WORKERS),
+        Stage("dedup", dedup, workers=DEDUP_WORKERS),
+        Stage("enrich", enrich, workers=ENRICH_WORKERS, on_error=release_claims),
+        Stage("infer", infer, batch_size=INFER_BATCH_FEEDS, batch_wait=INFER_BATCH_WAIT, on_error=release_claims),
+        Stage("persist", persist, workers=PERSIST_WORKERS, on_error=release_claims),
+    ], metrics=run_metrics, profiler=profiler)
+    with profiler.section() if profiler is not None else nullcontext():
+        articles = ingest.run()
+    feed_cache.save()
+    scheduler.save()
+    feed_state.save()
+    keyword_engine.save()
 
     # Log metrics
-    print(f"📝 Processed {total_articles} articles; extracted images for {images_extracted} articles; assigned categories for {categories_assigned} articles.", file=sys.stderr)
+    counters = ingest.counters
+    print(f"📝 Processed {counters['total_articles']} articles; extracted images for {counters['images_extracted']} articles; assigned categories for {counters['categories_assigned']} articles.", file=sys.stderr)
+    print(f"🧬 Skipped {counters['fingerprint_duplicates']} near-identical articles by fingerprint; avoided {counters['inference_calls_avoided']} inference calls.", file=sys.stderr)
+    print(scheduler.report(len(feeds), len(RSS_FEEDS)), file=sys.stderr)
+    print(story_clusters.report(counters["near_duplicates"]), file=sys.stderr)
+    print(f"🔖 High-water marks skipped {counters['entries_below_mark']} already-processed entries.", file=sys.stderr)
+    print(tier_stats.report(), file=sys.stderr)
+    cache_stats = feed_cache.stats()
+    print(f"💾 Feed cache: {cache_stats['not_modified']} not modified, {cache_stats['unchanged']} unchanged; saved {cache_stats['bytes_saved']} bytes and {cache_stats['parse_seconds_saved']:.2f}s of parsing.", file=sys.stderr)
+    ingest.log_metrics()
+    minutes = ingest.wall_seconds / 60
+    print(f"⏱️ Downloaded {len(downloads)} feeds; run took {ingest.wall_seconds:.2f}s ({len(articles) / minutes if minutes else 0:.1f} articles/min). Slowest feeds:", file=sys.stderr)
+    log_download_timings(downloads)
+
+    run_metrics.wall_seconds = ingest.wall_seconds
+    run_metrics.counters.update(ingest.counters)
+    run_metrics.log()
+    metrics_path = run_metrics.write()
+    if metrics_path:
+        print(f"📊 Metrics report written to {metrics_path}", file=sys.stderr)
+    if profiler is not None:
+        profiler.dump()
     return articles
 
+# -------------------- WARM WORKER -------------------- #
+def handle_worker_request(request):
+    """Run one fetch cycle inside the warm worker (see services/ingest_worker.py)."""
+    fetched = fetch_rss_articles(limit=int(request.get("limit", 20)), force=bool(request.get("force")))
+    return {"ok": True, "inserted": len(fetched)}
+
 # -------------------- MAIN PROCESS LOOP -------------------- #
 if __name__ == "__main__":
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="Fetch, summarize and store RSS articles.")
+    arg_parser.add_argument("--limit", type=int, default=20, help="entries per feed")
+    arg_parser.add_argument("--worker", action="store_true",
+                            help="stay running with models loaded and serve fetch requests from cron invocations")
+    arg_parser.add_argument("--all-feeds", action="store_true",
+                            help="poll every feed now, ignoring the adaptive schedule")
+    arg_parser.add_argument("--no-worker", action="store_true",
+                            help="always run in this process, even if a warm worker is listening")
+    args = arg_parser.parse_args()
+
     def serialize(obj):
         if isinstance(obj, ObjectId):
             return str(obj)
@@ -359,8 +687,23 @@ if __name__ == "__main__":
             return obj.astimezone(timezone.utc).isoformat()
         raise TypeError(f"Type not serializable: {type(obj)}")
 
+    if args.worker:
+        model_registry.preload("collection", "classifier", "summarizer")
+        start_pool()
+        serve(handle_worker_request)
+        sys.exit(0)
+
     try:
-        fetched = fetch_rss_articles(limit=20)
+        # Hand the cycle to a warm worker if one is running; otherwise cold-start here.
+        response = None if args.no_worker else submit({"cmd": "fetch", "limit": args.limit, "force": args.all_feeds})
+        if response is not None:
+            if not response.get("ok"):
+                print(f"❌ Warm worker could not run the fetch: {response.get('error')}", file=sys.stderr)
+                sys.exit(1)
+            print(f"🔥 Warm worker inserted {response.get('inserted', 0)} articles", file=sys.stderr)
+            sys.exit(0)
+
+        fetched = fetch_rss_articles(limit=args.limit, force=args.all_feeds)
         # Optionally, print JSON to stdout:
         # print(json.dumps(fetched, indent=2, default=serialize))
     except Exception as e:
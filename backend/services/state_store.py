@@ -0,0 +1,59 @@
+# File: backend/services/state_store.py
+
+import os
+import sys
+import json
+import tempfile
+from contextlib import contextmanager
+
+# -------------------- LOCAL STATE LOCATION -------------------- #
+# Small JSON files that let rss_fetcher remember things between cron runs.
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+STATE_DIR = os.getenv("RSS_STATE_DIR", os.path.join(backend_dir, "cache"))
+
+
+def state_path(filename):
+    """Absolute path for a state file inside STATE_DIR."""
+    return os.path.join(STATE_DIR, filename)
+
+
+def load_state(path, default=None):
+    """Load a JSON state file, returning `default` (or {}) if it is missing or unreadable."""
+    if default is None:
+        default = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Could not read state file {path}, starting fresh: {e}", file=sys.stderr)
+        return default
+
+
+@contextmanager
+def atomic_write(path, mode="w"):
+    """
+    Open a temp file next to `path` for writing ("w" text, "wb" bytes) and rename it over
+    `path` once the block succeeds, so readers never see a half-written file.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=os.path.splitext(path)[1])
+    try:
+        with os.fdopen(fd, mode, encoding=None if "b" in mode else "utf-8") as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def save_state(path, data):
+    """Atomically write a JSON state file."""
+    with atomic_write(path) as f:
+        json.dump(data, f, separators=(",", ":"))
@@ -32,9 +32,30 @@ function startPythonProcess() {
 }
 
 let pythonProcess = startPythonProcess();
-let pendingRequests = [];
+// v2 requests in flight, keyed by request id (any number may be outstanding at once)
+const pendingRequests = new Map();
+let nextRequestId = 1;
 let outputBuffer = "";
 
+const PROTOCOL_VERSION = 2;
+
+function settleResponse(parsedData) {
+  // v2 protocol: matched by request id (a bare array would be a legacy v1 reply we never asked for)
+  const request = parsedData && pendingRequests.get(parsedData.id);
+  if (!request) {
+    console.error("⚠️ No pendingRequests to match this response:", parsedData);
+    return;
+  }
+  pendingRequests.delete(parsedData.id);
+  clearTimeout(request.timeout);
+  if (parsedData.error) {
+    request.reject(parsedData.error);
+    return;
+  }
+  // Summaries come back in input order; map them back to plain strings for callers
+  request.resolve(parsedData.summaries.map((item) => item.summary));
+}
+
 // If you want to handle multiple JSON lines per data chunk:
 pythonProcess.stdout.on("data", (data) => {
   outputBuffer += data.toString();
@@ -49,41 +70,45 @@ pythonProcess.stdout.on("data", (data) => {
     if (!trimmedLine) continue; // skip empty lines
 
     try {
-      const parsedData = JSON.parse(trimmedLine);
-      // Resolve the oldest pending request
-      if (pendingRequests.length > 0) {
-        let request = pendingRequests.shift();
-        clearTimeout(request.timeout);
-        request.resolve(parsedData);
-      } else {
-        console.error("⚠️ No pendingRequests to match this response:", parsedData);
-      }
+      settleResponse(JSON.parse(trimmedLine));
     } catch (e) {
       console.error("❌ Error parsing summarization response:", e);
     }
   }
 });
 
-// Export a function to summarize a batch of articles
+// Export a function to summarize a batch of articles.
+// `articles` may be strings or objects with a `content` (and optional `id`) field.
+// Requests are pipelined: callers do not wait for each other, and the Python side
+// summarizes whatever is queued together.
 export function summarizeBatch(articles) {
   return new Promise((resolve, reject) => {
+    const id = String(nextRequestId++);
+
     // 20-second timeout
     const timeout = setTimeout(() => {
       console.error("❌ Summarization timeout");
+      pendingRequests.delete(id);
       reject("Summarization timeout.");
-      // Remove from pendingRequests if it's still there
-      pendingRequests = pendingRequests.filter((r) => r.resolve !== resolve);
     }, 20000);
 
-    // Add our request to the queue
-    pendingRequests.push({ resolve, reject, timeout });
+    pendingRequests.set(id, { resolve, reject, timeout });
 
-    // Write JSON array of articles to Python's stdin (each line is a separate request)
-    // If your Python script uses line-based reading, sending them on separate lines is good
-    pythonProcess.stdin.write(JSON.stringify(articles) + "\n", "utf-8", (err) => {
+    const message = {
+      v: PROTOCOL_VERSION,
+      id,
+      articles: articles.map((article, index) =>
+        typeof article === "string"
+          ? { id: index, content: article }
+          : { id: article.id ?? index, content: article.content ?? "" }
+      ),
+    };
+
+    // Each line is a separate request
+    pythonProcess.stdin.write(JSON.stringify(message) + "\n", "utf-8", (err) => {
       if (err) {
         console.error("❌ Error writing to Python process:", err);
       }
     });
   });
-}
\ No newline at end of file
+}
@@ -1,55 +1,95 @@
 import os
 import sys
 import json
-import torch
-import html
 import time
 import re
-import concurrent.futures
-from transformers import pipeline
-from collections import Counter
+import queue
+import threading
+
+# -------------------- QUICK FIX: TELL PYTHON WHERE TO FIND 'services' -------------------- #
+# Needed when this file is run directly as the summarization worker (see summarizer.js).
+script_dir = os.path.dirname(os.path.abspath(__file__))        # e.g. /.../backend/services/summarization
+backend_dir = os.path.dirname(os.path.dirname(script_dir))     # e.g. /.../backend
+if backend_dir not in sys.path:
+    sys.path.append(backend_dir)
+
+from services import model_registry
+from services.inference_pool import start_pool
+from services.inference_backend import backend_for, load_pipeline
+from services.html_extract import extract_html, TOKEN_RE
+from services.keywords import get_keyword_engine
+from services.summarization.summary_cache import SummaryCache, cache_key
 
 # -------------------- DEVICE SELECTION -------------------- #
-# Checks CUDA first, then MPS (Apple Silicon), else CPU
-if torch.cuda.is_available():
-    device = torch.device("cuda")
-elif torch.backends.mps.is_available():
-    device = torch.device("mps")
-else:
-    device = torch.device("cpu")
-    print("⚠️ No GPU found (CUDA/MPS); using CPU", file=sys.stderr)
+def select_device_index():
+    """
+    Checks CUDA first, then MPS (Apple Silicon), else CPU.
+    For Hugging Face pipelines: 0 for a GPU device, -1 for CPU.
+    """
+    import torch
 
-# For Hugging Face pipelines:
-# If device.type != 'cpu', we pass device=0; otherwise, -1 for CPU
-if device.type == "cpu":
-    device_index = -1
-else:
-    device_index = 0
+    if torch.cuda.is_available() or torch.backends.mps.is_available():
+        return 0
+    print("⚠️ No GPU found (CUDA/MPS); using CPU", file=sys.stderr)
+    return -1
 
 # -------------------- MODEL LOADING -------------------- #
-# Using facebook/bart-large-cnn. You can replace with a smaller model if needed.
-summarizer = pipeline(
-    "summarization",
-    model="facebook/bart-large-cnn",
-    device=device_index
-)
+# Using facebook/bart-large-cnn. You can replace with a smaller model if needed
+# (SUMMARIZER_MODEL also accepts a local checkpoint directory).
+SUMMARIZER_MODEL = os.getenv("SUMMARIZER_MODEL", "facebook/bart-large-cnn")
+# torch | int8 | onnx (see services/inference_backend.py); defaults to INFERENCE_BACKEND.
+SUMMARIZER_BACKEND = backend_for("SUMMARIZER_BACKEND")
+
+def _load_summarizer():
+    device = select_device_index() if SUMMARIZER_BACKEND == "torch" else -1
+    return load_pipeline("summarization", SUMMARIZER_MODEL, SUMMARIZER_BACKEND, device=device)
+
+# The pipeline is built on first use (see services/model_registry.py), not at import.
+model_registry.register("summarizer", _load_summarizer)
+
+def get_summarizer():
+    return model_registry.get("summarizer")
+
+# Articles per forward pass in summarize_batch; inputs are length-bucketed before batching.
+SUMMARY_BATCH_SIZE = int(os.getenv("SUMMARY_BATCH_SIZE", "8"))
+# Hard cap on a single generate() call: generation stops at this point (max_time) and the
+# partial summary is kept, instead of timing the call afterwards and discarding it.
+SUMMARY_DEADLINE_SECONDS = float(os.getenv("SUMMARY_DEADLINE_SECONDS", "9"))
+# Latency budget for one line-protocol request, counted from when it was read (so time spent
+# queued behind another call is included), kept well under summarizer.js's 20s timeout.
+SUMMARY_REQUEST_BUDGET_SECONDS = float(os.getenv("SUMMARY_REQUEST_BUDGET_SECONDS", "12"))
+# Texts below this many words are summarized extractively (their lead sentences); the
+# 150-char output would not be shorter than the text itself anyway.
+EXTRACTIVE_MAX_WORDS = int(os.getenv("SUMMARY_EXTRACTIVE_MAX_WORDS", "30"))
+# Articles queued behind the current call (queue depth) at which generation degrades: fewer
+# beams, then greedy decoding with shorter outputs and a higher extractive cut-off. The call's
+# own articles do not count, so one large NewsAPI batch on an idle process keeps full quality.
+LOAD_MEDIUM = int(os.getenv("SUMMARY_LOAD_MEDIUM", "16"))
+LOAD_HIGH = int(os.getenv("SUMMARY_LOAD_HIGH", "48"))
+# Below this much remaining budget a bucket is not worth starting; it falls back to extractive.
+MIN_GENERATION_SECONDS = 0.25
+
+# Content-addressed cache of summaries (memory LRU + SQLite, see summary_cache.py)
+summary_cache = SummaryCache()
 
 # -------------------- KEYWORD EXTRACTION (Optional) -------------------- #
-def extract_keywords(text, num_keywords=5):
+def extract_keywords(text, num_keywords=5, tokens=None):
     """
-    Extracts keywords from text using a simple word frequency analysis.
-    Returns the top `num_keywords` words with length >= 4.
+    Extracts keywords from text by TF-IDF against the document frequencies of every
+    ingested article (see services/keywords.py), skipping stopwords.
+    Returns the top `num_keywords` words. Does not add `text` to the corpus counts.
+    `tokens` takes the text's word tokens when html_extract has already produced them.
+    Not cached: scores move as the corpus grows.
     """
-    words = re.findall(r'\b[a-zA-Z]{4,}\b', text.lower())
-    word_counts = Counter(words)
-    return [word for word, _ in word_counts.most_common(num_keywords)]
+    if tokens is None:
+        tokens = TOKEN_RE.findall(text.lower())
+    return get_keyword_engine().score_batch([tokens], num_keywords)[0]
 
 # -------------------- TEXT CLEANING & TRIMMING -------------------- #
 def clean_text(text):
     """Decodes HTML entities and removes basic HTML tags, etc."""
-    text = html.unescape(text)
-    # Remove any remaining HTML tags
-    text = re.sub(r"<[^>]*>", "", text)
+    # Same single-pass parser the ingest path uses (entities, tags, whitespace)
+    text = extract_html(text).text
     # Convert special ellipses
     text = text.replace("…", "...")
     return text.strip()
@@ -72,20 +112,21 @@ def trim_to_sentence_boundary(text, max_chars=150):
         return trimmed_text.rsplit(" ", 1)[0] + "..."
 
 # -------------------- SUMMARIZATION LOGIC -------------------- #
-def summarize_text(text):
+def prepare_summary_input(text):
     """
-    Summarize text with dynamic settings.
-    Times execution to handle slow cases; if it takes too long, we return a trimmed snippet.
+    Apply the dynamic length rules to one input.
+    Returns (text, min_length, max_length) ready for generation, or (result, None, None)
+    when no model call is needed (invalid input or text too short to summarize).
     """
     if not isinstance(text, str):
         print(f"❌ Invalid Input Type: Expected string, got {type(text)}", file=sys.stderr)
-        return "Error: Invalid input type"
+        return "Error: Invalid input type", None, None
 
     input_length = len(text.split())
 
     # If it's extremely short, just return as-is
     if input_length < 10:
-        return text
+        return text, None, None
 
     # If moderately short (< 50 words), keep min/max smaller
     if input_length < 50:
@@ -105,71 +146,371 @@ def summarize_text(text):
     # Hard-trim overly long inputs to 120 words to avoid memory/latency issues
     if input_length > 120:
         text = " ".join(text.split()[:120])
-        input_length = 120
+
+    return text, min_length, max_length
+
+def extractive_summary(text):
+    """Lead sentences of the text itself, cut like every other summary."""
+    return trim_to_sentence_boundary(clean_text(text))
+
+def generation_settings(word_count, queue_depth, default_beams):
+    """
+    Pick (num_beams, max_length cap, extractive cut-off) from input length and load.
+    Idle: the model's own beam count. Busy: at most 2 beams, greedy for long inputs.
+    Overloaded: greedy, outputs capped at 60 tokens and more texts summarized extractively.
+    """
+    if queue_depth >= LOAD_HIGH:
+        return 1, 60, EXTRACTIVE_MAX_WORDS * 2
+    if queue_depth >= LOAD_MEDIUM:
+        return (1 if word_count >= 100 else min(2, default_beams)), None, EXTRACTIVE_MAX_WORDS
+    return default_beams, None, EXTRACTIVE_MAX_WORDS
+
+def summary_cache_key(text, min_length, max_length):
+    """Cache key for a prepared input: text + model (and backend) + generation parameters."""
+    # Quantized/ONNX output can differ slightly from fp32, so it is cached separately.
+    model = SUMMARIZER_MODEL if SUMMARIZER_BACKEND == "torch" else f"{SUMMARIZER_MODEL}@{SUMMARIZER_BACKEND}"
+    return cache_key("summary", text, model, {"min_length": min_length, "max_length": max_length})
+
+def summarize_text(text):
+    """
+    Summarize text with dynamic settings.
+    Generation is stopped at SUMMARY_DEADLINE_SECONDS and the partial summary returned;
+    short texts are summarized extractively without the model.
+    Results are cached by content, so repeated texts skip generation entirely.
+    """
+    text, min_length, max_length = prepare_summary_input(text)
+    if max_length is None:
+        return text
+    if len(text.split()) < EXTRACTIVE_MAX_WORDS:
+        return extractive_summary(text)
+
+    key = summary_cache_key(text, min_length, max_length)
+    cached = summary_cache.get(key)
+    if cached is not None:
+        return cached
 
     # Attempt summarization
     start_time = time.time()
     try:
-        summary = summarizer(text, max_length=max_length, min_length=min_length, do_sample=False)
+        summary = get_summarizer()(text, max_length=max_length, min_length=min_length, do_sample=False,
+                                   max_time=SUMMARY_DEADLINE_SECONDS)
     except Exception as e:
         print(f"❌ Summarization Error: {e}", file=sys.stderr)
         return "Error summarizing text"
 
+    cleaned_summary = clean_text(summary[0]["summary_text"])
+    result = trim_to_sentence_boundary(cleaned_summary)
     elapsed_time = time.time() - start_time
-    # Post-check: If it took too long, fallback to safe truncation
-    if elapsed_time > 9:
-        print(f"⚠️ Summarization took too long ({elapsed_time:.2f}s), returning trimmed snippet", file=sys.stderr)
-        return trim_to_sentence_boundary(text[:150])
+    if elapsed_time >= SUMMARY_DEADLINE_SECONDS:
+        # Stopped early: usable, but not the full summary, so not cached.
+        print(f"⚠️ Summarization hit the {SUMMARY_DEADLINE_SECONDS:.0f}s deadline, returning the partial summary", file=sys.stderr)
+        return result
+    summary_cache.put(key, result)
+    return result
 
-    cleaned_summary = clean_text(summary[0]["summary_text"])
-    return trim_to_sentence_boundary(cleaned_summary)
+class PerSequenceLengthLogitsProcessor:
+    """
+    Enforces a separate min/max length for every sequence in a padded batch, so batched
+    generation keeps the per-text rules from prepare_summary_input. Rows are laid out as
+    batch_size * num_beams, which is how generate() expands beams.
+    """
+
+    def __init__(self, min_lengths, max_lengths, num_beams, eos_token_id):
+        import torch
+
+        self.min_lengths = torch.tensor(min_lengths).repeat_interleave(num_beams)
+        self.max_lengths = torch.tensor(max_lengths).repeat_interleave(num_beams)
+        self.eos_token_id = eos_token_id
+
+    def __call__(self, input_ids, scores):
+        cur_len = input_ids.shape[-1]
+        min_lengths = self.min_lengths.to(scores.device)
+        max_lengths = self.max_lengths.to(scores.device)
+
+        # Too short: EOS is not allowed yet.
+        too_short = cur_len < min_lengths
+        scores[too_short, self.eos_token_id] = -float("inf")
+
+        # Reached its own max_length: EOS is the only allowed token.
+        at_limit = cur_len >= max_lengths - 1
+        if at_limit.any():
+            scores[at_limit] = -float("inf")
+            scores[at_limit, self.eos_token_id] = 0
+        return scores
+
+def _summarize_padded_batch(texts, min_lengths, max_lengths, num_beams=None, max_time=None):
+    """
+    Run one padded forward/generate pass over `texts` and return the raw decoded summaries.
+    `num_beams` overrides the model's beam count; `max_time` stops generation early.
+    """
+    import torch
+    from transformers import LogitsProcessorList
+
+    summarizer = get_summarizer()
+    model = summarizer.model
+    tokenizer = summarizer.tokenizer
+    num_beams = num_beams or model.generation_config.num_beams or 1
+
+    inputs = tokenizer(texts, padding=True, truncation=True, return_tensors="pt").to(model.device)
+    length_processor = PerSequenceLengthLogitsProcessor(
+        min_lengths, max_lengths, num_beams, tokenizer.eos_token_id
+    )
+    with torch.no_grad():
+        output_ids = model.generate(
+            **inputs,
+            min_length=min(min_lengths),
+            max_length=max(max_lengths),
+            num_beams=num_beams,
+            do_sample=False,
+            max_time=max_time,
+            logits_processor=LogitsProcessorList([length_processor]),
+        )
+    return tokenizer.batch_decode(output_ids, skip_special_tokens=True, clean_up_tokenization_spaces=False)
+
+def default_beams():
+    """The loaded model's own beam count (4 for bart-large-cnn)."""
+    return get_summarizer().model.generation_config.num_beams or 1
+
+def summarize_batch(texts, batch_size=SUMMARY_BATCH_SIZE, queue_depth=0, deadline=None):
+    """
+    Summarize many texts with one generate() call per batch instead of one per text.
+    Inputs are sorted by length and grouped into buckets of `batch_size` so padding stays
+    small; each text keeps its own min/max length and the same post-processing as
+    summarize_text. Returns summaries in input order.
+
+    Latency budget: `queue_depth` (articles queued behind this call by a latency-bound caller; 0 for
+    batch ingest) picks beams and output caps via generation_settings; `deadline` (a time.time() value) bounds the whole
+    call. Every generate() is stopped at the remaining budget (and never runs longer than
+    SUMMARY_DEADLINE_SECONDS); buckets with no budget left are summarized extractively.
+    Only full-quality, complete summaries are cached.
+    """
+    results = [None] * len(texts)
+    pending = []
+    beams = None
+    for i, text in enumerate(texts):
+        prepared, min_length, max_length = prepare_summary_input(text)
+        if max_length is None:
+            results[i] = prepared
+            continue
+        cached = summary_cache.get(summary_cache_key(prepared, min_length, max_length))
+        if cached is not None:
+            results[i] = cached
+            continue
+        if beams is None:
+            beams = default_beams()
+        word_count = len(prepared.split())
+        num_beams, length_cap, extractive_words = generation_settings(word_count, queue_depth, beams)
+        if word_count < extractive_words:
+            results[i] = extractive_summary(prepared)
+        else:
+            pending.append((i, prepared, min_length, max_length, text, num_beams, length_cap))
+
+    # Length buckets: neighbours in word count share a batch; a batch never mixes beam counts.
+    pending.sort(key=lambda item: (item[5], len(item[1].split())))
+    buckets = []
+    for num_beams in sorted({item[5] for item in pending}):
+        group = [item for item in pending if item[5] == num_beams]
+        buckets.extend(group[start:start + batch_size] for start in range(0, len(group), max(1, batch_size)))
+    for bucket in buckets:
+        indices = [item[0] for item in bucket]
+        original_texts = [item[4] for item in bucket]
+        num_beams = bucket[0][5]
+        length_cap = bucket[0][6]
+        max_lengths = [min(item[3], length_cap) if length_cap else item[3] for item in bucket]
+        min_lengths = [min(item[2], length - 5) for item, length in zip(bucket, max_lengths)]
+
+        max_time = SUMMARY_DEADLINE_SECONDS
+        if deadline is not None:
+            max_time = min(max_time, deadline - time.time())
+        if max_time < MIN_GENERATION_SECONDS:
+            for i, text in zip(indices, (item[1] for item in bucket)):
+                results[i] = extractive_summary(text)
+            continue
+
+        start_time = time.time()
+        try:
+            summaries = _summarize_padded_batch(
+                [item[1] for item in bucket], min_lengths, max_lengths, num_beams=num_beams, max_time=max_time
+            )
+        except Exception as e:
+            print(f"❌ Batch Summarization Error ({len(bucket)} texts), retrying one by one: {e}", file=sys.stderr)
+            for i, text in zip(indices, original_texts):
+                results[i] = summarize_text(text)
+            continue
+
+        stopped_early = time.time() - start_time >= max_time
+        if stopped_early:
+            print(f"⚠️ Batch summarization hit its {max_time:.1f}s budget ({len(bucket)} texts), keeping partial summaries", file=sys.stderr)
+        full_quality = not stopped_early and num_beams >= beams and not length_cap
+        for item, summary in zip(bucket, summaries):
+            i, text, min_length, max_length = item[:4]
+            results[i] = trim_to_sentence_boundary(clean_text(summary))
+            if full_quality:
+                summary_cache.put(summary_cache_key(text, min_length, max_length), results[i])
+    return results
+
+# -------------------- LINE PROTOCOL -------------------- #
+# Each stdin line is one request, each stdout line one response.
+#
+#   v1 (legacy): [{"content": "..."}, ...]  ->  ["summary", ...]
+#   v2:          {"v": 2, "id": "r1", "articles": [{"id": "a1", "content": "..."}, ...]}
+#            ->  {"v": 2, "id": "r1", "summaries": [{"id": "a1", "summary": "..."}, ...]}
+#
+#   stats:       {"v": 2, "id": "r2", "cmd": "stats"}  ->  {"v": 2, "id": "r2", "stats": {...}}
+#
+# Summaries are always in input order. v2 requests carry their own id, so callers may keep
+# many requests in flight; responses are still written in arrival order, which keeps v1
+# callers (matched by FIFO position) working. Articles may also be plain strings.
+PROTOCOL_VERSION = 2
+# Upper bound on articles from queued requests that are coalesced into one summarize_batch call.
+MAX_COALESCED_ARTICLES = int(os.getenv("SUMMARY_MAX_COALESCED_ARTICLES", "64"))
+
+def _article_content(article):
+    if isinstance(article, dict):
+        return article.get("content", "")
+    return article
+
+def parse_request(line):
+    """
+    Turn one protocol line into a request dict:
+    {"version", "id", "article_ids", "contents"} or {"version", "id", "error"}.
+    Returns None for lines that cannot be answered (invalid JSON).
+    """
+    try:
+        message = json.loads(line)
+    except json.JSONDecodeError as e:
+        print(f"❌ JSON Decode Error: {e}", file=sys.stderr)
+        return None
+
+    if isinstance(message, list):
+        articles = [article for article in message if isinstance(article, (dict, str))]
+        return {
+            "version": 1,
+            "id": None,
+            "article_ids": list(range(len(articles))),
+            "contents": [_article_content(article) for article in articles],
+        }
+
+    if not isinstance(message, dict):
+        print(f"❌ Unsupported request type: {type(message)}", file=sys.stderr)
+        return None
+    request_id = message.get("id")
+    if message.get("v") == PROTOCOL_VERSION and message.get("cmd") == "stats":
+        return {"version": PROTOCOL_VERSION, "id": request_id, "command": "stats"}
+    if message.get("v") != PROTOCOL_VERSION or not isinstance(message.get("articles"), list):
+        return {"version": PROTOCOL_VERSION, "id": request_id, "error": "Unsupported request"}
+
+    article_ids, contents = [], []
+    for index, article in enumerate(message["articles"]):
+        article_ids.append(article.get("id", index) if isinstance(article, dict) else index)
+        contents.append(_article_content(article))
+    return {"version": PROTOCOL_VERSION, "id": request_id, "article_ids": article_ids, "contents": contents}
+
+def format_response(request, summaries):
+    if request["version"] == 1:
+        return json.dumps(summaries)
+    if "error" in request:
+        return json.dumps({"v": PROTOCOL_VERSION, "id": request["id"], "error": request["error"]})
+    if request.get("command") == "stats":
+        return json.dumps({"v": PROTOCOL_VERSION, "id": request["id"], "stats": summary_cache.stats()})
+    return json.dumps({
+        "v": PROTOCOL_VERSION,
+        "id": request["id"],
+        "summaries": [
+            {"id": article_id, "summary": summary}
+            for article_id, summary in zip(request["article_ids"], summaries)
+        ],
+    })
+
+def _read_requests(requests):
+    """Reader thread: parse stdin lines into `requests` so callers can pipeline writes."""
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            print("⚠️ Empty request received!", file=sys.stderr)
+            continue
+        request = parse_request(line)
+        if request is not None:
+            request["received_at"] = time.time()
+            requests.put(request)
+    requests.put(None)  # stdin closed
+
+def _next_requests(requests):
+    """Block for one request, then coalesce whatever else is already queued (bounded)."""
+    first = requests.get()
+    if first is None:
+        return None
+    batch = [first]
+    articles = len(first.get("contents", []))
+    while articles < MAX_COALESCED_ARTICLES:
+        try:
+            request = requests.get_nowait()
+        except queue.Empty:
+            break
+        if request is None:
+            requests.put(None)
+            break
+        batch.append(request)
+        articles += len(request.get("contents", []))
+    return batch
+
+def _queued_articles(requests):
+    """Articles in requests still waiting in the queue."""
+    with requests.mutex:
+        return sum(len(request.get("contents", [])) for request in requests.queue if request is not None)
+
+def _call_budget(batch, requests):
+    """
+    (queue_depth, deadline) for one coalesced call: the load is the articles still queued
+    behind it, and the call must finish within the budget of its oldest request, measured
+    from when that request arrived.
+    """
+    deadline = min(request["received_at"] for request in batch) + SUMMARY_REQUEST_BUDGET_SECONDS
+    return _queued_articles(requests), deadline
 
 # -------------------- MAIN PROCESS LOOP -------------------- #
 def process_input():
     """
-    Continuously read lines (JSON arrays) from stdin.
-    For each array, extract 'content' fields and summarize them.
+    Read protocol lines (see LINE PROTOCOL) from stdin and write one response line per request.
+    Requests that queue up while the model is busy are summarized together in one
+    summarize_batch call, then answered individually in arrival order.
     """
+    # This is a long-lived worker: load the model up front so the first request is not
+    # charged for it (summarizer.js times requests out after 20s).
+    model_registry.preload("summarizer")
+    # With INFERENCE_WORKERS > 1, fork the workers now: after the model is loaded (so they
+    # share its weights) and before the reader thread starts.
+    pool = start_pool(models=("summarizer",))
+    summarize = pool.summarize_batch if pool is not None else summarize_batch
     print("✅ Python Summarization Process Started", file=sys.stderr)
     sys.stdout.flush()
 
+    requests = queue.Queue()
+    reader = threading.Thread(target=_read_requests, args=(requests,), daemon=True)
+    reader.start()
+
     try:
         while True:
-            line = sys.stdin.readline().strip()
-            if not line:
-                print("⚠️ Empty request received!", file=sys.stderr)
-                continue
-
-            try:
-                articles = json.loads(line)
-            except json.JSONDecodeError as e:
-                print(f"❌ JSON Decode Error: {e}", file=sys.stderr)
-                continue
-
-            # Extract text content safely
-            contents = [article.get("content", "") for article in articles if isinstance(article, dict)]
-            if not contents:
-                response = json.dumps([])
-                sys.stdout.write(response + "\n")
-                sys.stdout.flush()
-                continue
-
-            # Concurrency: use max_workers=2
-            summaries = []
-            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-                future_to_text = {
-                    executor.submit(summarize_text, text): text for text in contents
-                }
-                for future in concurrent.futures.as_completed(future_to_text):
-                    summaries.append(future.result())
-
-            # Return the summaries as JSON
-            response = json.dumps(summaries)
-            sys.stdout.write(response + "\n")
+            batch = _next_requests(requests)
+            if batch is None:
+                print("Python summarizer: stdin closed, shutting down.", file=sys.stderr)
+                print(f"📊 Summary cache: {json.dumps(summary_cache.stats())}", file=sys.stderr)
+                break
+
+            # Summarize every article of every coalesced request in one batched pass
+            contents = [text for request in batch for text in request.get("contents", [])]
+            queue_depth, deadline = _call_budget(batch, requests)
+            summaries = summarize(contents, queue_depth=queue_depth, deadline=deadline) if contents else []
+
+            offset = 0
+            for request in batch:
+                count = len(request.get("contents", []))
+                sys.stdout.write(format_response(request, summaries[offset:offset + count]) + "\n")
+                offset += count
             sys.stdout.flush()
     except KeyboardInterrupt:
         print("Python summarizer: KeyboardInterrupt received, shutting down gracefully.", file=sys.stderr)
         sys.exit(0)
 
 if __name__ == "__main__":
-    process_input()
\ No newline at end of file
+    process_input()
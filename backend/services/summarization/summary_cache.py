@@ -0,0 +1,142 @@
+# File: backend/services/summarization/summary_cache.py
+
+import os
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+
+from services.state_store import state_path
+
+# In-memory LRU size, on-disk entry cap, and the SQLite file ("" keeps the cache in memory only).
+SUMMARY_CACHE_SIZE = int(os.getenv("SUMMARY_CACHE_SIZE", "10000"))
+SUMMARY_CACHE_DISK_ENTRIES = int(os.getenv("SUMMARY_CACHE_DISK_ENTRIES", "200000"))
+SUMMARY_CACHE_PATH = os.getenv("SUMMARY_CACHE_PATH", state_path("summary_cache.sqlite3"))
+
+# How often (in writes) the disk tier is checked against SUMMARY_CACHE_DISK_ENTRIES.
+PRUNE_EVERY = 1000
+
+
+def cache_key(kind, text, model, params):
+    """Content address for one result: hash of what was computed, on what, with which settings."""
+    payload = json.dumps([kind, model, params, text], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SummaryCache:
+    """
+    Two-tier cache for summarizer results.
+    Tier 1 is a bounded in-memory LRU; tier 2 is a SQLite table that survives restarts.
+    Disk hits are promoted into memory. Values must be JSON-serializable.
+    """
+
+    def __init__(self, path=SUMMARY_CACHE_PATH, max_entries=SUMMARY_CACHE_SIZE,
+                 max_disk_entries=SUMMARY_CACHE_DISK_ENTRIES):
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+
+        self._db = None
+        if path:
+            try:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                self._db = sqlite3.connect(path, check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute("PRAGMA synchronous=NORMAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS cache ("
+                    " key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used REAL NOT NULL)"
+                )
+                self._db.execute("CREATE INDEX IF NOT EXISTS cache_last_used ON cache (last_used)")
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"⚠️ Summary cache disk tier disabled ({path}): {e}", file=sys.stderr)
+                self._db = None
+
+    def get(self, key):
+        """Return the cached value or None."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return self._memory[key]
+
+            if self._db is not None:
+                try:
+                    row = self._db.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+                    if row is not None:
+                        self._db.execute("UPDATE cache SET last_used = ? WHERE key = ?", (time.time(), key))
+                        self._db.commit()
+                        value = json.loads(row[0])
+                        self._remember(key, value)
+                        self.disk_hits += 1
+                        return value
+                except sqlite3.Error as e:
+                    print(f"⚠️ Summary cache read failed: {e}", file=sys.stderr)
+
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            self._remember(key, value)
+            if self._db is None:
+                return
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, last_used) VALUES (?, ?, ?)",
+                    (key, json.dumps(value, ensure_ascii=False), time.time()),
+                )
+                self._db.commit()
+                self._writes += 1
+                if self._writes % PRUNE_EVERY == 0:
+                    self._prune_disk()
+            except sqlite3.Error as e:
+                print(f"⚠️ Summary cache write failed: {e}", file=sys.stderr)
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _prune_disk(self):
+        """Drop the least recently used rows beyond max_disk_entries."""
+        (count,) = self._db.execute("SELECT COUNT(*) FROM cache").fetchone()
+        excess = count - self.max_disk_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+            self._db.commit()
+            self.disk_evictions += excess
+
+    def stats(self):
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        hits = self.memory_hits + self.disk_hits
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "disk_evictions": self.disk_evictions,
+            "memory_entries": len(self._memory),
+        }
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -0,0 +1,86 @@
+# File: backend/services/zero_shot.py
+
+import os
+
+# Premise/hypothesis pairs scored per forward pass (10 labels => 4 articles per pass by default).
+CLASSIFY_BATCH_SIZE = int(os.getenv("CLASSIFY_BATCH_SIZE", "40"))
+
+# Same template the transformers zero-shot pipeline uses by default.
+HYPOTHESIS_TEMPLATE = "This example is {}."
+
+# Tokenized hypotheses per (tokenizer, labels, template); built once per process.
+_hypothesis_cache = {}
+
+
+def _hypothesis_ids(tokenizer, labels, template):
+    key = (id(tokenizer), tuple(labels), template)
+    if key not in _hypothesis_cache:
+        _hypothesis_cache[key] = [
+            tokenizer(template.format(label), add_special_tokens=False)["input_ids"] for label in labels
+        ]
+    return _hypothesis_cache[key]
+
+
+def _entailment_ids(model):
+    """(contradiction_id, entailment_id) exactly as the zero-shot pipeline picks them for multi_label."""
+    entailment_id = -1
+    for label, index in model.config.label2id.items():
+        if label.lower().startswith("entail"):
+            entailment_id = index
+            break
+    contradiction_id = -1 if entailment_id == 0 else 0
+    return contradiction_id, entailment_id
+
+
+def classify_batch(classifier, texts, labels, hypothesis_template=HYPOTHESIS_TEMPLATE,
+                   batch_size=CLASSIFY_BATCH_SIZE):
+    """
+    Multi-label zero-shot scores for many texts at once, using the model and tokenizer of a
+    transformers zero-shot `classifier` pipeline.
+
+    Every text x label pair becomes one NLI input; pairs are sorted by length and scored
+    in padded batches of `batch_size`. Label hypotheses are tokenized once and reused.
+    Returns one {label: score} dict per text, ordered by descending score - the same
+    shape and values as calling the pipeline with multi_label=True.
+    """
+    import torch
+
+    if not texts:
+        return []
+    model = classifier.model
+    tokenizer = classifier.tokenizer
+    hypotheses = _hypothesis_ids(tokenizer, labels, hypothesis_template)
+    contradiction_id, entailment_id = _entailment_ids(model)
+    max_length = tokenizer.model_max_length if tokenizer.model_max_length < 100000 else 1024
+
+    premises = [tokenizer(text, add_special_tokens=False)["input_ids"] for text in texts]
+    pairs = [
+        (text_index, label_index)
+        for text_index in range(len(texts))
+        for label_index in range(len(labels))
+    ]
+    pairs.sort(key=lambda pair: len(premises[pair[0]]) + len(hypotheses[pair[1]]))
+
+    entail_scores = torch.empty(len(texts), len(labels))
+    for start in range(0, len(pairs), max(1, batch_size)):
+        chunk = pairs[start:start + batch_size]
+        encoded = [
+            tokenizer.prepare_for_model(
+                premises[text_index], hypotheses[label_index],
+                truncation="only_first", max_length=max_length,
+            )
+            for text_index, label_index in chunk
+        ]
+        inputs = tokenizer.pad(encoded, padding=True, return_tensors="pt").to(model.device)
+        with torch.no_grad():
+            logits = model(**inputs).logits
+        # Multi-label: softmax over (contradiction, entailment) for each pair independently.
+        probs = logits[:, [contradiction_id, entailment_id]].softmax(dim=-1)[:, 1].float().cpu()
+        for (text_index, label_index), prob in zip(chunk, probs.tolist()):
+            entail_scores[text_index, label_index] = prob
+
+    results = []
+    for row in entail_scores.tolist():
+        ranked = sorted(zip(labels, row), key=lambda item: item[1], reverse=True)
+        results.append(dict(ranked))
+    return results
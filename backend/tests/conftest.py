@@ -0,0 +1,9 @@
+# File: backend/tests/conftest.py
+
+import os
+import sys
+
+# Make 'services' importable, as the benchmarks do.
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.append(backend_dir)
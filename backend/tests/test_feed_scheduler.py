@@ -0,0 +1,39 @@
+# File: backend/tests/test_feed_scheduler.py
+
+from services.feed_scheduler import FeedScheduler, MIN_POLL_INTERVAL
+
+TICK = 300.0
+URL = "http://example.com/feed.xml"
+FEEDS = {"example": URL}
+
+
+def busy_feed(now):
+    """Publish times of a feed that posts far faster than MIN_POLL_INTERVAL allows."""
+    return [now - 10 * i for i in range(20)]
+
+
+def test_min_interval_feed_is_due_on_the_next_tick():
+    assert MIN_POLL_INTERVAL == TICK
+    clock = [2.0]  # the fetcher starts a moment after the tick
+    scheduler = FeedScheduler(path=None, clock=lambda: clock[0])
+    assert scheduler.due_feeds(FEEDS) == FEEDS
+
+    clock[0] += 25.0  # download + parse
+    scheduler.record_success(URL, busy_feed(clock[0]), new_entries=20)
+    assert scheduler.feeds[URL]["interval"] == MIN_POLL_INTERVAL
+
+    clock[0] = TICK + 1.0  # next tick, started a little earlier than this run
+    assert scheduler.due_feeds(FEEDS) == FEEDS
+
+
+def test_failure_backoff_counts_from_the_tick():
+    clock = [2.0]
+    scheduler = FeedScheduler(path=None, clock=lambda: clock[0])
+    scheduler.due_feeds(FEEDS)
+    clock[0] += 40.0
+    scheduler.record_failure(URL, "timeout")
+
+    clock[0] = TICK + 2.0
+    assert scheduler.due_feeds(FEEDS) == {}
+    clock[0] = 2 * TICK + 2.0
+    assert scheduler.due_feeds(FEEDS) == FEEDS
@@ -0,0 +1,43 @@
+# File: backend/tests/test_near_duplicates.py
+
+from services.near_duplicates import StoryClusters, story_signature, story_lead, similarity
+
+BOILERPLATE = ("Sign up for our morning newsletter to get the day's top stories delivered to your inbox. "
+               "Follow us on social media for live updates, and download our app for breaking news alerts "
+               "and exclusive coverage from our reporters around the world.")
+
+
+def assign(clusters, title, summary):
+    return clusters.assign(story_signature(title, summary), lead=story_lead(title, summary))
+
+
+def test_shared_boilerplate_does_not_share_a_summary():
+    first = ("Council approves new cycle lanes downtown",
+             "The city council voted to add protected cycle lanes on three downtown streets next spring. " + BOILERPLATE)
+    second = ("Storm closes schools across the county",
+              "Heavy snow forced every school in the county to close on Monday as roads iced over. " + BOILERPLATE)
+    for threshold in (None, 0.4):
+        clusters = StoryClusters() if threshold is None else StoryClusters(threshold=threshold)
+        representative, _ = assign(clusters, *first)
+        representative.summary = "Cycle lanes are coming to downtown."
+        cluster, is_duplicate = assign(clusters, *second)
+        assert not is_duplicate
+        assert cluster is not representative
+        assert cluster.summary is None  # summarized on its own, not given the cycle-lane summary
+
+
+def test_loose_threshold_alone_would_merge_them():
+    # The failure mode the lead check guards against: boilerplate dominates the shingles.
+    first = story_signature("Council approves new cycle lanes downtown", "Cycle lanes approved. " + BOILERPLATE)
+    second = story_signature("Storm closes schools across the county", "Schools closed by snow. " + BOILERPLATE)
+    assert similarity(first, second) >= 0.4
+
+
+def test_republished_wire_copy_reuses_the_summary():
+    body = ("The central bank kept interest rates unchanged on Thursday, citing slowing inflation and "
+            "weaker hiring, and signalled that cuts could come later in the year if prices keep easing.")
+    clusters = StoryClusters()
+    representative, _ = assign(clusters, "Central bank holds rates steady", body)
+    cluster, is_duplicate = assign(clusters, "UPDATE 1-Central bank holds rates steady - Reuters", body)
+    assert is_duplicate
+    assert cluster is representative
@@ -0,0 +1,41 @@
+# File: backend/tests/test_summarizer_load.py
+
+import time
+import queue
+
+from services.summarization.summarizer import (_next_requests, _call_budget, generation_settings,
+                                               EXTRACTIVE_MAX_WORDS, LOAD_HIGH, SUMMARY_REQUEST_BUDGET_SECONDS)
+
+BEAMS = 4
+
+
+def request(articles, received_at=None):
+    return {"version": 2, "id": str(articles), "article_ids": list(range(articles)),
+            "contents": [f"article {i}" for i in range(articles)],
+            "received_at": time.time() if received_at is None else received_at}
+
+
+def test_large_request_on_an_idle_process_keeps_full_quality():
+    requests = queue.Queue()
+    requests.put(request(50, received_at=100.0))
+
+    batch = _next_requests(requests)
+    queue_depth, deadline = _call_budget(batch, requests)
+
+    assert queue_depth == 0
+    assert deadline == 100.0 + SUMMARY_REQUEST_BUDGET_SECONDS
+    for word_count in (40, 120, 400):
+        assert generation_settings(word_count, queue_depth, BEAMS) == (BEAMS, None, EXTRACTIVE_MAX_WORDS)
+
+
+def test_articles_queued_behind_the_call_degrade_it():
+    requests = queue.Queue()
+    requests.put(request(50))
+    batch = _next_requests(requests)
+    for _ in range(LOAD_HIGH // 10 + 1):
+        requests.put(request(10))
+
+    queue_depth, _ = _call_budget(batch, requests)
+
+    assert queue_depth >= LOAD_HIGH
+    assert generation_settings(120, queue_depth, BEAMS) == (1, 60, EXTRACTIVE_MAX_WORDS * 2)